@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+raw → proceed 変換処理（型変換・カラム名変換・金額単位変換・ゼロ日付変換）のベンチマーク
+
+従来方式（各段階で df.copy() し、STRING 列は fillna → astype(str) → replace の3回走査、
+ゼロ日付はパターンごとに astype(str).str.strip() を実行）と ConversionPlan.apply を比較し、
+処理時間・tracemalloc のピークメモリ・出力の一致を表示する。
+
+入力は config/columns の型に合わせて生成した合成データ（欠損値・ゼロ日付・金額単位変換の対象行を含む）。
+金額単位・ゼロ日付の設定はリポジトリの config/mapping を使う。
+
+使い方:
+  python dev_tools/testing/benchmark_conversion_plan.py --rows 100000
+  python dev_tools/testing/benchmark_conversion_plan.py --rows 20000 --tables ledger_income profit_plan_term
+"""
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, os.path.join(REPO_ROOT, "raw_to_proceed_service"))
+
+import main as r2p  # noqa: E402
+
+DEFAULT_TABLES = ["ledger_income", "ledger_loss", "profit_plan_term", "construction_progress_days_amount"]
+
+
+# ------------------------------------------------------------
+# 従来方式（比較用）
+# ------------------------------------------------------------
+def legacy_transform(df, table_name, column_mapping, monetary_config, zero_date_config):
+    df = df.copy()
+    for col in df.columns:
+        if col not in column_mapping:
+            continue
+        data_type = column_mapping[col]['type']
+        if data_type in ['DATE', 'DATETIME']:
+            if pd.api.types.is_datetime64_any_dtype(df[col]):
+                fmt = '%Y-%m-%d' if data_type == 'DATE' else '%Y-%m-%d %H:%M:%S'
+                df[col] = pd.to_datetime(df[col]).dt.strftime(fmt)
+            else:
+                df[col] = r2p.convert_date_series(df[col], data_type, col)
+        elif data_type == 'INT64':
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+            df[col] = df[col].round().astype('Int64')
+        elif data_type == 'NUMERIC':
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+        elif data_type == 'STRING':
+            df[col] = df[col].fillna('')
+            df[col] = df[col].astype(str)
+            df[col] = df[col].replace('nan', '')
+
+    df = df.rename(columns={c: column_mapping[c]['en_name'] if c in column_mapping else c for c in df.columns})
+
+    target = monetary_config[monetary_config['file_name'] == table_name]
+    if not target.empty:
+        df = df.copy()
+        for _, config in target.iterrows():
+            condition_values = eval(config['condition_column_value'])
+            object_columns = eval(config['object_column_name'])
+            convert_value = float(config['convert_value'])
+            if config['condition_column_name'] not in df.columns:
+                continue
+            mask = df[config['condition_column_name']].isin(condition_values)
+            for col in object_columns:
+                if col in df.columns:
+                    df.loc[mask, col] = pd.to_numeric(df.loc[mask, col], errors='coerce') * convert_value
+
+    target = zero_date_config[zero_date_config['file_name'] == table_name]
+    if not target.empty:
+        df = df.copy()
+        for _, config in target.iterrows():
+            column_name = config['condition_column_name']
+            if column_name not in df.columns:
+                continue
+            for pattern in r2p.ZERO_DATE_PATTERNS:
+                mask = df[column_name].astype(str).str.strip() == pattern
+                if mask.any():
+                    df.loc[mask, column_name] = None
+
+    return r2p.reorder_columns_for_bigquery(df, table_name, column_mapping)
+
+
+# ------------------------------------------------------------
+# 合成データ
+# ------------------------------------------------------------
+def synthetic_frame(column_mapping, monetary_config, table_name, rows, rng):
+    """config/columns の型に合わせた object 列の DataFrame（read_excel 直後と同じ日本語カラム名）"""
+    base = datetime(2024, 9, 1)
+    conditions = {}
+    for _, config in monetary_config[monetary_config['file_name'] == table_name].iterrows():
+        conditions[config['condition_column_name']] = eval(config['condition_column_value']) + ["その他"]
+
+    missing = rng.random((len(column_mapping), rows)) < 0.1
+    columns = {}
+    for i, (jp_name, mapping) in enumerate(column_mapping.items()):
+        data_type = mapping['type']
+        if mapping['en_name'] in conditions:
+            choices = conditions[mapping['en_name']]
+            values = [choices[k] for k in rng.integers(0, len(choices), rows)]
+        elif data_type in ('DATE', 'DATETIME'):
+            offsets = rng.integers(0, 400, rows)
+            values = [base + timedelta(days=int(o)) if o % 50 else "0000/00/00" for o in offsets]
+        elif data_type == 'INT64':
+            values = rng.integers(0, 10 ** 6, rows).tolist()
+        elif data_type in ('NUMERIC', 'FLOAT64'):
+            values = (rng.random(rows) * 10 ** 6).round(2).tolist()
+        else:
+            values = [f"コード{k:05d}" for k in rng.integers(0, 5000, rows)]
+        columns[jp_name] = [None if m else v for v, m in zip(values, missing[i])]
+    return pd.DataFrame(columns, dtype=object)
+
+
+def measure(func, df):
+    """(処理時間, ピークメモリ[MB], 結果) ※入力のコピーは計測に含めない"""
+    source = df.copy()
+    started = time.perf_counter()
+    result = func(source)
+    elapsed = time.perf_counter() - started
+
+    source = df.copy()
+    tracemalloc.start()
+    func(source)
+    peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="変換処理（ConversionPlan）ベンチマーク")
+    parser.add_argument("--rows", type=int, default=50000, help="合成データの行数")
+    parser.add_argument("--tables", nargs="*", default=DEFAULT_TABLES, help="対象テーブル")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    monetary_config = pd.read_csv(os.path.join(REPO_ROOT, "config", "mapping", "monetary_scale_conversion.csv"))
+    zero_date_config = pd.read_csv(os.path.join(REPO_ROOT, "config", "mapping", "zero_date_to_null.csv"))
+    monetary_rules = r2p.compile_monetary_rules(monetary_config)
+
+    print(f"{'table':36} {'rows':>7} {'legacy':>9} {'plan':>9} {'legacy peak':>12} {'plan peak':>10}  一致")
+    for table_name in args.tables:
+        config = pd.read_csv(os.path.join(REPO_ROOT, "config", "columns", f"{table_name}.csv"))
+        column_mapping = {
+            row['jp_name']: {'en_name': row['en_name'], 'type': row['type']}
+            for _, row in config.iterrows()
+        }
+        df = synthetic_frame(column_mapping, monetary_config, table_name, args.rows, rng)
+        plan = r2p.ConversionPlan(table_name, column_mapping, monetary_rules, zero_date_config)
+
+        legacy_time, legacy_peak, expected = measure(
+            lambda d: legacy_transform(d, table_name, column_mapping, monetary_config, zero_date_config), df
+        )
+        plan_time, plan_peak, actual = measure(plan.apply, df)
+
+        same = expected.equals(actual) and expected.to_csv(index=False) == actual.to_csv(index=False)
+        print(
+            f"{table_name:36} {len(df):7d} {legacy_time:8.3f}s {plan_time:8.3f}s "
+            f"{legacy_peak:10.1f}MB {plan_peak:8.1f}MB  {'OK' if same else 'NG'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+日付変換（convert_date_format のセル単位適用 vs convert_date_series の列一括変換）のベンチマーク
+
+ledger_income / ledger_loss の DATE・DATETIME 列を対象に、raw_to_proceed_service と
+gcs_to_bq_service それぞれの実装で処理時間を計測し、出力が完全一致することを確認する。
+
+入力データ:
+  - 既定: 実データで見られる値（datetime・Excelシリアル値・"2024/09/01"・"2024年9月"・
+          "2024/09"・ゼロ日付・"0223/03/25"・空欄など）を混在させた合成データ
+  - --excel 指定時: 実際の Excel ファイル（ローカル）を読み込んで使用
+
+使い方:
+  python dev_tools/testing/benchmark_date_conversion.py --rows 100000
+  python dev_tools/testing/benchmark_date_conversion.py --excel ./raw/202410/4.xlsx --table ledger_income
+"""
+import os
+import time
+import argparse
+import importlib.util
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def load_service(name: str):
+    """サービスの main.py を別名モジュールとして読み込み"""
+    spec = importlib.util.spec_from_file_location(f"{name}_main", os.path.join(REPO_ROOT, name, "main.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def date_columns(table_name: str) -> dict:
+    """config/columns から DATE/DATETIME 列（日本語名 → 型）を取得"""
+    config = pd.read_csv(os.path.join(REPO_ROOT, "config", "columns", f"{table_name}.csv"))
+    config = config[config["type"].isin(["DATE", "DATETIME"])]
+    return dict(zip(config["jp_name"], config["type"]))
+
+
+def synthetic_column(rows: int, rng: np.random.Generator) -> pd.Series:
+    """実データに近い値を混在させた object 列"""
+    base = datetime(2024, 9, 1)
+    offsets = rng.integers(0, 400, rows)
+    kind = rng.choice(10, rows, p=[0.35, 0.2, 0.15, 0.05, 0.05, 0.05, 0.05, 0.04, 0.03, 0.03])
+    values = []
+    for k, offset in zip(kind, offsets):
+        d = base + timedelta(days=int(offset))
+        values.append([
+            d,                                     # datetime（openpyxl が日付セルから返す型）
+            f"{d:%Y/%m/%d}",                       # 文字列日付
+            float(45500 + offset),                 # Excel シリアル値
+            f"{d.year}年{d.month}月",               # 年月
+            f"{d:%Y/%m}",                          # YYYY/MM
+            None,                                  # 空欄
+            "0000/00/00",                          # ゼロ日付
+            f"0{d.year % 1000:03d}/{d:%m/%d}",     # 0223/03/25 形式
+            d.date(),                              # date
+            f"{d:%Y-%m-%d %H:%M:%S}",              # 文字列日時
+        ][k])
+    return pd.Series(values, dtype=object)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="日付変換ベンチマーク")
+    parser.add_argument("--rows", type=int, default=50000, help="合成データの行数")
+    parser.add_argument("--excel", help="実データの Excel ファイル（ローカル）")
+    parser.add_argument("--table", default="ledger_income", help="--excel 指定時のテーブル名")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    services = {name: load_service(name) for name in ("raw_to_proceed_service", "gcs_to_bq_service")}
+
+    if args.excel:
+        df = pd.read_excel(args.excel)
+        df.columns = [c.replace("\n", "") if isinstance(c, str) else c for c in df.columns]
+        targets = {args.table: {c: t for c, t in date_columns(args.table).items() if c in df.columns}}
+        frames = {args.table: df}
+    else:
+        rng = np.random.default_rng(args.seed)
+        targets = {t: date_columns(t) for t in ("ledger_income", "ledger_loss")}
+        frames = {
+            t: pd.DataFrame({c: synthetic_column(args.rows, rng) for c in cols})
+            for t, cols in targets.items()
+        }
+
+    print(f"{'service':24} {'table':15} {'column':24} {'type':8} {'per-cell':>10} {'vectorized':>11} {'speedup':>8}  一致")
+    for service_name, service in services.items():
+        for table_name, cols in targets.items():
+            for col, date_type in cols.items():
+                series = frames[table_name][col]
+                if pd.api.types.is_datetime64_any_dtype(series):
+                    continue  # datetime64 列は従来から列一括変換
+
+                started = time.perf_counter()
+                expected = series.apply(lambda x: service.convert_date_format(x, date_type, col))
+                per_cell = time.perf_counter() - started
+
+                started = time.perf_counter()
+                actual = service.convert_date_series(series, date_type, col)
+                vectorized = time.perf_counter() - started
+
+                same = expected.astype(object).equals(actual.astype(object))
+                print(
+                    f"{service_name:24} {table_name:15} {col[:22]:24} {date_type:8} "
+                    f"{per_cell:9.3f}s {vectorized:10.3f}s {per_cell / vectorized:7.1f}x  {'OK' if same else 'NG'}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+raw → proceed 変換の Excel 読み込みエンジン別ベンチマーク
+
+テーブルごとに以下の組み合わせで transform_excel_to_csv を実行し、
+処理時間と出力CSVが従来方式（openpyxl・全列読み込み）と一致するかを表示する。
+  - openpyxl / 全列（従来方式・基準）
+  - openpyxl / 列絞り込み
+  - calamine / 列絞り込み（python-calamine がインストールされている場合のみ）
+
+カラムマッピングはリポジトリの config/columns を使うため、GCS の config は不要。
+
+使い方:
+  # ローカルに保存した raw ファイル（gsutil cp gs://.../google-drive/raw/202410/* ./raw/202410/）
+  python dev_tools/testing/benchmark_excel_engines.py --raw-dir ./raw/202410 --yyyymm 202410
+
+  # GCS から直接取得
+  python dev_tools/testing/benchmark_excel_engines.py --yyyymm 202410 --from-gcs
+"""
+import io
+import os
+import sys
+import time
+import argparse
+import importlib.util
+import pandas as pd
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, os.path.join(REPO_ROOT, "raw_to_proceed_service"))
+
+import main as r2p  # noqa: E402
+
+
+class LocalBlob:
+    """ローカルファイルを GCS Blob と同じインターフェースで扱う"""
+
+    def __init__(self, path: str, name: str):
+        self.path = path
+        self.name = name
+        self.generation = int(os.path.getmtime(path)) if os.path.exists(path) else None
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def download_as_bytes(self) -> bytes:
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def download_as_text(self) -> str:
+        with open(self.path, encoding="utf-8") as f:
+            return f.read()
+
+
+class LocalBucket:
+    """config/columns はリポジトリ、raw ファイルは --raw-dir から読む Bucket 代替"""
+
+    def __init__(self, raw_dir: str, yyyymm: str):
+        self.raw_dir = raw_dir
+        self.raw_prefix = f"{r2p.GCS_RAW_PREFIX}/{yyyymm}/"
+
+    def _local_path(self, name: str) -> str:
+        if name.startswith(self.raw_prefix):
+            return os.path.join(self.raw_dir, name[len(self.raw_prefix):])
+        # google-drive/config/columns/xxx.csv → config/columns/xxx.csv
+        return os.path.join(REPO_ROOT, name.replace("google-drive/", "", 1))
+
+    def blob(self, name: str) -> LocalBlob:
+        return LocalBlob(self._local_path(name), name)
+
+    def list_blobs(self, prefix: str):
+        if prefix != self.raw_prefix:
+            return []
+        return [self.blob(prefix + f) for f in sorted(os.listdir(self.raw_dir))]
+
+
+def download_month(yyyymm: str) -> str:
+    """GCS の raw/YYYYMM/ を一時ディレクトリにダウンロード"""
+    from google.cloud import storage
+    import tempfile
+
+    raw_dir = tempfile.mkdtemp(prefix=f"raw_{yyyymm}_")
+    bucket = storage.Client().bucket(r2p.LANDING_BUCKET)
+    prefix = f"{r2p.GCS_RAW_PREFIX}/{yyyymm}/"
+    for blob in bucket.list_blobs(prefix=prefix):
+        name = blob.name[len(prefix):]
+        if "/" not in name:
+            blob.download_to_filename(os.path.join(raw_dir, name))
+    return raw_dir
+
+
+def compare_csv(baseline: bytes, csv_bytes: bytes) -> str:
+    """
+    出力CSVを従来方式と比較
+
+    "=" : 完全一致
+    "⊂" : 従来方式の出力からマッピング対象外の列を除くと一致（列絞り込みによる差分のみ）
+    "≠" : 不一致
+    """
+    if csv_bytes == baseline:
+        return "="
+    base_df = pd.read_csv(io.BytesIO(baseline), dtype=str, keep_default_na=False)
+    df = pd.read_csv(io.BytesIO(csv_bytes), dtype=str, keep_default_na=False)
+    if set(df.columns) <= set(base_df.columns) and base_df[list(df.columns)].equals(df):
+        return "⊂"
+    return "≠"
+
+
+def run_once(excel_bytes, table_name, bucket, engine, prune, empty):
+    started = time.perf_counter()
+    ok, csv_bytes, error = r2p.transform_excel_to_csv(
+        excel_bytes, table_name, r2p.TABLE_SHEET_MAPPING.get(table_name), bucket,
+        {}, empty, excel_engine=engine, prune_columns=prune
+    )
+    return time.perf_counter() - started, csv_bytes if ok else None, error
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Excel読み込みエンジン別ベンチマーク")
+    parser.add_argument("--yyyymm", required=True, help="対象年月（YYYYMM）")
+    parser.add_argument("--raw-dir", help="raw ファイルを置いたローカルディレクトリ")
+    parser.add_argument("--from-gcs", action="store_true", help="GCS から raw ファイルを取得")
+    parser.add_argument("--tables", nargs="*", default=r2p.TABLES, help="対象テーブル（省略時は全テーブル）")
+    parser.add_argument("--repeat", type=int, default=3, help="計測回数（最短時間を採用）")
+    args = parser.parse_args()
+
+    if not args.raw_dir and not args.from_gcs:
+        parser.error("--raw-dir または --from-gcs を指定してください")
+    raw_dir = args.raw_dir or download_month(args.yyyymm)
+    bucket = LocalBucket(raw_dir, args.yyyymm)
+    index = r2p.build_raw_file_index(bucket, args.yyyymm)
+
+    variants = [("openpyxl", False), ("openpyxl", True)]
+    if importlib.util.find_spec("python_calamine") is not None:
+        variants.append(("calamine", True))
+    else:
+        print("python-calamine 未インストールのため calamine はスキップ（pip install python-calamine）")
+
+    # 金額単位・ゼロ日付変換は読み込みエンジンと無関係なので空設定で計測
+    empty = pd.DataFrame(columns=["file_name"])
+
+    header = f"{'table':45} " + " ".join(f"{e + ('/prune' if p else '/full'):>18}" for e, p in variants)
+    print(header)
+    print("-" * len(header))
+
+    totals = [0.0] * len(variants)
+    for table_name in args.tables:
+        raw_blob, raw_path = r2p.find_raw_file(bucket, table_name, args.yyyymm, index=index)
+        if raw_blob is None:
+            print(f"{table_name:45} (rawファイルなし)")
+            continue
+        excel_bytes = raw_blob.download_as_bytes()
+
+        cells = []
+        baseline = None
+        for i, (engine, prune) in enumerate(variants):
+            best, csv_bytes, error = None, None, None
+            for _ in range(args.repeat):
+                elapsed, csv_bytes, error = run_once(excel_bytes, table_name, bucket, engine, prune, empty)
+                best = elapsed if best is None else min(best, elapsed)
+            totals[i] += best
+            if i == 0:
+                baseline = csv_bytes
+                mark = ""
+            elif csv_bytes is not None and baseline is not None:
+                mark = " " + compare_csv(baseline, csv_bytes)
+            else:
+                mark = ""
+            cells.append(f"{best:8.3f}s{mark:2}" if csv_bytes is not None else f"{'ERROR':>10}")
+            if error:
+                print(f"  {engine}/{'prune' if prune else 'full'}: {error}")
+        print(f"{table_name:45} " + " ".join(f"{c:>18}" for c in cells))
+
+    print("-" * len(header))
+    print(f"{'合計':43} " + " ".join(
+        f"{t:8.3f}s x{totals[0] / t if t else 0:4.1f}".rjust(18) for t in totals
+    ))
+    print("\n= : 出力CSVが従来方式と一致 / ⊂ : マッピング対象外の列を除いて一致 / ≠ : 不一致")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+raw → proceed 変換のベンチマーク（合成ブック・GCS 不要）
+
+config/columns/<table>.csv のスキーマに合わせた合成 .xlsx を指定行数（1,000〜1,000,000行）で生成し、
+メモリ上のバケット（GCS の代替）に置いて以下を実行する。
+
+  - raw_to_proceed_service: transform_table（処理段階ごとの計測値 StageMetrics をそのまま表示）
+  - gcs_to_bq_service:      transform_excel_to_csv（各変換関数を計測用にラップ。
+                            read_excel・CSV 出力等の計測できない部分は other に計上）
+
+テーブル・行数ごとに別プロセスで実行し、処理段階ごとの時間とピークRSSの増分を表示する。
+合成データには日付列の Excel シリアル値・ゼロ日付（"0000/00/00"、ゼロ日付変換の対象列のみ）・"2024年9月" 形式・文字列日付・空欄、
+金額単位変換の対象行、先頭0付きの文字列コードを混在させる（STRING 列は列ごとに文字を含むコードとの混在・数字のみのコード・数値セル）。
+--verify-streaming では raw_to_proceed を通常の変換とチャンク単位の変換（service 名に * を付けて表示）の
+両方で実行し、出力の MD5（Parquet は読み込んだ値）が一致するかを確認する。
+
+使い方:
+  python dev_tools/testing/benchmark_transform_suite.py --rows 1000 10000 100000
+  python dev_tools/testing/benchmark_transform_suite.py --rows 1000000 --tables ledger_income --service raw_to_proceed --streaming
+  python dev_tools/testing/benchmark_transform_suite.py --rows 1000 100000 --verify-streaming --format parquet
+  python dev_tools/testing/benchmark_transform_suite.py --rows 100000 --cache-dir /tmp/bench_xlsx --json result.json
+"""
+import io
+import os
+import sys
+import ast
+import json
+import time
+import types
+import base64
+import hashlib
+import logging
+import argparse
+import resource
+import importlib.util
+import multiprocessing
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import openpyxl
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+YYYYMM = "202410"
+SERVICES = ["raw_to_proceed", "gcs_to_bq"]
+DEFAULT_TABLES = ["ledger_income", "ledger_loss", "stocks", "billing_balance", "profit_plan_term"]
+GENERATE_CHUNK_ROWS = 50000
+
+
+def load_service(name: str):
+    """サービスの main.py を別名モジュールとして読み込み"""
+    spec = importlib.util.spec_from_file_location(f"{name}_main", os.path.join(REPO_ROOT, name, "main.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# ------------------------------------------------------------
+# メモリ上のバケット（変換処理が使う google.cloud.storage の範囲のみ）
+# ------------------------------------------------------------
+class MemoryBlob:
+    def __init__(self, bucket, name):
+        self.bucket = bucket
+        self.name = name
+
+    @property
+    def generation(self):
+        return self.bucket.generations.get(self.name)
+
+    @property
+    def md5_hash(self):
+        return self.bucket.hashes.get(self.name)
+
+    @property
+    def size(self):
+        return len(self.bucket.objects[self.name])
+
+    def exists(self):
+        return self.name in self.bucket.objects
+
+    def download_as_bytes(self):
+        return self.bucket.objects[self.name]
+
+    download_as_string = download_as_bytes
+
+    def download_as_text(self):
+        return self.bucket.objects[self.name].decode("utf-8")
+
+    def upload_from_string(self, data, content_type=None, if_generation_match=None):
+        self.bucket.put(self.name, data.encode("utf-8") if isinstance(data, str) else bytes(data))
+
+    def upload_from_file(self, file_obj, content_type=None):
+        self.bucket.put(self.name, file_obj.read())
+
+    def open(self, mode="wb", content_type=None, ignore_flush=False):
+        return MemoryWriter(self)
+
+    def delete(self):
+        self.bucket.objects.pop(self.name)
+        self.bucket.generations.pop(self.name, None)
+        self.bucket.hashes.pop(self.name, None)
+
+
+class MemoryWriter(io.BytesIO):
+    """blob.open("wb") の代替（close 時にオブジェクトとして保存）"""
+
+    def __init__(self, blob):
+        super().__init__()
+        self.blob = blob
+
+    def close(self):
+        if not self.closed:
+            self.blob.upload_from_string(self.getvalue())
+        super().close()
+
+
+class MemoryBucket:
+    def __init__(self, name="benchmark"):
+        self.name = name
+        self.objects = {}
+        self.generations = {}
+        self.hashes = {}
+        self._generation = 0
+
+    def put(self, name, data):
+        self._generation += 1
+        self.objects[name] = data
+        self.generations[name] = self._generation
+        self.hashes[name] = base64.b64encode(hashlib.md5(data).digest()).decode("ascii")
+
+    def blob(self, name):
+        return MemoryBlob(self, name)
+
+    def get_blob(self, name):
+        return MemoryBlob(self, name) if name in self.objects else None
+
+    def list_blobs(self, prefix="", delimiter=None):
+        return [MemoryBlob(self, name) for name in sorted(self.objects) if name.startswith(prefix)]
+
+    def copy_blob(self, blob, destination_bucket, new_name):
+        destination_bucket.put(new_name, self.objects[blob.name])
+        return MemoryBlob(destination_bucket, new_name)
+
+
+class MemoryClient:
+    def __init__(self, bucket):
+        self._bucket = bucket
+
+    def bucket(self, name):
+        return self._bucket
+
+
+def load_repo_config(bucket):
+    """リポジトリの config/ を google-drive/config/ として配置"""
+    config_root = os.path.join(REPO_ROOT, "config")
+    for dirpath, _, filenames in os.walk(config_root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            rel = os.path.relpath(path, REPO_ROOT).replace(os.sep, "/")
+            with open(path, "rb") as f:
+                bucket.put(f"google-drive/{rel}", f.read())
+
+
+# ------------------------------------------------------------
+# 合成ブック
+# ------------------------------------------------------------
+def monetary_conditions(table_name):
+    """金額単位変換の条件列（英語名）→ 条件値のリスト"""
+    config = pd.read_csv(os.path.join(REPO_ROOT, "config", "mapping", "monetary_scale_conversion.csv"))
+    conditions = {}
+    for _, row in config[config["file_name"] == table_name].iterrows():
+        values = conditions.setdefault(row["condition_column_name"], [])
+        values.extend(v for v in ast.literal_eval(row["condition_column_value"]) if v not in values)
+    return conditions
+
+
+def zero_date_columns(table_name):
+    """ゼロ日付を null に変換する列（英語名）"""
+    config = pd.read_csv(os.path.join(REPO_ROOT, "config", "mapping", "zero_date_to_null.csv"))
+    return set(config.loc[config["file_name"] == table_name, "condition_column_name"])
+
+
+def synthetic_values(data_type, rows, rng, conditions=None, zero_dates=False):
+    """
+    1列分の値（Excel に書き込む Python オブジェクト）
+
+    ゼロ日付は zero_date_to_null.csv の対象列のみに入れる（実データと同じく、対象外の列には現れない前提）
+    """
+    missing = rng.random(rows) < 0.05
+    if conditions:
+        choices = conditions + ["その他"]
+        values = [choices[k] for k in rng.integers(0, len(choices), rows)]
+    elif data_type in ("DATE", "DATETIME"):
+        base = datetime(2024, 9, 1)
+        offsets = rng.integers(0, 400, rows)
+        kinds = rng.choice(6, rows, p=[0.55, 0.15, 0.1, 0.05, 0.05, 0.1])
+        if not zero_dates:
+            kinds[kinds == 2] = 0
+        values = []
+        for kind, offset in zip(kinds, offsets):
+            d = base + timedelta(days=int(offset))
+            values.append((
+                d,                          # 日付セル
+                float(45536 + offset),      # Excel シリアル値（数値セル）
+                "0000/00/00",               # ゼロ日付
+                f"{d.year}年{d.month}月",    # 年月
+                f"{d:%Y/%m/%d}",            # 文字列日付
+                None,                       # 空欄
+            )[kind])
+    elif data_type == "INT64":
+        values = rng.integers(0, 10 ** 7, rows).tolist()
+    elif data_type in ("NUMERIC", "FLOAT64"):
+        values = (rng.random(rows) * 10 ** 6).round(2).tolist()
+    else:
+        # STRING 列は列ごとに、文字を含むコードとの混在・先頭0付きの数字のみのコード・数値セルのいずれか
+        # （後の2つは read_excel の型推定で数値列になり "123.0" 形式で出力される）
+        variant = rng.integers(0, 3)
+        codes = rng.integers(0, 20000, rows)
+        if variant == 0:
+            values = [f"{k:05d}" if k % 3 == 0 else f"コード{k}" for k in codes]
+        elif variant == 1:
+            values = [f"{k:05d}" for k in codes]
+        else:
+            values = codes.tolist()
+    return [None if m else v for v, m in zip(values, missing)]
+
+
+def generate_workbook(table_name, sheet_name, rows, seed):
+    """config/columns/<table>.csv の日本語カラム名を見出し行にした .xlsx（bytes）"""
+    config = pd.read_csv(os.path.join(REPO_ROOT, "config", "columns", f"{table_name}.csv"))
+    conditions = monetary_conditions(table_name)
+    zero_dates = zero_date_columns(table_name)
+    rng = np.random.default_rng(seed)
+
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_name or "Sheet1")
+    sheet.append(list(config["jp_name"]))
+    for start in range(0, rows, GENERATE_CHUNK_ROWS):
+        n = min(GENERATE_CHUNK_ROWS, rows - start)
+        columns = [
+            synthetic_values(data_type, n, rng, conditions.get(en_name), en_name in zero_dates)
+            for en_name, data_type in zip(config["en_name"], config["type"])
+        ]
+        for row in zip(*columns):
+            sheet.append(row)
+
+    out = io.BytesIO()
+    workbook.save(out)
+    return out.getvalue()
+
+
+def workbook_bytes(table_name, sheet_name, rows, seed, cache_dir):
+    """合成ブックを生成（cache_dir 指定時は生成済みのファイルを再利用）"""
+    path = os.path.join(cache_dir, f"{table_name}_{rows}_{seed}.xlsx") if cache_dir else None
+    if path and os.path.exists(path):
+        with open(path, "rb") as f:
+            return f.read()
+    data = generate_workbook(table_name, sheet_name, rows, seed)
+    if path:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+    return data
+
+
+# ------------------------------------------------------------
+# 計測（1ケース = 1プロセス）
+# ------------------------------------------------------------
+GCS_TO_BQ_STAGES = {
+    "validate_columns_and_rows": "validation",
+    "apply_data_type_conversion": "type_conversion",
+    "rename_columns": "rename",
+    "apply_monetary_scale_conversion": "monetary",
+    "apply_zero_date_to_null_conversion": "zero_date",
+}
+
+
+def output_digest(data, output_format):
+    """
+    出力の MD5。Parquet は行グループの分け方（チャンク単位の変換では1チャンク = 1行グループ）で
+    バイト列が変わるため、読み込んだスキーマと値を CSV にしたものの MD5
+    """
+    if output_format == "parquet" and data:
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(io.BytesIO(data))
+        data = str(table.schema).encode("utf-8") + table.to_pandas().to_csv(index=False).encode("utf-8")
+    return hashlib.md5(data).hexdigest()
+
+
+def run_raw_to_proceed(bucket, table_name):
+    r2p = load_service("raw_to_proceed_service")
+    monetary_rules = r2p.load_monetary_rules_from_gcs(bucket)
+    zero_date_config = r2p.load_zero_date_config_from_gcs(bucket)
+    raw_index = r2p.build_raw_file_index(bucket, YYYYMM)
+
+    outcome = r2p.transform_table(bucket, YYYYMM, table_name, monetary_rules, zero_date_config, raw_index)
+    metrics = outcome["metrics"]
+    output = bucket.objects.get(outcome.get("output"), b"")
+    return outcome["status"], outcome.get("rows"), output, metrics["total_seconds"], metrics["stages"]
+
+
+def run_gcs_to_bq(bucket, table_name):
+    g2b = load_service("gcs_to_bq_service")
+    r2p = load_service("raw_to_proceed_service")
+    client = MemoryClient(bucket)
+    g2b.storage = types.SimpleNamespace(Client=lambda *args, **kwargs: client)
+    monetary_rules = g2b.load_monetary_rules(client)
+
+    # 各変換関数を処理段階として計測
+    metrics = r2p.StageMetrics()
+    for func_name, stage in GCS_TO_BQ_STAGES.items():
+        def timed(*args, _func=getattr(g2b, func_name), _stage=stage, **kwargs):
+            with metrics.span(_stage):
+                return _func(*args, **kwargs)
+        setattr(g2b, func_name, timed)
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        ok = g2b.transform_excel_to_csv(client, table_name, YYYYMM, monetary_rules)
+    total = time.perf_counter() - started
+
+    stages = metrics.to_dict()["stages"]
+    stages["other"] = {"seconds": round(total - sum(s["seconds"] for s in stages.values()), 3)}
+    output = bucket.objects.get(f"google-drive/proceed/{YYYYMM}/{table_name}.csv", b"")
+    rows = output.count(b"\n") - 1 if output else None
+    return ("success" if ok else "error"), rows, output, round(total, 3), stages
+
+
+def _rss_mb(field):
+    """/proc/self/status の VmRSS / VmHWM（MB）。取得できない環境では ru_maxrss"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _reset_peak_rss():
+    """ピークRSS（VmHWM）を現在値にリセット（ru_maxrss は起動元プロセスの値を引き継ぐため）"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def run_case(service, table_name, workbook, output_format, streaming):
+    """子プロセスで1ケースを実行し、結果（処理段階ごとの時間・ピークRSSの増分）を返す"""
+    logging.disable(logging.WARNING)
+    os.environ["PROCEED_FORMAT"] = output_format
+    os.environ["STREAMING_TABLES"] = table_name if streaming else ""
+
+    bucket = MemoryBucket()
+    load_repo_config(bucket)
+    bucket.put(f"google-drive/raw/{YYYYMM}/{table_name}.xlsx", workbook)
+    del workbook
+
+    _reset_peak_rss()
+    rss_before = _rss_mb("VmRSS")
+    runner = run_raw_to_proceed if service == "raw_to_proceed" else run_gcs_to_bq
+    status, rows, output, total, stages = runner(bucket, table_name)
+    peak = _rss_mb("VmHWM") - rss_before
+    return {
+        "status": status,
+        "rows": rows,
+        "output_bytes": len(output),
+        "output_md5": output_digest(output, output_format if service == "raw_to_proceed" else "csv"),
+        "total_seconds": total,
+        "peak_rss_delta_mb": round(peak, 1),
+        "stages": stages,
+    }
+
+
+REPORT_STAGES = [
+    ("download", "dl"), ("parse", "parse"), ("validation", "valid"), ("type_conversion", "type"),
+    ("rename", "ren"), ("monetary", "mon"), ("zero_date", "zero"), ("post_process", "post"),
+    ("serialize", "ser"), ("upload", "up"), ("other", "other"),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="raw → proceed 変換ベンチマーク（合成ブック）")
+    parser.add_argument("--rows", type=int, nargs="*", default=[1000, 10000, 100000], help="行数（複数指定可）")
+    parser.add_argument("--tables", nargs="*", default=DEFAULT_TABLES, help="対象テーブル")
+    parser.add_argument("--service", choices=SERVICES + ["all"], default="all")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv", help="raw_to_proceed の出力形式")
+    parser.add_argument("--streaming", action="store_true", help="raw_to_proceed をチャンク単位の変換で実行")
+    parser.add_argument(
+        "--verify-streaming", action="store_true",
+        help="raw_to_proceed を通常の変換とチャンク単位の変換の両方で実行し、出力が一致するか確認（不一致があれば終了コード1）"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cache-dir", help="生成した合成ブックの保存先（再実行時に再利用）")
+    parser.add_argument("--json", help="結果を JSON で保存")
+    args = parser.parse_args()
+
+    services = SERVICES if args.service == "all" else [args.service]
+    # (service, streaming) の組み合わせ
+    cases = [(service, args.streaming) for service in services]
+    if args.verify_streaming:
+        cases = [("raw_to_proceed", False), ("raw_to_proceed", True)]
+    sheet_names = load_service("raw_to_proceed_service").TABLE_SHEET_MAPPING
+    context = multiprocessing.get_context("spawn")
+
+    header = f"{'service':15} {'table':36} {'rows':>8} {'total':>8} {'peakMB':>7} " + " ".join(
+        f"{short:>6}" for _, short in REPORT_STAGES
+    )
+    print(header)
+    results = []
+    mismatches = []
+    for rows in args.rows:
+        for table_name in args.tables:
+            started = time.perf_counter()
+            workbook = workbook_bytes(table_name, sheet_names.get(table_name), rows, args.seed, args.cache_dir)
+            generated = time.perf_counter() - started
+            print(f"# {table_name} {rows}行: {len(workbook) / 1024 / 1024:.1f}MB（生成 {generated:.1f}s）", file=sys.stderr)
+
+            digests = set()
+            for service, streaming in cases:
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                    result = executor.submit(run_case, service, table_name, workbook, args.format, streaming).result()
+                result.update(service=service, table=table_name, requested_rows=rows, streaming=streaming)
+                results.append(result)
+                digests.add(result["output_md5"])
+
+                stages = result["stages"]
+                cells = " ".join(
+                    f"{stages[stage]['seconds']:6.2f}" if stage in stages else f"{'-':>6}"
+                    for stage, _ in REPORT_STAGES
+                )
+                status = "" if result["status"] == "success" else f"  {result['status']}"
+                label = f"{service}{'*' if streaming else ''}"
+                print(
+                    f"{label:15} {table_name:36} {rows:8d} {result['total_seconds']:7.2f}s "
+                    f"{result['peak_rss_delta_mb']:7.1f} {cells}{status}"
+                )
+
+            if args.verify_streaming:
+                matched = len(digests) == 1
+                print(f"# {table_name} {rows}行: チャンク単位の変換の出力は通常の変換と{'一致' if matched else '不一致'}", file=sys.stderr)
+                if not matched:
+                    mismatches.append((table_name, rows))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+raw-to-proceed の GCS 完了通知エンドポイント（/events/gcs-finalize）にサンプルイベントを送信する
+
+Eventarc が送る CloudEvent（binary / structured モード）または Pub/Sub push の形式で
+google-drive/raw/YYYYMM/*.xlsx の finalize 通知を組み立てて POST し、レスポンスを表示する。
+
+使い方:
+  # ローカルでサービスを起動（GCP の認証情報が必要）
+  cd raw_to_proceed_service && python main.py
+
+  # 別ターミナルから送信
+  python dev_tools/testing/post_gcs_finalize_event.py --object google-drive/raw/202410/9.xlsx
+  python dev_tools/testing/post_gcs_finalize_event.py --object google-drive/raw/202410/12_5.xlsx --format pubsub
+
+  # デプロイ済みサービスに送信
+  python dev_tools/testing/post_gcs_finalize_event.py --url https://raw-to-proceed-xxx.run.app \\
+      --object google-drive/raw/202410/9.xlsx --token "$(gcloud auth print-identity-token)"
+"""
+import json
+import uuid
+import base64
+import argparse
+import urllib.request
+import urllib.error
+from datetime import datetime, timezone
+
+LANDING_BUCKET = "data-platform-landing-prod"
+FINALIZED_EVENT = "google.cloud.storage.object.v1.finalized"
+
+
+def build_event(fmt: str, bucket: str, name: str, generation: str):
+    """(ヘッダ, 本文) を組み立て"""
+    now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    object_data = {
+        "kind": "storage#object",
+        "bucket": bucket,
+        "name": name,
+        "generation": generation,
+        "contentType": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        "timeCreated": now,
+        "updated": now,
+    }
+    event_id = uuid.uuid4().hex
+
+    if fmt == "binary":
+        headers = {
+            "Content-Type": "application/json",
+            "ce-specversion": "1.0",
+            "ce-id": event_id,
+            "ce-type": FINALIZED_EVENT,
+            "ce-source": f"//storage.googleapis.com/projects/_/buckets/{bucket}",
+            "ce-subject": f"objects/{name}",
+            "ce-time": now,
+        }
+        return headers, object_data
+
+    if fmt == "structured":
+        body = {
+            "specversion": "1.0",
+            "id": event_id,
+            "type": FINALIZED_EVENT,
+            "source": f"//storage.googleapis.com/projects/_/buckets/{bucket}",
+            "subject": f"objects/{name}",
+            "time": now,
+            "datacontenttype": "application/json",
+            "data": object_data,
+        }
+        return {"Content-Type": "application/cloudevents+json"}, body
+
+    # Pub/Sub push（GCS の Pub/Sub 通知）
+    body = {
+        "message": {
+            "attributes": {
+                "eventType": "OBJECT_FINALIZE",
+                "bucketId": bucket,
+                "objectId": name,
+                "objectGeneration": generation,
+                "payloadFormat": "JSON_API_V1",
+            },
+            "data": base64.b64encode(json.dumps(object_data).encode("utf-8")).decode("ascii"),
+            "messageId": event_id,
+            "publishTime": now,
+        },
+        "subscription": "projects/_/subscriptions/raw-to-proceed-gcs-finalize",
+    }
+    return {"Content-Type": "application/json"}, body
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GCS 完了通知のサンプルイベント送信")
+    parser.add_argument("--url", default="http://localhost:8080", help="raw-to-proceed のURL")
+    parser.add_argument("--object", required=True, help="オブジェクト名（例: google-drive/raw/202410/9.xlsx）")
+    parser.add_argument("--bucket", default=LANDING_BUCKET)
+    parser.add_argument("--generation", default="", help="世代番号（省略時は最新世代として扱われる）")
+    parser.add_argument("--format", choices=["binary", "structured", "pubsub"], default="binary",
+                        help="binary / structured: Eventarc CloudEvent, pubsub: Pub/Sub push")
+    parser.add_argument("--token", help="IDトークン（認証が必要なサービスの場合）")
+    args = parser.parse_args()
+
+    headers, body = build_event(args.format, args.bucket, args.object, args.generation)
+    if args.token:
+        headers["Authorization"] = f"Bearer {args.token}"
+
+    req = urllib.request.Request(
+        args.url.rstrip("/") + "/events/gcs-finalize",
+        data=json.dumps(body).encode("utf-8"),
+        headers=headers,
+        method="POST",
+    )
+    print(f"POST {req.full_url} ({args.format})")
+    try:
+        with urllib.request.urlopen(req, timeout=1800) as res:
+            status, text = res.status, res.read().decode("utf-8")
+    except urllib.error.HTTPError as e:
+        status, text = e.code, e.read().decode("utf-8")
+
+    print(f"HTTP {status}")
+    try:
+        print(json.dumps(json.loads(text), ensure_ascii=False, indent=2))
+    except ValueError:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
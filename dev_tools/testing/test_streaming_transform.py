@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+raw-to-proceed のチャンク単位の変換（STREAMING_TABLES）のテスト
+
+列の型が途中のチャンクで変わるシート（後半にだけ欠損・小数・文字列・時刻を含む列など）を
+stream_excel_to_proceed でチャンク単位に変換し、通常の変換（transform_excel_to_dataframe）と
+出力が一致すること（CSV はバイト単位、Parquet は読み込んだテーブル）を確認する。
+
+使い方:
+  python -m pytest dev_tools/testing/test_streaming_transform.py -q
+"""
+import os
+import io
+import importlib.util
+from datetime import datetime, time
+
+import openpyxl
+import pandas as pd
+import pytest
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+ROWS = 40
+
+# 列名 → (行番号 → セルの値, config/columns の型)
+COLUMNS = {
+    "整数": (lambda i: i, "STRING"),
+    "後半に欠損": (lambda i: None if i == 35 else i, "STRING"),
+    "後半に小数": (lambda i: 2.5 if i == 37 else float(i), "STRING"),
+    "数値文字列": (lambda i: f"{i:05d}", "STRING"),
+    "後半に文字列": (lambda i: "abc" if i == 39 else f"{i:05d}", "STRING"),
+    "混在": (lambda i: ["a", 1, 2.5, None, "007"][i % 5], "STRING"),
+    "真偽値": (lambda i: i % 2 == 0, "STRING"),
+    "日時": (lambda i: datetime(2024, 1, 1 + i % 28), "STRING"),
+    "後半に時刻": (lambda i: datetime(2024, 1, 1 + i % 28, 5 if i == 33 else 0), "STRING"),
+    "後半に日時以外": (lambda i: "x" if i == 38 else datetime(2024, 1, 1 + i % 28), "STRING"),
+    "時刻": (lambda i: time(1, i % 60), "STRING"),
+    "欠損のみ": (lambda i: None, "STRING"),
+    "欠損値文字列": (lambda i: "NA" if i == 20 else i, "STRING"),
+    "日付": (lambda i: None if i == 2 else datetime(2024, 1, 1 + i % 28), "DATE"),
+    "金額": (lambda i: None if i == 36 else i, "NUMERIC"),
+    "件数": (lambda i: None if i == 36 else str(i), "INT64"),
+}
+COLUMN_MAPPING = {name: {"en_name": f"col_{n}", "type": t} for n, (name, (_, t)) in enumerate(COLUMNS.items())}
+ZERO_DATE_CONFIG = pd.DataFrame(columns=["file_name", "condition_column_name"])
+
+
+@pytest.fixture(scope="module")
+def r2p():
+    spec = importlib.util.spec_from_file_location(
+        "raw_to_proceed_main", os.path.join(REPO_ROOT, "raw_to_proceed_service", "main.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def workbook():
+    """途中と末尾に空行を含むシート（.xlsx の bytes）"""
+    book = openpyxl.Workbook()
+    sheet = book.active
+    sheet.append(list(COLUMNS))
+    for i in range(ROWS):
+        sheet.append([value(i) for value, _ in COLUMNS.values()])
+        if i == 10:
+            sheet.append([None] * len(COLUMNS))
+    sheet.append([None] * len(COLUMNS))
+    out = io.BytesIO()
+    book.save(out)
+    return out.getvalue()
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 7, 50])
+@pytest.mark.parametrize("output_format", ["csv", "parquet"])
+def test_streaming_output_matches_regular_transform(r2p, workbook, output_format, chunk_rows):
+    ok, df, error = r2p.transform_excel_to_dataframe(
+        workbook, "streaming_test", None, None, {}, ZERO_DATE_CONFIG, "openpyxl", True, [], COLUMN_MAPPING
+    )
+    assert ok, error
+
+    out = io.BytesIO()
+    rows = r2p.stream_excel_to_proceed(
+        workbook, "streaming_test", None, COLUMN_MAPPING, {}, ZERO_DATE_CONFIG, [], output_format, out,
+        chunk_rows=chunk_rows
+    )
+    assert rows == len(df)
+
+    if output_format == "csv":
+        assert out.getvalue() == df.to_csv(index=False, encoding="utf-8").encode("utf-8")
+    else:
+        import pyarrow.parquet as pq
+
+        expected = pq.read_table(io.BytesIO(r2p.dataframe_to_parquet_bytes(df, COLUMN_MAPPING)))
+        assert pq.read_table(io.BytesIO(out.getvalue())).equals(expected)
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+drive-to-gcs（run_service）の同期処理のテスト
+
+GCS・Google Drive はメモリ上のスタブに差し替えて sync_drive_to_gcs / resume を実行する（認証情報は不要）。
+- 再開時に処理済みの月の raw オブジェクトが孤立オブジェクトとして削除されず、マニフェストにも残ること
+- 同じジョブの再開は、読み込み時点の世代番号で書き込めた1リクエストだけが引き継ぐこと
+- Drive からのダウンロードが途中で失敗しても raw/ の既存ファイルが置き換わらないこと
+- changes モードで月フォルダの名前変更・親フォルダへの移動の配下のファイルを取得し、
+  失敗したファイルがある場合は月フォルダの対応表もページトークンと同様に進めないこと
+
+使い方:
+  python -m pytest dev_tools/testing/test_sync_resume.py -q
+"""
+import os
+import io
+import sys
+import json
+import itertools
+import importlib.util
+
+import pandas as pd
+import pytest
+from google.api_core.exceptions import NotFound, PreconditionFailed
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+os.environ.setdefault("DRIVE_FOLDER_ID", "root-folder")
+os.environ.setdefault("LANDING_BUCKET", "test-bucket")
+
+_generations = itertools.count(1)
+
+
+# ------------------------------------------------------------
+# GCS スタブ
+# ------------------------------------------------------------
+class MemoryBlob:
+    def __init__(self, bucket, name):
+        self.bucket, self.name = bucket, name
+
+    @property
+    def generation(self):
+        return self.bucket.generations.get(self.name)
+
+    def exists(self):
+        return self.name in self.bucket.objects
+
+    def download_as_text(self):
+        return self.bucket.objects[self.name].decode("utf-8")
+
+    def upload_from_string(self, data, content_type=None, if_generation_match=None):
+        if if_generation_match is not None and (self.generation or 0) != if_generation_match:
+            raise PreconditionFailed(f"generation mismatch: {self.name}")
+        self.bucket.objects[self.name] = data.encode("utf-8") if isinstance(data, str) else data
+        self.bucket.generations[self.name] = next(_generations)
+
+    def delete(self):
+        if self.name not in self.bucket.objects:
+            raise NotFound(self.name)
+        self.bucket.deleted.append(self.name)
+        del self.bucket.objects[self.name]
+        del self.bucket.generations[self.name]
+
+    def open(self, mode, chunk_size=None, content_type=None):
+        # close() でオブジェクトを確定させる BlobWriter と同じ振る舞い
+        blob = self
+
+        class Writer(io.BytesIO):
+            def close(self):
+                if not self.closed:
+                    blob.upload_from_string(self.getvalue())
+                super().close()
+
+        return Writer()
+
+
+class MemoryBucket:
+    name = "test-bucket"
+
+    def __init__(self):
+        self.objects, self.generations, self.deleted = {}, {}, []
+
+    def blob(self, name):
+        return MemoryBlob(self, name)
+
+    def get_blob(self, name):
+        return MemoryBlob(self, name) if name in self.objects else None
+
+    def list_blobs(self, prefix=""):
+        return [MemoryBlob(self, n) for n in sorted(self.objects) if n.startswith(prefix)]
+
+    def copy_blob(self, blob, destination_bucket, new_name):
+        destination_bucket.blob(new_name).upload_from_string(self.objects[blob.name])
+        return MemoryBlob(destination_bucket, new_name)
+
+
+# ------------------------------------------------------------
+# run_service の読み込みと Drive のスタブ
+# ------------------------------------------------------------
+MONTHS = {"202409": ["a.xlsx", "b.xlsx"], "202410": ["c.xlsx"]}
+
+
+def drive_file(yyyymm, name, md5="v1"):
+    return {"id": f"{yyyymm}-{name}", "name": name, "md5Checksum": md5, "modifiedTime": "2025-01-01T00:00:00Z"}
+
+
+@pytest.fixture
+def sync():
+    spec = importlib.util.spec_from_file_location("run_service_main", os.path.join(REPO_ROOT, "run_service", "main.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    bucket = MemoryBucket()
+    files = {m: [drive_file(m, n) for n in names] for m, names in MONTHS.items()}
+
+    def transfer(bucket_, df_map, yyyymm, f):
+        path = module._raw_gcs_path(yyyymm, os.path.splitext(f["name"])[0])
+        bucket_.blob(path).upload_from_string(b"xlsx")
+        return {"file": f["name"], "gcs_uri": f"gs://{bucket_.name}/{path}", "generation": bucket_.generations[path]}
+
+    module.storage.Client = lambda *a, **k: type("Client", (), {"bucket": lambda self, name: bucket})()
+    module._build_drive_service = lambda: object()
+    module._load_mapping_csv = lambda: pd.DataFrame(columns=["jp_name", "en_name"])
+    module._list_all_month_folders = lambda drive, parent: [{"id": m, "name": m} for m in sorted(files)]
+    module._iter_files = lambda drive, folder_id: iter(files[folder_id])
+    module._transfer_file = transfer
+    module.bucket, module.files = bucket, files
+    return module
+
+
+def manifest_of(module):
+    return json.loads(module.bucket.objects[module.SYNC_MANIFEST_PATH])["files"]
+
+
+def changes_state_of(module):
+    return json.loads(module.bucket.objects[module.CHANGES_STATE_PATH])
+
+
+def folder_change(folder_id, name):
+    return {"fileId": folder_id, "file": {"id": folder_id, "name": name, "mimeType": "application/vnd.google-apps.folder",
+                                          "parents": ["root-folder"]}}
+
+
+@pytest.fixture
+def changes_sync(sync):
+    # 初回の changes モード（ベースラインの全体走査）でページトークンと月フォルダの対応表を作成
+    sync._get_drive_id_of = lambda drive, file_id: None
+    sync._get_start_page_token = lambda drive, drive_id: "token-1"
+    sync.sync_drive_to_gcs(mode="changes")
+    assert changes_state_of(sync)["page_token"] == "token-1"
+    return sync
+
+
+@pytest.mark.parametrize("mode", ["incremental", "replace"])
+def test_resume_keeps_completed_months(sync, mode):
+    # 初回の同期で全月を転送し、マニフェストを作成
+    sync.sync_drive_to_gcs(mode="incremental")
+    before = manifest_of(sync)
+    raw_before = {n for n in sync.bucket.objects if n.startswith(sync.GCS_RAW_PREFIX)}
+    assert len(before) == 3 and len(raw_before) == 3
+
+    # 202410 のファイルが更新された状態で、202409 を処理済みとして再開
+    sync.files["202410"] = [drive_file("202410", "c.xlsx", md5="v2")]
+    sync.bucket.deleted.clear()
+    results = sync.sync_drive_to_gcs(mode=mode, completed_months=["202409"])
+
+    assert results["months_processed"] == ["202410"]
+    assert sync.bucket.deleted == []
+    assert {n for n in sync.bucket.objects if n.startswith(sync.GCS_RAW_PREFIX)} == raw_before
+    after = manifest_of(sync)
+    assert set(after) == set(before)
+    assert all(after[k] == before[k] for k in before if before[k]["yyyymm"] == "202409")
+    assert after["202410-c.xlsx"]["md5Checksum"] == "v2"
+
+
+def test_resume_claims_job_once(sync):
+    started = []
+    sync._run_sync_job = lambda bucket, job: started.append(job["job_id"])
+
+    job = sync._new_job({"mode": "incremental"})
+    job["status"] = "failed"
+    sync._save_job(sync.bucket, job)
+
+    # 2つのインスタンスが同じ世代のジョブを読み込んで再開しようとした場合
+    first, generation = sync._load_job_for_update(sync.bucket, job["job_id"])
+    second, _ = sync._load_job_for_update(sync.bucket, job["job_id"])
+    assert sync._start_job(sync.bucket, first, if_generation_match=generation)
+    assert not sync._start_job(sync.bucket, second, if_generation_match=generation)
+    assert len(started) == 1
+
+
+class FailingDownload:
+    """2チャンク目で失敗する MediaIoBaseDownload"""
+    def __init__(self, fd, request, chunksize=None):
+        self.fd, self.calls = fd, 0
+
+    def next_chunk(self, num_retries=0):
+        self.calls += 1
+        if self.calls > 1:
+            raise ConnectionError("download interrupted")
+        self.fd.write(b"partial")
+        return None, False
+
+
+def test_failed_download_keeps_raw_file(sync):
+    path = sync._raw_gcs_path("202409", "a")
+    sync.bucket.blob(path).upload_from_string(b"good xlsx")
+    generation = sync.bucket.generations[path]
+    drive = type("Drive", (), {"files": lambda self: type("Files", (), {"get_media": lambda self, **k: None})()})()
+
+    sync.MediaIoBaseDownload = FailingDownload
+    with pytest.raises(ConnectionError):
+        sync._stream_xlsx_to_gcs(drive, sync.bucket, "file-a", path)
+
+    assert sync.bucket.objects[path] == b"good xlsx"
+    assert sync.bucket.generations[path] == generation
+    assert not any(n.startswith(sync.GCS_RAW_TEMP_PREFIX) for n in sync.bucket.objects)
+
+
+def test_changes_renamed_folder_retried_after_failure(changes_sync):
+    sync = changes_sync
+    sync._list_drive_changes = lambda drive, token, drive_id: ([folder_change("202410", "202411")], "token-2")
+    transfer = sync._transfer_file
+
+    def failing_transfer(bucket, df_map, yyyymm, f):
+        raise ConnectionError("transfer failed")
+
+    # 名前変更後の月のファイルの転送に失敗: トークンも月フォルダの対応表も進めない
+    sync._transfer_file = failing_transfer
+    sync.sync_drive_to_gcs(mode="changes")
+    state = changes_state_of(sync)
+    assert state["page_token"] == "token-1"
+    assert state["month_folders"]["202410"] == "202410"
+
+    # 再実行で同じ変更を再処理し、配下のファイルを新しい月として取り直す
+    sync._transfer_file = transfer
+    sync.sync_drive_to_gcs(mode="changes")
+    state = changes_state_of(sync)
+    assert state["page_token"] == "token-2"
+    assert state["month_folders"]["202410"] == "202411"
+    assert manifest_of(sync)["202410-c.xlsx"]["yyyymm"] == "202411"
+
+
+def test_changes_lists_files_of_moved_in_folder(changes_sync):
+    sync = changes_sync
+    # 既存のファイルを含むフォルダを親フォルダ直下へ移動（配下のファイルの変更は通知されない）
+    sync.files["202412"] = [drive_file("202412", "d.xlsx")]
+    sync._list_drive_changes = lambda drive, token, drive_id: ([folder_change("202412", "202412")], "token-2")
+
+    results = sync.sync_drive_to_gcs(mode="changes")
+
+    assert results["months_processed"] == ["202412"]
+    assert manifest_of(sync)["202412-d.xlsx"]["yyyymm"] == "202412"
+    assert sync._raw_gcs_path("202412", "d") in sync.bucket.objects
+    assert changes_state_of(sync)["month_folders"]["202412"] == "202412"
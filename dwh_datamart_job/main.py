@@ -22,7 +22,7 @@ import json
 import logging
 import yaml
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from google.cloud import bigquery
 from google.cloud import storage
 
@@ -406,9 +406,82 @@ def compare_row_counts(bq_client: bigquery.Client, backup_counts: Dict[str, int]
     validation_logger.info(json.dumps(log_entry, ensure_ascii=False))
 
 
+# 重複チェックで返す重複キーのサンプル数（テーブルごと）
+DUPLICATE_SAMPLE_LIMIT = 10
+
+
+def build_duplicate_check_query(targets: Dict[str, List[str]]) -> str:
+    """
+    複数テーブルの重複チェックを1クエリ（UNION ALL）にまとめる
+
+    ユニークキーは TO_JSON_STRING(STRUCT(...)) を FARM_FINGERPRINT でハッシュ化して集計する
+    （NULL を含むキーも1つの値として扱う）。テーブルごとに1行を返す。
+    各サービスのイメージには自身の main.py のみ含まれるため、gcs_to_bq_service と dwh_datamart_job に
+    同じ定義がある。変更する場合は両方を揃えること。
+
+    Args:
+        targets: {テーブルID: ユニークキーのカラム名リスト}
+
+    Returns:
+        table_id, total_rows, unique_keys, duplicate_keys, duplicate_rows,
+        samples（重複キーのJSONと件数、件数の多い順に DUPLICATE_SAMPLE_LIMIT 件）を返すSQL
+    """
+    selects = []
+    for table_id, unique_keys in targets.items():
+        key_struct = ", ".join(f"`{k}`" for k in unique_keys)
+        selects.append(f"""
+    SELECT
+        '{table_id}' AS table_id,
+        COALESCE(SUM(n), 0) AS total_rows,
+        COUNT(*) AS unique_keys,
+        COUNTIF(n > 1) AS duplicate_keys,
+        COALESCE(SUM(n - 1), 0) AS duplicate_rows,
+        ARRAY_AGG(
+            IF(n > 1, STRUCT(key_json, n AS duplicate_count), NULL)
+            IGNORE NULLS ORDER BY n DESC LIMIT {DUPLICATE_SAMPLE_LIMIT}
+        ) AS samples
+    FROM (
+        SELECT FARM_FINGERPRINT(key_json) AS key_hash, ANY_VALUE(key_json) AS key_json, COUNT(*) AS n
+        FROM (SELECT TO_JSON_STRING(STRUCT({key_struct})) AS key_json FROM `{table_id}`)
+        GROUP BY key_hash
+    )""")
+    return "\n    UNION ALL".join(selects)
+
+
+def query_duplicate_rows(
+    bq_client: bigquery.Client,
+    targets: Dict[str, List[str]]
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    重複チェッククエリを実行し、失敗した場合はテーブルごとに再実行
+
+    1テーブルのエラー（カラムの欠落・権限等）で UNION ALL 全体が失敗しても、他のテーブルは検証する。
+
+    Returns:
+        ({テーブルID: クエリ結果の行}, {テーブルID: エラーメッセージ})
+    """
+    if not targets:
+        return {}, {}
+    try:
+        return {row["table_id"]: row for row in bq_client.query(build_duplicate_check_query(targets)).result()}, {}
+    except Exception as e:
+        if len(targets) == 1:
+            return {}, {table_id: str(e) for table_id in targets}
+        print(f"  ⚠️  一括の重複チェッククエリに失敗したためテーブルごとに実行 - {str(e)}")
+
+    rows, errors = {}, {}
+    for table_id, unique_keys in targets.items():
+        try:
+            for row in bq_client.query(build_duplicate_check_query({table_id: unique_keys})).result():
+                rows[table_id] = row
+        except Exception as e:
+            errors[table_id] = str(e)
+    return rows, errors
+
+
 def check_duplicates(bq_client: bigquery.Client) -> Dict[str, Any]:
     """
-    corporate_dataテーブルの重複をチェック
+    corporate_dataテーブルの重複をチェック（全テーブルを1クエリで集計、失敗時はテーブルごと）
 
     Args:
         bq_client: BigQueryクライアント
@@ -430,6 +503,8 @@ def check_duplicates(bq_client: bigquery.Client) -> Dict[str, Any]:
     duplicate_results = []
     has_duplicates = False
 
+    # ユニークキーのカラムが揃っているテーブルを対象にする
+    targets = {}
     for table_name in CORPORATE_DATA_TABLES:
         if table_name not in table_configs:
             print(f"  ⚠️  {table_name}: ユニークキー未定義（スキップ）")
@@ -443,7 +518,6 @@ def check_duplicates(bq_client: bigquery.Client) -> Dict[str, Any]:
             continue
 
         try:
-            # ユニークキーを結合してCONCATで重複チェック
             table_id = f"{PROJECT_ID}.{SOURCE_DATASET}.{table_name}"
 
             # カラムの存在確認
@@ -456,37 +530,7 @@ def check_duplicates(bq_client: bigquery.Client) -> Dict[str, Any]:
                 print(f"  ⚠️  {table_name}: カラム不足 {missing}（スキップ）")
                 continue
 
-            # 重複チェッククエリを生成
-            key_concat = ", '-', ".join([f"CAST({k} AS STRING)" for k in valid_keys])
-            query = f"""
-            SELECT
-                COUNT(*) as total_rows,
-                COUNT(DISTINCT CONCAT({key_concat})) as unique_keys,
-                COUNT(*) - COUNT(DISTINCT CONCAT({key_concat})) as duplicates
-            FROM `{table_id}`
-            """
-
-            result = bq_client.query(query).result()
-            row = list(result)[0]
-
-            total_rows = row.total_rows
-            unique_count = row.unique_keys
-            duplicates = row.duplicates
-
-            result_entry = {
-                "table": table_name,
-                "total_rows": total_rows,
-                "unique_keys": unique_count,
-                "duplicates": duplicates,
-                "unique_key_columns": valid_keys
-            }
-            duplicate_results.append(result_entry)
-
-            if duplicates > 0:
-                has_duplicates = True
-                print(f"  ❌ {table_name}: {total_rows:,}行 / ユニーク{unique_count:,} / 重複{duplicates:,}")
-            else:
-                print(f"  ✅ {table_name}: {total_rows:,}行 / 重複なし")
+            targets[table_id] = valid_keys
 
         except Exception as e:
             print(f"  ✗ {table_name}: チェックエラー - {str(e)}")
@@ -495,6 +539,43 @@ def check_duplicates(bq_client: bigquery.Client) -> Dict[str, Any]:
                 "error": str(e)
             })
 
+    # 重複チェッククエリを実行（1ジョブ）
+    rows, query_errors = query_duplicate_rows(bq_client, targets)
+
+    for table_id, valid_keys in targets.items():
+        table_name = table_id.split(".")[-1]
+        if table_id in query_errors:
+            print(f"  ✗ {table_name}: チェックエラー - {query_errors[table_id]}")
+            duplicate_results.append({
+                "table": table_name,
+                "error": query_errors[table_id]
+            })
+            continue
+        row = rows[table_id]
+        total_rows = row["total_rows"]
+        unique_count = row["unique_keys"]
+        duplicates = row["duplicate_rows"]
+
+        result_entry = {
+            "table": table_name,
+            "total_rows": total_rows,
+            "unique_keys": unique_count,
+            "duplicates": duplicates,
+            "duplicate_keys": row["duplicate_keys"],
+            "unique_key_columns": valid_keys,
+            "sample_duplicates": [
+                {**json.loads(sample["key_json"]), "duplicate_count": sample["duplicate_count"]}
+                for sample in row["samples"] or []
+            ]
+        }
+        duplicate_results.append(result_entry)
+
+        if duplicates > 0:
+            has_duplicates = True
+            print(f"  ❌ {table_name}: {total_rows:,}行 / ユニーク{unique_count:,} / 重複{duplicates:,}")
+        else:
+            print(f"  ✅ {table_name}: {total_rows:,}行 / 重複なし")
+
     # 結果サマリー
     tables_with_duplicates = [r for r in duplicate_results if r.get("duplicates", 0) > 0]
     print(f"\n重複チェック完了: {len(duplicate_results)}テーブル中 {len(tables_with_duplicates)}テーブルに重複あり")
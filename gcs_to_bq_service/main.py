@@ -13,13 +13,19 @@ GCS上のExcelファイルをCSVに変換し、BigQueryにロード
 
 import os
 import io
+import re
+import ast
 import json
+import time
+import uuid
+import threading
 import traceback
 import logging
 import pandas as pd
 import numpy as np
-from datetime import datetime, date
-from typing import Dict, Optional, Any, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, date, timedelta
+from typing import Dict, Optional, Any, List, Tuple, Callable
 
 
 class DateTimeEncoder(json.JSONEncoder):
@@ -33,7 +39,8 @@ class DateTimeEncoder(json.JSONEncoder):
 from flask import Flask, request, jsonify
 from google.cloud import storage
 from google.cloud import bigquery
-from google.cloud.exceptions import GoogleCloudError
+from google.cloud.exceptions import GoogleCloudError, NotFound
+from google.api_core.exceptions import PreconditionFailed
 
 # ============================================================
 # 統一ログ設定
@@ -150,6 +157,11 @@ COLUMNS_PATH = "google-drive/config/columns"
 MAPPING_FILE = "google-drive/config/mapping/mapping_files.csv"
 MONETARY_SCALE_FILE = "google-drive/config/mapping/monetary_scale_conversion.csv"
 ZERO_DATE_FILE = "google-drive/config/mapping/zero_date_to_null.csv"
+LOAD_CONCURRENCY = int(os.environ.get("LOAD_CONCURRENCY", "4"))  # テーブルロードの並列数（1は逐次処理）
+LOAD_STRATEGY = os.environ.get("LOAD_STRATEGY", "swap")  # 単月型テーブルのロード方式: swap（ステージング + 置き換え）/ delete_append（従来方式）
+STAGING_TABLE_EXPIRATION_HOURS = 24  # ステージングテーブルの有効期限（削除漏れの保険）
+PARTITION_INDEX_PREFIX = os.environ.get("PARTITION_INDEX_PREFIX", "manifests/gcs-to-bq/partitions")  # ファイルごとのパーティション索引の保存先
+INCREMENTAL_LOAD_MODES = ["append", "incremental"]  # 指定月のパーティションのみ置き換えるモード
 
 # テーブル定義
 TABLE_CONFIG = {
@@ -269,34 +281,28 @@ SPREADSHEET_UNIQUE_KEYS_CONFIG = {
 
 def validate_table_config_completeness(
     storage_client: storage.Client,
-    target_months: list
+    target_months: list,
+    inventory: Optional["ProceedInventory"] = None
 ) -> Dict[str, Any]:
     """
-    GCSのCSVファイル一覧とTABLE_CONFIGの整合性をチェック
+    GCSのproceedファイル一覧とTABLE_CONFIGの整合性をチェック
 
     TABLE_CONFIGに含まれていないテーブルがある場合、エラーを返す。
     これにより、新規テーブル追加時の設定漏れによる重複データを防止する。
 
+    Args:
+        inventory: proceed/ のファイル一覧（省略時はGCSを一覧取得）
+
     Returns:
         Dict with keys:
         - status: "OK" or "ERROR"
         - missing_tables: TABLE_CONFIGに含まれていないテーブル名のリスト
         - message: 結果メッセージ
     """
-    bucket = storage_client.bucket(LANDING_BUCKET)
+    inventory = inventory or ProceedInventory.from_bucket(storage_client.bucket(LANDING_BUCKET))
 
-    # GCSのproceed/配下の全CSVファイルからテーブル名を抽出
-    gcs_tables = set()
-    for month in target_months:
-        prefix = f"google-drive/proceed/{month}/"
-        blobs = bucket.list_blobs(prefix=prefix)
-        for blob in blobs:
-            if blob.name.endswith(".csv"):
-                # google-drive/proceed/202409/sales_target_and_achievements.csv
-                # → sales_target_and_achievements
-                filename = blob.name.split("/")[-1]
-                table_name = filename.replace(".csv", "")
-                gcs_tables.add(table_name)
+    # GCSのproceed/配下の全ファイル（CSV / Parquet）からテーブル名を抽出
+    gcs_tables = inventory.tables(target_months)
 
     # TABLE_CONFIGに含まれていないテーブルを検出
     missing_tables = gcs_tables - set(TABLE_CONFIG.keys())
@@ -429,84 +435,193 @@ def validate_columns_and_rows(
     return result
 
 
-def validate_duplicates_in_bq(
-    bq_client: bigquery.Client,
-    table_name: str
-) -> Dict[str, Any]:
+# 重複チェックで返す重複キーのサンプル数（テーブルごと）
+DUPLICATE_SAMPLE_LIMIT = 10
+
+
+def build_duplicate_check_query(targets: Dict[str, List[str]]) -> str:
     """
-    BigQueryテーブルの重複をチェック
+    複数テーブルの重複チェックを1クエリ（UNION ALL）にまとめる
+
+    ユニークキーは TO_JSON_STRING(STRUCT(...)) を FARM_FINGERPRINT でハッシュ化して集計する
+    （NULL を含むキーも1つの値として扱う）。テーブルごとに1行を返す。
+    各サービスのイメージには自身の main.py のみ含まれるため、gcs_to_bq_service と dwh_datamart_job に
+    同じ定義がある。変更する場合は両方を揃えること。
 
     Args:
-        bq_client: BigQueryクライアント
-        table_name: テーブル名
+        targets: {テーブルID: ユニークキーのカラム名リスト}
 
     Returns:
-        検証結果の辞書
+        table_id, total_rows, unique_keys, duplicate_keys, duplicate_rows,
+        samples（重複キーのJSONと件数、件数の多い順に DUPLICATE_SAMPLE_LIMIT 件）を返すSQL
     """
-    errors = []
+    selects = []
+    for table_id, unique_keys in targets.items():
+        key_struct = ", ".join(f"`{k}`" for k in unique_keys)
+        selects.append(f"""
+    SELECT
+        '{table_id}' AS table_id,
+        COALESCE(SUM(n), 0) AS total_rows,
+        COUNT(*) AS unique_keys,
+        COUNTIF(n > 1) AS duplicate_keys,
+        COALESCE(SUM(n - 1), 0) AS duplicate_rows,
+        ARRAY_AGG(
+            IF(n > 1, STRUCT(key_json, n AS duplicate_count), NULL)
+            IGNORE NULLS ORDER BY n DESC LIMIT {DUPLICATE_SAMPLE_LIMIT}
+        ) AS samples
+    FROM (
+        SELECT FARM_FINGERPRINT(key_json) AS key_hash, ANY_VALUE(key_json) AS key_json, COUNT(*) AS n
+        FROM (SELECT TO_JSON_STRING(STRUCT({key_struct})) AS key_json FROM `{table_id}`)
+        GROUP BY key_hash
+    )""")
+    return "\n    UNION ALL".join(selects)
+
+
+def query_duplicates(
+    bq_client: bigquery.Client,
+    targets: Dict[str, List[str]]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    複数テーブルの重複を1ジョブで集計
 
-    # ユニークキー定義を取得
-    unique_keys = UNIQUE_KEYS_CONFIG.get(table_name)
-    if not unique_keys:
-        return {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "service": "gcs-to-bq",
-            "validation_type": "duplicate_check",
-            "table_name": table_name,
-            "status": "SKIPPED",
-            "message": "ユニークキーが定義されていません"
+    Returns:
+        {テーブルID: {"total_rows", "unique_keys", "duplicate_keys", "duplicate_rows", "samples"}}
+        samples はユニークキーのカラム名 → 値の辞書に duplicate_count を加えたもの
+    """
+    if not targets:
+        return {}
+    counts = {}
+    for row in bq_client.query(build_duplicate_check_query(targets)).result():
+        counts[row["table_id"]] = {
+            "total_rows": row["total_rows"],
+            "unique_keys": row["unique_keys"],
+            "duplicate_keys": row["duplicate_keys"],
+            "duplicate_rows": row["duplicate_rows"],
+            "samples": [
+                {**json.loads(sample["key_json"]), "duplicate_count": sample["duplicate_count"]}
+                for sample in row["samples"] or []
+            ]
         }
+    return counts
 
-    table_id = f"{PROJECT_ID}.{DATASET_ID}.{table_name}"
-    key_cols = ", ".join(unique_keys)
 
-    # 重複チェッククエリ
-    query = f"""
-    SELECT {key_cols}, COUNT(*) as duplicate_count
-    FROM `{table_id}`
-    GROUP BY {key_cols}
-    HAVING COUNT(*) > 1
-    LIMIT 10
+def query_duplicates_with_fallback(
+    bq_client: bigquery.Client,
+    targets: Dict[str, List[str]]
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
     """
+    query_duplicates を実行し、失敗した場合はテーブルごとに再実行
 
+    1テーブルのエラー（カラムの欠落・権限等）で UNION ALL 全体が失敗しても、他のテーブルは検証する。
+
+    Returns:
+        (query_duplicates の結果, {テーブルID: エラーメッセージ})
+    """
     try:
-        result = bq_client.query(query).result()
-        duplicates = [dict(row) for row in result]
-        duplicate_count = len(duplicates)
+        return query_duplicates(bq_client, targets), {}
+    except Exception as e:
+        if len(targets) <= 1:
+            return {}, {table_id: str(e) for table_id in targets}
+        print(f"⚠️  重複チェックの一括クエリに失敗したためテーブルごとに実行: {e}")
+
+    counts, errors = {}, {}
+    for table_id, unique_keys in targets.items():
+        try:
+            counts.update(query_duplicates(bq_client, {table_id: unique_keys}))
+        except Exception as e:
+            errors[table_id] = str(e)
+    return counts, errors
+
 
-        if duplicate_count > 0:
+def validate_duplicates_batch(
+    bq_client: bigquery.Client,
+    table_names: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    BigQueryテーブル（Drive連携 / スプレッドシート）の重複をまとめてチェック
+
+    ユニークキーは UNIQUE_KEYS_CONFIG / SPREADSHEET_UNIQUE_KEYS_CONFIG から取得し、
+    キーが定義されたテーブルを1クエリで検証する（クエリが失敗した場合のみテーブルごとに再実行）。
+
+    Args:
+        bq_client: BigQueryクライアント
+        table_names: BigQueryテーブル名（スプレッドシートは ss_プレフィックス付き）
+
+    Returns:
+        {テーブル名: 検証結果の辞書}
+    """
+    results = {}
+    targets = {}
+    for table_name in table_names:
+        if table_name in SPREADSHEET_UNIQUE_KEYS_CONFIG:
+            validation_type = "spreadsheet_duplicate_check"
+            unique_keys = SPREADSHEET_UNIQUE_KEYS_CONFIG[table_name]
+        else:
+            validation_type = "duplicate_check"
+            unique_keys = UNIQUE_KEYS_CONFIG.get(table_name)
+        results[table_name] = {
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "service": "gcs-to-bq",
+            "validation_type": validation_type,
+            "table_name": table_name
+        }
+        if unique_keys:
+            targets[f"{PROJECT_ID}.{DATASET_ID}.{table_name}"] = unique_keys
+        else:
+            results[table_name].update({"status": "SKIPPED", "message": "ユニークキーが定義されていません"})
+
+    counts, query_errors = query_duplicates_with_fallback(bq_client, targets)
+
+    for table_id, unique_keys in targets.items():
+        if table_id in query_errors:
+            results[table_id.split(".")[-1]].update({
+                "status": "ERROR",
+                "errors": [{
+                    "type": "QUERY_ERROR",
+                    "message": f"重複チェッククエリ実行エラー: {query_errors[table_id]}"
+                }]
+            })
+            continue
+        table_counts = counts[table_id]
+        duplicates = table_counts["samples"]
+        errors = []
+        if table_counts["duplicate_keys"] > 0:
             errors.append({
                 "type": "DUPLICATE_RECORDS",
-                "message": f"重複レコードが存在します（サンプル: {duplicate_count}件）",
+                "message": f"重複レコードが存在します（重複キー: {table_counts['duplicate_keys']}件, "
+                           f"重複行: {table_counts['duplicate_rows']}行）",
                 "details": {
                     "unique_keys": unique_keys,
                     "sample_duplicates": duplicates
                 }
             })
-
-        return {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "service": "gcs-to-bq",
-            "validation_type": "duplicate_check",
-            "table_name": table_name,
+        results[table_id.split(".")[-1]].update({
             "status": "ERROR" if errors else "OK",
             "unique_keys": unique_keys,
-            "duplicate_sample_count": duplicate_count,
+            "total_rows": table_counts["total_rows"],
+            "duplicate_key_count": table_counts["duplicate_keys"],
+            "duplicate_row_count": table_counts["duplicate_rows"],
+            "duplicate_sample_count": len(duplicates),
             "errors": errors
-        }
+        })
+    return results
 
-    except Exception as e:
-        return {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "service": "gcs-to-bq",
-            "validation_type": "duplicate_check",
-            "table_name": table_name,
-            "status": "ERROR",
-            "errors": [{
-                "type": "QUERY_ERROR",
-                "message": f"重複チェッククエリ実行エラー: {str(e)}"
-            }]
-        }
+
+def validate_duplicates_in_bq(
+    bq_client: bigquery.Client,
+    table_name: str
+) -> Dict[str, Any]:
+    """
+    BigQueryテーブルの重複をチェック（1テーブル分の validate_duplicates_batch）
+
+    Args:
+        bq_client: BigQueryクライアント
+        table_name: テーブル名
+
+    Returns:
+        検証結果の辞書
+    """
+    return validate_duplicates_batch(bq_client, [table_name])[table_name]
 
 
 # ============================================================
@@ -534,6 +649,27 @@ def load_column_mapping(table_name: str) -> Dict[str, Dict[str, str]]:
         }
     return mapping
 
+
+def build_proceed_schema(
+    table_name: str,
+    existing_schema: Optional[List[bigquery.SchemaField]] = None
+) -> List[bigquery.SchemaField]:
+    """
+    config/columns の型からロード用のスキーマを作成（Parquet ロード時に明示指定）
+
+    累積型テーブルの source_folder は config/columns にないため、既存テーブルにあれば追加する
+    """
+    schema = [
+        bigquery.SchemaField(m['en_name'], m['type'])
+        for m in load_column_mapping(table_name).values()
+    ]
+    schema += [f for f in existing_schema or [] if f.name == "source_folder"]
+    return schema
+
+# 日付として無効な値（空文字に変換する）
+ZERO_DATE_STRINGS = ['0000/00/00', '0000-00-00', '00/00/0000', '0', 'NaT']
+
+
 def convert_date_format(value: Any, date_type: str, column_name: str = '') -> str:
     """日付フォーマットの変換"""
     if pd.isna(value) or value == '' or value is None:
@@ -541,11 +677,10 @@ def convert_date_format(value: Any, date_type: str, column_name: str = '') -> st
 
     # 無効な日付値を空文字列に変換
     value_str = str(value)
-    if value_str in ['0000/00/00', '0000-00-00', '00/00/0000', '0', 'NaT']:
+    if value_str in ZERO_DATE_STRINGS:
         return ''
 
     # 誤った形式の日付を修正 (例: "0223/03/25" → "2023/03/25")
-    import re
     match = re.match(r'^0(\d{3})/(\d{2})/(\d{2})$', value_str)
     if match:
         value_str = f"2{match.group(1)}/{match.group(2)}/{match.group(3)}"
@@ -578,7 +713,6 @@ def convert_date_format(value: Any, date_type: str, column_name: str = '') -> st
 
     # 「年月」特殊処理（例: "2025年9月" → "2025-09-01"）
     if '年' in value_str and '月' in value_str:
-        import re
         try:
             match = re.match(r'(\d{4})年(\d{1,2})月', value_str)
             if match:
@@ -591,7 +725,6 @@ def convert_date_format(value: Any, date_type: str, column_name: str = '') -> st
     # DATE型の処理
     if date_type == 'DATE':
         # YYYY/MM形式の場合、1日を追加
-        import re
         if re.match(r'^\d{4}/\d{1,2}$', value_str):
             try:
                 dt = pd.to_datetime(value_str + '/01', format='%Y/%m/%d')
@@ -617,6 +750,109 @@ def convert_date_format(value: Any, date_type: str, column_name: str = '') -> st
 
     return value_str
 
+
+# 列単位で一括変換する日付文字列の形式（正規表現, format）。これ以外の文字列はセル単位で変換する
+# ※ \d は全角数字にも一致し pd.to_datetime の解釈とずれるため [0-9] を使う
+DATE_STRING_FORMATS = [
+    (r'[0-9]{4}-[0-9]{1,2}-[0-9]{1,2}', '%Y-%m-%d'),
+    (r'[0-9]{4}/[0-9]{1,2}/[0-9]{1,2}', '%Y/%m/%d'),
+    (r'[0-9]{4}-[0-9]{1,2}-[0-9]{1,2} [0-9]{1,2}:[0-9]{2}:[0-9]{2}', '%Y-%m-%d %H:%M:%S'),
+    (r'[0-9]{4}/[0-9]{1,2}/[0-9]{1,2} [0-9]{1,2}:[0-9]{2}:[0-9]{2}', '%Y/%m/%d %H:%M:%S'),
+]
+EXCEL_SERIAL_BASE = pd.Timestamp('1899-12-30')
+
+
+def convert_date_series(series: pd.Series, date_type: str, column_name: str = '') -> pd.Series:
+    """
+    日付列を一括変換（convert_date_format を各セルに適用した結果と同一）
+
+    Excelシリアル値・ナノ秒タイムスタンプ・datetime・代表的な日付文字列・
+    「YYYY年M月」・「YYYY/MM」・ゼロ日付・「0223/03/25」形式の修正を列単位の演算で変換し、
+    それ以外（解釈できない値など）のセルのみ convert_date_format にフォールバックする。
+    """
+    out_format = '%Y-%m-%d %H:%M:%S' if date_type == 'DATETIME' else '%Y-%m-%d'
+    values = series.to_numpy(dtype=object)
+    kinds = pd.Series(values, dtype=object).map(type)
+    result = np.full(len(values), None, dtype=object)
+    pending = np.ones(len(values), dtype=bool)
+
+    def resolve(mask: np.ndarray, converted) -> None:
+        """mask 位置のセルに変換結果を反映（None/NaN/NaT は未変換のまま残す）"""
+        positions = np.flatnonzero(mask)
+        converted = np.asarray(converted, dtype=object)
+        ok = pd.notna(converted) & pending[positions]
+        result[positions[ok]] = converted[ok]
+        pending[positions[ok]] = False
+
+    def formatted(timestamps) -> np.ndarray:
+        return pd.DatetimeIndex(timestamps).strftime(out_format).to_numpy(dtype=object)
+
+    # 欠損・空文字
+    str_mask = kinds.eq(str).to_numpy()
+    empty = pd.isna(values)
+    empty[str_mask] |= values[str_mask] == ''
+    resolve(empty, np.full(empty.sum(), ''))
+
+    # 数値: Excelシリアル日付 / Unixタイムスタンプ（ナノ秒）
+    num_mask = pending & kinds.isin([int, float, bool, np.float64]).to_numpy()
+    if num_mask.any():
+        try:
+            numbers = values[num_mask].astype(float)
+        except OverflowError:
+            numbers = None
+        if numbers is not None:
+            serial = (numbers > 0) & (numbers < 100000)
+            days = pd.to_timedelta(np.trunc(np.where(serial, numbers, 0)), unit='D')
+            resolve(num_mask.copy(), np.where(serial, formatted(EXCEL_SERIAL_BASE + days), None))
+
+            nanos = numbers > 1e15
+            if nanos.any():
+                ns_mask = np.zeros(len(values), dtype=bool)
+                ns_mask[np.flatnonzero(num_mask)[nanos]] = True
+                stamps = pd.to_datetime(pd.Series(values[ns_mask], dtype=object), unit='ns', errors='coerce')
+                resolve(ns_mask, np.where(stamps.notna(), formatted(stamps), None))
+
+    # datetime / date オブジェクト
+    dt_mask = pending & kinds.isin([datetime, pd.Timestamp, date]).to_numpy()
+    if dt_mask.any():
+        try:
+            stamps = pd.to_datetime(pd.Series(values[dt_mask], dtype=object), errors='coerce')
+            resolve(dt_mask, np.where(stamps.notna(), formatted(stamps), None))
+        except (ValueError, TypeError):
+            pass  # タイムゾーン混在等はセル単位で変換
+
+    # 文字列
+    str_mask &= pending
+    if str_mask.any():
+        strings = pd.Series(values[str_mask], dtype=object)
+
+        # 無効な日付値は空文字、誤った形式の日付は修正（convert_date_format と同じ順序）
+        resolve(str_mask, np.where(strings.isin(ZERO_DATE_STRINGS), '', None))
+        strings = strings.str.replace(r'^0(\d{3})/(\d{2})/(\d{2})$', r'2\1/\2/\3', regex=True)
+
+        # 年月形式（例: "2025年9月" → "2025-09-01"）
+        ym = strings.str.extract(r'^(\d{4})年(\d{1,2})月')
+        ym_values = ym[0] + '-' + ym[1].str.zfill(2) + '-01'
+        resolve(str_mask, ym_values.where(strings.str.contains('年') & strings.str.contains('月')))
+
+        # YYYY/MM 形式（DATE型のみ、1日を補完）
+        if date_type == 'DATE':
+            year_month = strings.str.fullmatch(r'\d{4}/\d{1,2}')
+            stamps = pd.to_datetime(strings.where(year_month) + '/01', format='%Y/%m/%d', errors='coerce')
+            resolve(str_mask, np.where(stamps.notna(), formatted(stamps), None))
+
+        for pattern, fmt in DATE_STRING_FORMATS:
+            matched = strings.str.fullmatch(pattern).fillna(False)
+            if matched.any():
+                stamps = pd.to_datetime(strings.where(matched), format=fmt, errors='coerce')
+                resolve(str_mask, np.where(stamps.notna(), formatted(stamps), None))
+
+    # 残り（一括変換できなかったセル）はセル単位で変換
+    for position in np.flatnonzero(pending):
+        result[position] = convert_date_format(values[position], date_type, column_name)
+
+    return pd.Series(result, index=series.index, dtype=object)
+
 def apply_data_type_conversion(df: pd.DataFrame, column_mapping: Dict) -> pd.DataFrame:
     """データ型変換を適用"""
     df = df.copy()
@@ -635,7 +871,7 @@ def apply_data_type_conversion(df: pd.DataFrame, column_mapping: Dict) -> pd.Dat
                 else:
                     df[col] = pd.to_datetime(df[col]).dt.strftime('%Y-%m-%d %H:%M:%S')
             else:
-                df[col] = df[col].apply(lambda x: convert_date_format(x, data_type, col))
+                df[col] = convert_date_series(df[col], data_type, col)
 
         # INT64型
         elif data_type == 'INT64':
@@ -668,27 +904,100 @@ def rename_columns(df: pd.DataFrame, column_mapping: Dict) -> pd.DataFrame:
 
     return df.rename(columns=rename_dict)
 
-def load_monetary_scale_config(storage_client: storage.Client) -> pd.DataFrame:
-    """金額単位変換設定を読み込み"""
+def parse_list_literal(text: Any) -> List[Any]:
+    """
+    "['売上高','売上総利益']" 形式の設定値をリストに変換
+
+    eval は使わず、文字列・数値のリテラル（リスト / タプル / 単一値）のみ受け付ける
+    """
+    value = ast.literal_eval(str(text).strip())
+    if isinstance(value, (str, int, float)):
+        value = [value]
+    if not isinstance(value, (list, tuple)) or not all(isinstance(v, (str, int, float)) for v in value):
+        raise ValueError(f"リスト形式ではありません: {text}")
+    return list(value)
+
+class MonetaryRuleSet:
+    """
+    テーブル単位にコンパイルした金額単位変換ルール
+
+    各ルールは (条件列, 条件値, 対象列, 倍率)。条件に一致する行の対象列を倍率倍する。
+    float64 の対象列はまとめて1回の配列演算で変換し、それ以外の型の列は列単位で代入する。
+    """
+
+    def __init__(self, rules: List[Tuple[str, List[Any], List[str], float]]):
+        self.rules = rules
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """DataFrame（英語カラム名に変換済み）を直接更新して返す"""
+        for condition_col, condition_values, object_columns, convert_value in self.rules:
+            # 条件に一致する行をフィルタ
+            if condition_col not in df.columns:
+                print(f"⚠️  条件カラムが存在しません: {condition_col}")
+                continue
+
+            mask = df[condition_col].isin(condition_values).to_numpy()
+            targets = [col for col in object_columns if col in df.columns]
+            for col in object_columns:
+                if col not in df.columns:
+                    print(f"⚠️  変換対象カラムが存在しません: {col}")
+            if not mask.any() or not targets:
+                continue
+
+            # float64 列はまとめて変換、それ以外は条件に一致する行のみ列単位で変換
+            block_columns = [col for col in targets if df[col].dtype == np.float64]
+            if block_columns:
+                block = np.array(df[block_columns], dtype=np.float64)
+                block[mask] *= convert_value
+                df[block_columns] = block
+            for col in targets:
+                if col not in block_columns:
+                    df.loc[mask, col] = pd.to_numeric(df.loc[mask, col], errors='coerce') * convert_value
+            print(f"   💰 {', '.join(targets)} を{convert_value}倍に変換（条件: {condition_col} in {condition_values}）")
+        return df
+
+def compile_monetary_rules(config_df: pd.DataFrame) -> Dict[str, MonetaryRuleSet]:
+    """monetary_scale_conversion.csv の内容をテーブル単位のルールにコンパイル（解析できない行は警告して除外）"""
+    rules: Dict[str, List[Tuple[str, List[Any], List[str], float]]] = {}
+    for _, config in config_df.iterrows():
+        try:
+            rule = (
+                config['condition_column_name'],
+                parse_list_literal(config['condition_column_value']),
+                parse_list_literal(config['object_column_name']),
+                float(config['convert_value'])
+            )
+        except (ValueError, SyntaxError, TypeError) as e:
+            print(f"⚠️  金額変換設定の解析エラー ({config['file_name']}): {e}")
+            continue
+        rules.setdefault(config['file_name'], []).append(rule)
+    return {table_name: MonetaryRuleSet(table_rules) for table_name, table_rules in rules.items()}
+
+# コンパイル済みの金額単位変換ルール（設定ファイルの generation が変わるまでテーブル・月をまたいで再利用）
+_monetary_rules_cache: Dict[str, Any] = {}
+
+def load_monetary_rules(storage_client: storage.Client) -> Dict[str, MonetaryRuleSet]:
+    """金額単位変換設定を読み込み、テーブル単位のルールを返す"""
     try:
         bucket = storage_client.bucket(LANDING_BUCKET)
-        blob = bucket.blob(MONETARY_SCALE_FILE)
+        blob = bucket.get_blob(MONETARY_SCALE_FILE)
 
-        if not blob.exists():
+        if blob is None:
             print(f"⚠️  金額変換設定ファイルが見つかりません: {MONETARY_SCALE_FILE}")
-            return pd.DataFrame()
+            return {}
 
-        csv_data = blob.download_as_bytes()
-        df = pd.read_csv(io.BytesIO(csv_data))
-        return df
+        if _monetary_rules_cache.get("generation") != blob.generation:
+            config_df = pd.read_csv(io.BytesIO(blob.download_as_bytes()))
+            _monetary_rules_cache.update(generation=blob.generation, rules=compile_monetary_rules(config_df))
+        return _monetary_rules_cache["rules"]
     except Exception as e:
         print(f"⚠️  金額変換設定の読み込みエラー: {e}")
-        return pd.DataFrame()
+        return {}
 
 def apply_monetary_scale_conversion(
     df: pd.DataFrame,
     table_name: str,
-    storage_client: storage.Client
+    monetary_rules: Dict[str, MonetaryRuleSet]
 ) -> pd.DataFrame:
     """
     金額単位変換を適用
@@ -696,51 +1005,18 @@ def apply_monetary_scale_conversion(
     Args:
         df: 変換対象のDataFrame（英語カラム名に変換済み）
         table_name: テーブル名
-        storage_client: Storage Client
+        monetary_rules: load_monetary_rules で読み込んだテーブル単位のルール
 
     Returns:
         変換後のDataFrame
     """
-    try:
-        # 金額変換設定を読み込み
-        config_df = load_monetary_scale_config(storage_client)
-
-        if config_df.empty:
-            return df
-
-        # 対象テーブルの設定を取得
-        target_config = config_df[config_df['file_name'] == table_name]
-
-        if target_config.empty:
-            print(f"   金額変換設定なし: {table_name}")
-            return df
-
-        df = df.copy()
-
-        for _, config in target_config.iterrows():
-            condition_col = config['condition_column_name']
-            condition_values = eval(config['condition_column_value'])  # リスト文字列を評価
-            object_columns = eval(config['object_column_name'])  # リスト文字列を評価
-            convert_value = float(config['convert_value'])
-
-            # 条件に一致する行をフィルタ
-            if condition_col not in df.columns:
-                print(f"⚠️  条件カラムが存在しません: {condition_col}")
-                continue
-
-            mask = df[condition_col].isin(condition_values)
-
-            # 対象カラムを変換
-            for col in object_columns:
-                if col in df.columns:
-                    # 条件に一致する行のみ変換
-                    df.loc[mask, col] = pd.to_numeric(df.loc[mask, col], errors='coerce') * convert_value
-                    print(f"   💰 {col} を{convert_value}倍に変換（条件: {condition_col} in {condition_values}）")
-                else:
-                    print(f"⚠️  変換対象カラムが存在しません: {col}")
-
+    rule_set = monetary_rules.get(table_name)
+    if rule_set is None:
+        print(f"   金額変換設定なし: {table_name}")
         return df
 
+    try:
+        return rule_set.apply(df)
     except Exception as e:
         print(f"⚠️  金額変換エラー: {e}")
         traceback.print_exc()
@@ -838,9 +1114,15 @@ def apply_zero_date_to_null_conversion(
 def transform_excel_to_csv(
     storage_client: storage.Client,
     table_name: str,
-    yyyymm: str
+    yyyymm: str,
+    monetary_rules: Optional[Dict[str, MonetaryRuleSet]] = None
 ) -> bool:
-    """Excelファイルを読み込んでCSVに変換"""
+    """
+    Excelファイルを読み込んでCSVに変換
+
+    monetary_rules を省略した場合は金額単位変換設定をその場で読み込む
+    （複数テーブルを処理する場合は呼び出し側で1回だけ読み込んで渡す）
+    """
     try:
         print(f"\n📄 処理中: {table_name}")
 
@@ -914,7 +1196,9 @@ def transform_excel_to_csv(
         df = rename_columns(df, jp_column_mapping)
 
         # 金額単位変換（カラム名変換後に実行）
-        df = apply_monetary_scale_conversion(df, table_name, storage_client)
+        if monetary_rules is None:
+            monetary_rules = load_monetary_rules(storage_client)
+        df = apply_monetary_scale_conversion(df, table_name, monetary_rules)
 
         # ゼロ日付をnullに変換（金額変換後に実行）
         df = apply_zero_date_to_null_conversion(df, table_name, storage_client)
@@ -1084,153 +1368,654 @@ def delete_partition_data(
 
         return True
 
-    except Exception as e:
-        print(f"   ⚠️  削除処理スキップ: {e}")
+    except NotFound:
+        print(f"   ⚠️  テーブルが存在しないため削除処理スキップ: {table_id}")
         return True
 
-def load_csv_batch_to_bigquery(
+    except Exception as e:
+        # 削除できないまま追記すると重複するためロードしない
+        print(f"   ❌ 削除処理エラー: {e}")
+        return False
+
+
+def staging_table_id(table_name: str, execution_id: str) -> str:
+    """実行ごとのステージングテーブルID（同じテーブルの並行実行と衝突しないよう乱数を付ける）"""
+    suffix = re.sub(r'[^0-9A-Za-z_]', '_', execution_id or "")
+    return f"{PROJECT_ID}.{DATASET_ID}.{table_name}__staging_{suffix}_{uuid.uuid4().hex[:8]}"
+
+
+def create_staging_table(bq_client: bigquery.Client, table_name: str, staging_id: str) -> bigquery.Table:
+    """
+    本番テーブルと同じスキーマ・パーティション・クラスタリングのステージングテーブルを作成
+
+    パーティション列・クラスタリング列は TABLE_CONFIG、パーティションの粒度とスキーマ（カラム説明を含む）は
+    既存の本番テーブルに合わせる（本番テーブルがない場合は config/columns のスキーマ・日単位）。
+    """
+    config = TABLE_CONFIG[table_name]
+    try:
+        production = bq_client.get_table(f"{PROJECT_ID}.{DATASET_ID}.{table_name}")
+        schema = production.schema
+        partition_type = (
+            production.time_partitioning.type_ if production.time_partitioning else bigquery.TimePartitioningType.DAY
+        )
+    except NotFound:
+        schema = build_proceed_schema(table_name)
+        partition_type = bigquery.TimePartitioningType.DAY
+
+    table = bigquery.Table(staging_id, schema=schema)
+    table.time_partitioning = bigquery.TimePartitioning(type_=partition_type, field=config["partition_field"])
+    table.clustering_fields = config.get("clustering_fields")
+    table.expires = datetime.utcnow() + timedelta(hours=STAGING_TABLE_EXPIRATION_HOURS)
+    return bq_client.create_table(table)
+
+
+def load_into_staging(
+    bq_client: bigquery.Client,
+    storage_client: storage.Client,
+    table_name: str,
+    target_months: list,
+    staging_id: str,
+    execution_id: str,
+    stats: Dict[str, Any],
+    inventory: Optional["ProceedInventory"] = None
+) -> Optional[int]:
+    """
+    ステージングテーブルを作成して target_months の proceed ファイルをロードし、行数を検証
+
+    Returns:
+        ステージングの行数（ロード失敗・行数がロード行数と一致しない・0件の場合は None）
+    """
+    create_staging_table(bq_client, table_name, staging_id)
+    print(f"   🧪 ステージングテーブル作成: {staging_id}")
+
+    if not load_csv_batch_to_bigquery(
+        bq_client, storage_client, table_name, target_months, execution_id,
+        stats=stats, destination_table_id=staging_id, inventory=inventory
+    ):
+        print(f"   ❌ ステージングへのロードに失敗したため本番テーブルは変更しません")
+        return None
+
+    # 検証: ステージングの行数
+    staged_rows = bq_client.get_table(staging_id).num_rows
+    if not staged_rows or staged_rows != stats.get("rows_added"):
+        message = f"ステージングの行数が不正です（テーブル: {staged_rows}行, ロード: {stats.get('rows_added')}行）"
+        print(f"   ❌ {message}。本番テーブルは変更しません")
+        log_pipeline_event(
+            action="load_table_swap",
+            status="ERROR",
+            message=f"テーブル {table_name} の{message}",
+            table_name=table_name,
+            details={"staging_table": staging_id, "staged_rows": staged_rows, "rows_added": stats.get("rows_added")},
+            execution_id=execution_id
+        )
+        return None
+    return staged_rows
+
+
+def load_table_via_staging(
     bq_client: bigquery.Client,
     storage_client: storage.Client,
     table_name: str,
     target_months: list,
     execution_id: str = None,
-    max_retries: int = 3
+    stats: Optional[Dict[str, Any]] = None,
+    inventory: Optional["ProceedInventory"] = None
 ) -> bool:
     """
-    複数月のCSVファイルを一括でBigQueryにロード（レート制限対策）
+    ステージングテーブルにロード・検証してから本番テーブルを置き換え（単月型テーブル）
 
-    Args:
-        bq_client: BigQueryクライアント
-        storage_client: GCSクライアント
-        table_name: テーブル名
-        target_months: 対象年月リスト
-        execution_id: 実行ID
-        max_retries: 最大リトライ回数
+    1. 本番と同じパーティション・クラスタリングのステージングテーブルを作成
+    2. 全年月の proceed ファイルをステージングにロード
+    3. ステージングの行数がロード行数と一致し、0件でないことを確認
+    4. コピージョブ（WRITE_TRUNCATE）で本番テーブルを置き換え
+
+    DELETE（DML）が不要になり、置き換えはコピージョブ1回で行われるため本番テーブルが空になる時間がない。
+    ロード・検証に失敗した場合は本番テーブルに手を付けない。
 
     Returns:
         成功時True
     """
-    import time
+    table_id = f"{PROJECT_ID}.{DATASET_ID}.{table_name}"
+    exec_id = execution_id or get_execution_id()
+    staging_id = staging_table_id(table_name, exec_id)
+    stats = stats if stats is not None else {}
+
+    try:
+        staged_rows = load_into_staging(
+            bq_client, storage_client, table_name, target_months, staging_id, exec_id, stats, inventory
+        )
+        if staged_rows is None:
+            return False
+
+        # 本番テーブルを置き換え
+        copy_job = bq_client.copy_table(
+            staging_id,
+            table_id,
+            job_config=bigquery.CopyJobConfig(write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE)
+        )
+        copy_job.result(timeout=600)
+        print(f"   🔁 本番テーブルを置き換え: {staged_rows:,} 行")
+
+        log_pipeline_event(
+            action="load_table_swap",
+            status="OK",
+            message=f"テーブル {table_name} をステージングから置き換え",
+            table_name=table_name,
+            details={"staging_table": staging_id, "rows": staged_rows, "copy_job_id": copy_job.job_id},
+            execution_id=exec_id
+        )
+        return True
+
+    except Exception as e:
+        print(f"   ❌ ステージング経由のロードでエラー: {e}")
+        log_pipeline_event(
+            action="load_table_swap",
+            status="ERROR",
+            message=f"テーブル {table_name} のステージング経由のロードに失敗",
+            table_name=table_name,
+            details={"staging_table": staging_id, "error": str(e)},
+            execution_id=exec_id
+        )
+        return False
+
+    finally:
+        drop_staging_table(bq_client, staging_id)
+
+
+def drop_staging_table(bq_client: bigquery.Client, staging_id: str) -> None:
+    """ステージングテーブルを削除（失敗しても有効期限で自動削除される）"""
+    try:
+        bq_client.delete_table(staging_id, not_found_ok=True)
+    except Exception as e:
+        print(f"   ⚠️  ステージングテーブルの削除に失敗（{STAGING_TABLE_EXPIRATION_HOURS}時間後に自動削除）: {e}")
+
+
+# ============================================================
+# 月単位の差分ロード（パーティション単位の置き換え）
+# ============================================================
+# 指定月の proceed ファイルに含まれるパーティションのみを置き換える。
+# 累積型のファイル（各月のファイルが全期間を含む）もあるため、置き換えるパーティションに
+# 1行でもデータを持つファイルは月に関わらず全てステージングにロードし、パーティションを丸ごと作り直す。
+# ファイルごとのパーティション列の値は索引（PARTITION_INDEX_PREFIX/<table>.json）に保存し、
+# 世代が変わったファイルのみ読み直す。索引は全パーティションの置き換えが成功した後にのみ保存する
+# （途中で失敗した場合は次回も前回の内容を基に置き換え対象を求める）。
+
+def read_partition_days(bucket, path: str, fmt: str, partition_field: str) -> List[str]:
+    """proceed ファイルのパーティション列の値（日単位 YYYYMMDD、NULL は __NULL__）"""
+    data = bucket.blob(path).download_as_bytes()
+    if fmt == "parquet":
+        values = pd.read_parquet(io.BytesIO(data), columns=[partition_field])[partition_field]
+    else:
+        values = pd.read_csv(io.BytesIO(data), usecols=[partition_field])[partition_field]
+    days = pd.to_datetime(values, errors="coerce")
+    result = sorted(days.dropna().dt.strftime("%Y%m%d").unique())
+    if days.isna().any():
+        result.append("__NULL__")
+    return result
+
+
+def build_partition_index(
+    bucket,
+    table_name: str,
+    months: List[str],
+    inventory: "ProceedInventory"
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """
+    proceed ファイルごとのパーティション（日単位）の索引を作成（保存はしない）
+
+    Returns:
+        (現在の索引, 保存済みの索引)。いずれも {GCSパス: {"generation": 世代, "partitions": [YYYYMMDD / __NULL__]}}
+    """
+    index_blob = bucket.blob(f"{PARTITION_INDEX_PREFIX}/{table_name}.json")
+    previous = json.loads(index_blob.download_as_text()).get("files", {}) if index_blob.exists() else {}
+    partition_field = TABLE_CONFIG[table_name]["partition_field"]
+
+    files = {}
+    for yyyymm in months:
+        found = inventory.find(yyyymm, table_name)
+        if not found:
+            continue
+        path, fmt = found
+        generation = inventory.blobs[path]["generation"]
+        entry = previous.get(path)
+        if entry and entry.get("generation") == generation:
+            files[path] = entry
+        else:
+            files[path] = {"generation": generation, "partitions": read_partition_days(bucket, path, fmt, partition_field)}
+
+    return files, previous
+
+
+def save_partition_index(bucket, table_name: str, files: Dict[str, Dict[str, Any]]) -> None:
+    """build_partition_index で作成した索引を保存"""
+    bucket.blob(f"{PARTITION_INDEX_PREFIX}/{table_name}.json").upload_from_string(
+        json.dumps({
+            "table": table_name,
+            "partition_field": TABLE_CONFIG[table_name]["partition_field"],
+            "updated_at": datetime.utcnow().isoformat() + "Z",
+            "files": files
+        }, ensure_ascii=False),
+        content_type="application/json"
+    )
+
+
+def partition_id(day: str, partition_type: str) -> str:
+    """日単位のパーティション値（YYYYMMDD / __NULL__）をテーブルのパーティション粒度のIDに変換"""
+    if day == "__NULL__":
+        return day
+    return {"MONTH": day[:6], "YEAR": day[:4]}.get(partition_type, day)
+
+
+def load_table_partitions(
+    bq_client: bigquery.Client,
+    storage_client: storage.Client,
+    table_name: str,
+    load_months: List[str],
+    available_months: List[str],
+    execution_id: str = None,
+    stats: Optional[Dict[str, Any]] = None,
+    inventory: Optional["ProceedInventory"] = None
+) -> bool:
+    """
+    指定月のファイルが含むパーティションのみを置き換え（月単位の差分ロード）
+
+    1. 指定月のファイルのパーティション（前回ロード時のファイルの内容も含む）を求める
+    2. それらのパーティションにデータを持つファイル（全月）をステージングにロード・検証
+    3. パーティションデコレータ（table$YYYYMM 等）を指定したコピージョブ（WRITE_TRUNCATE）で
+       パーティションごとに置き換え、データがなくなったパーティションは削除
+
+    本番テーブルがない・パーティション分割されていない場合は全月を load_table_via_staging でロードする。
 
+    Returns:
+        成功時True
+    """
     table_id = f"{PROJECT_ID}.{DATASET_ID}.{table_name}"
     exec_id = execution_id or get_execution_id()
+    stats = stats if stats is not None else {}
     bucket = storage_client.bucket(LANDING_BUCKET)
 
-    # 存在するCSVファイルのURIリストを作成
-    gcs_uris = []
-    for yyyymm in target_months:
-        blob = bucket.blob(f"google-drive/proceed/{yyyymm}/{table_name}.csv")
-        if blob.exists():
-            gcs_uris.append(f"gs://{LANDING_BUCKET}/google-drive/proceed/{yyyymm}/{table_name}.csv")
-            print(f"   📁 {yyyymm}: ファイル確認OK")
+    try:
+        production = bq_client.get_table(table_id)
+        partition_type = production.time_partitioning.type_ if production.time_partitioning else None
+    except NotFound:
+        partition_type = None
+    if not partition_type:
+        print(f"   ⚠️  パーティション分割された本番テーブルがないため全月をロード")
+        return load_table_via_staging(
+            bq_client, storage_client, table_name, available_months, exec_id, stats, inventory
+        )
 
-    if not gcs_uris:
-        print(f"   ⚠️  CSVファイルが見つかりません")
+    inventory = inventory or ProceedInventory.from_bucket(bucket)
+    index, saved_index = build_partition_index(bucket, table_name, available_months, inventory)
+    current = {path: entry["partitions"] for path, entry in index.items()}
+    previous = {path: entry["partitions"] for path, entry in saved_index.items()}
+
+    # 指定月のファイルが含むパーティション（前回の内容も含め、なくなったパーティションも置き換え対象にする）
+    month_prefixes = tuple(f"google-drive/proceed/{m}/" for m in load_months)
+    affected = {
+        partition_id(day, partition_type)
+        for files in (previous, current)
+        for path, days in files.items() if path.startswith(month_prefixes)
+        for day in days
+    }
+    if not affected:
+        print(f"   ⚠️  proceedファイルが見つかりません: {', '.join(load_months)}")
         return False
 
-    print(f"   📊 一括ロード対象: {len(gcs_uris)}ファイル")
-
-    # リトライロジック付きでロード
-    for attempt in range(max_retries):
-        try:
-            job_config = bigquery.LoadJobConfig(
-                source_format=bigquery.SourceFormat.CSV,
-                skip_leading_rows=1,
-                autodetect=False,
-                write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
-                schema_update_options=[
-                    bigquery.SchemaUpdateOption.ALLOW_FIELD_ADDITION,
-                ],
-                allow_quoted_newlines=True,
-                allow_jagged_rows=False,
-                ignore_unknown_values=False,
-                max_bad_records=0,
+    # 置き換えるパーティションにデータを持つファイル（全月）
+    source_months = sorted({
+        path.split("/")[2]
+        for path, days in current.items()
+        if affected & {partition_id(day, partition_type) for day in days}
+    })
+    filled = {
+        partition_id(day, partition_type)
+        for path, days in current.items() if path.split("/")[2] in source_months
+        for day in days
+    } & affected
+    print(f"   🧩 差分ロード: パーティション {len(affected)}件（ロード対象: {', '.join(source_months) or 'なし'}）")
+
+    staging_id = staging_table_id(table_name, exec_id)
+    try:
+        if source_months:
+            staged_rows = load_into_staging(
+                bq_client, storage_client, table_name, source_months, staging_id, exec_id, stats, inventory
             )
+            if staged_rows is None:
+                return False
+        else:
+            stats["rows_added"] = 0
+
+        copy_config = bigquery.CopyJobConfig(write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE)
+        for partition in sorted(affected):
+            if partition in filled:
+                bq_client.copy_table(
+                    f"{staging_id}${partition}", f"{table_id}${partition}", job_config=copy_config
+                ).result(timeout=600)
+            else:
+                bq_client.delete_table(f"{table_id}${partition}", not_found_ok=True)
+        print(f"   🔁 パーティションを置き換え: {len(filled)}件（削除: {len(affected - filled)}件）")
 
-            # 複数URIを一括でロード
-            load_job = bq_client.load_table_from_uri(
-                gcs_uris,  # リストで渡す
-                table_id,
-                job_config=job_config
-            )
+        # 全パーティションの置き換えが成功してから索引を保存
+        if index != saved_index:
+            save_partition_index(bucket, table_name, index)
+
+        log_pipeline_event(
+            action="load_table_partitions",
+            status="OK",
+            message=f"テーブル {table_name} の指定月のパーティションを置き換え",
+            table_name=table_name,
+            details={
+                "load_months": load_months,
+                "source_months": source_months,
+                "partitions": sorted(affected),
+                "deleted_partitions": sorted(affected - filled),
+                "rows_added": stats.get("rows_added", 0)
+            },
+            execution_id=exec_id
+        )
+        return True
+
+    except Exception as e:
+        print(f"   ❌ パーティション単位のロードでエラー: {e}")
+        log_pipeline_event(
+            action="load_table_partitions",
+            status="ERROR",
+            message=f"テーブル {table_name} のパーティション単位のロードに失敗",
+            table_name=table_name,
+            details={"load_months": load_months, "partitions": sorted(affected), "error": str(e)},
+            execution_id=exec_id
+        )
+        return False
+
+    finally:
+        drop_staging_table(bq_client, staging_id)
+
+
+# proceed/ のファイル形式（raw_to_proceed_service の PROCEED_FORMAT で切り替え）
+# 同じ月に両方ある場合は Parquet を優先する
+PROCEED_FORMATS = ["parquet", "csv"]
+
+
+class ProceedInventory:
+    """
+    proceed/ 配下のファイル一覧（google-drive/proceed/ の list_blobs 1回で作成）
+
+    年月の一覧・TABLE_CONFIG整合性チェック・ロード対象ファイルの検索で共有し、
+    月ごと・テーブルごとにGCSへ問い合わせない。
+    """
+
+    def __init__(self, blobs: Dict[str, Dict[str, Any]]):
+        # {GCSパス: {"yyyymm", "table", "format", "size", "md5_hash", "generation", "updated"}}
+        self.blobs = blobs
+        self.files: Dict[Tuple[str, str], Dict[str, str]] = {}
+        for path, meta in blobs.items():
+            self.files.setdefault((meta["yyyymm"], meta["table"]), {})[meta["format"]] = path
+
+    @classmethod
+    def from_bucket(cls, bucket) -> "ProceedInventory":
+        blobs = {}
+        for blob in bucket.list_blobs(prefix="google-drive/proceed/"):
+            # google-drive/proceed/202409/sales_target_and_achievements.csv（または .parquet）
+            parts = blob.name.split("/")
+            if len(parts) != 4:
+                continue
+            table_name, _, extension = parts[3].rpartition(".")
+            if extension not in PROCEED_FORMATS:
+                continue
+            blobs[blob.name] = {
+                "yyyymm": parts[2],
+                "table": table_name,
+                "format": extension,
+                "size": blob.size,
+                "md5_hash": blob.md5_hash,
+                "generation": blob.generation,
+                "updated": blob.updated.isoformat() if blob.updated else None
+            }
+        return cls(blobs)
+
+    def months(self) -> List[str]:
+        """ファイルがある年月（YYYYMMのフォルダのみ）"""
+        return sorted({yyyymm for yyyymm, _ in self.files if yyyymm.isdigit() and len(yyyymm) == 6})
+
+    def tables(self, months: List[str]) -> set:
+        """指定年月にファイルがあるテーブル名"""
+        months = set(months)
+        return {table_name for yyyymm, table_name in self.files if yyyymm in months}
+
+    def find(self, yyyymm: str, table_name: str) -> Optional[Tuple[str, str]]:
+        """(GCSパス, 形式) または None（同じ月に両方ある場合は Parquet を優先）"""
+        paths = self.files.get((yyyymm, table_name), {})
+        for fmt in PROCEED_FORMATS:
+            if fmt in paths:
+                return paths[fmt], fmt
+        return None
+
+
+def find_proceed_file(
+    bucket,
+    yyyymm: str,
+    table_name: str,
+    inventory: Optional[ProceedInventory] = None
+) -> Optional[Tuple[str, str]]:
+    """
+    proceed/ のテーブルファイルを検索（inventory 指定時はGCSに問い合わせない）
+
+    Returns:
+        (GCSパス, 形式) または None
+    """
+    if inventory:
+        return inventory.find(yyyymm, table_name)
+    prefix = f"google-drive/proceed/{yyyymm}/{table_name}."
+    names = {blob.name for blob in bucket.list_blobs(prefix=prefix)}
+    for fmt in PROCEED_FORMATS:
+        if prefix + fmt in names:
+            return prefix + fmt, fmt
+    return None
+
+
+def read_proceed_file(bucket, path: str, fmt: str) -> pd.DataFrame:
+    """proceed/ のファイルをDataFrameとして読み込み"""
+    data = bucket.blob(path).download_as_bytes()
+    if fmt == "parquet":
+        return pd.read_parquet(io.BytesIO(data))
+    return pd.read_csv(io.BytesIO(data))
+
+
+def build_load_job_config(
+    source_format: str,
+    table_name: str,
+    existing_schema: Optional[List[bigquery.SchemaField]] = None
+) -> bigquery.LoadJobConfig:
+    """
+    proceed/ ファイル形式ごとのロード設定
+
+    CSV は既存テーブルのスキーマに従って文字列をパースする。
+    Parquet は config/columns の型で明示したスキーマでロードする（型付きのため改行・引用符の考慮は不要）。
+    """
+    common = dict(
+        autodetect=False,
+        write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+        schema_update_options=[
+            bigquery.SchemaUpdateOption.ALLOW_FIELD_ADDITION,
+        ],
+        ignore_unknown_values=False,
+        max_bad_records=0,
+    )
+    if source_format == "parquet":
+        return bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.PARQUET,
+            schema=build_proceed_schema(table_name, existing_schema),
+            **common,
+        )
+    return bigquery.LoadJobConfig(
+        source_format=bigquery.SourceFormat.CSV,
+        skip_leading_rows=1,
+        allow_quoted_newlines=True,
+        allow_jagged_rows=False,
+        **common,
+    )
+
+
+def load_csv_batch_to_bigquery(
+    bq_client: bigquery.Client,
+    storage_client: storage.Client,
+    table_name: str,
+    target_months: list,
+    execution_id: str = None,
+    max_retries: int = 3,
+    stats: Optional[Dict[str, Any]] = None,
+    destination_table_id: Optional[str] = None,
+    inventory: Optional[ProceedInventory] = None
+) -> bool:
+    """
+    複数月のproceedファイル（CSV / Parquet）を一括でBigQueryにロード（レート制限対策）
+
+    形式ごとに1ジョブでロードする（テーブル単位で形式を切り替え中の場合は CSV・Parquet の2ジョブ）。
+
+    Args:
+        bq_client: BigQueryクライアント
+        storage_client: GCSクライアント
+        table_name: テーブル名
+        target_months: 対象年月リスト
+        execution_id: 実行ID
+        max_retries: 最大リトライ回数
+        stats: 指定時はロード行数（rows_added）を格納する
+        destination_table_id: ロード先（省略時は本番テーブル。ステージングテーブルへのロードに使う）
+        inventory: proceed/ のファイル一覧（省略時は年月ごとにGCSを検索）
+
+    Returns:
+        成功時True
+    """
+    import time
 
-            print(f"   ⏳ 一括ロード開始: {table_name} (Job ID: {load_job.job_id})")
+    table_id = destination_table_id or f"{PROJECT_ID}.{DATASET_ID}.{table_name}"
+    exec_id = execution_id or get_execution_id()
+    bucket = storage_client.bucket(LANDING_BUCKET)
 
-            load_job.result(timeout=600)  # 複数ファイルなのでタイムアウトを延長
+    # 存在するファイルのURIリストを形式ごとに作成
+    gcs_uris_by_format: Dict[str, List[str]] = {}
+    for yyyymm in target_months:
+        found = find_proceed_file(bucket, yyyymm, table_name, inventory)
+        if found:
+            path, fmt = found
+            gcs_uris_by_format.setdefault(fmt, []).append(f"gs://{LANDING_BUCKET}/{path}")
+            print(f"   📁 {yyyymm}: ファイル確認OK（{fmt}）")
+
+    if not gcs_uris_by_format:
+        print(f"   ⚠️  proceedファイルが見つかりません")
+        return False
 
-            destination_table = bq_client.get_table(table_id)
-            print(f"   ✅ ロード完了: {load_job.output_rows} 行を追加")
-            print(f"      総レコード数: {destination_table.num_rows:,} 行")
+    file_count = sum(len(uris) for uris in gcs_uris_by_format.values())
+    print(f"   📊 一括ロード対象: {file_count}ファイル")
 
-            # 統一ログ出力
-            log_pipeline_event(
-                action="load_table_batch",
-                status="OK",
-                message=f"テーブル {table_name} の一括ロード完了",
-                table_name=table_name,
-                details={
-                    "target_months": target_months,
-                    "file_count": len(gcs_uris),
-                    "rows_added": load_job.output_rows,
-                    "total_rows": destination_table.num_rows
-                },
-                execution_id=exec_id
-            )
+    existing_schema = None
+    if "parquet" in gcs_uris_by_format:
+        try:
+            existing_schema = bq_client.get_table(table_id).schema
+        except NotFound:
+            pass
 
-            return True
+    rows_added = 0
+    for source_format, gcs_uris in gcs_uris_by_format.items():
+        # リトライロジック付きでロード
+        for attempt in range(max_retries):
+            try:
+                job_config = build_load_job_config(source_format, table_name, existing_schema)
 
-        except GoogleCloudError as e:
-            error_str = str(e)
+                # 複数URIを一括でロード
+                load_job = bq_client.load_table_from_uri(
+                    gcs_uris,  # リストで渡す
+                    table_id,
+                    job_config=job_config
+                )
 
-            # ファイルが存在しない場合はスキップ
-            if "Not found" in error_str or "notFound" in error_str:
-                print(f"   ⚠️  一部ファイルが存在しないためスキップ")
+                print(f"   ⏳ 一括ロード開始: {table_name} [{source_format}] (Job ID: {load_job.job_id})")
+
+                load_job.result(timeout=600)  # 複数ファイルなのでタイムアウトを延長
+
+                print(f"   ✅ ロード完了: {load_job.output_rows} 行を追加")
+                rows_added += load_job.output_rows or 0
+                break
+
+            except GoogleCloudError as e:
+                error_str = str(e)
+
+                # ファイルが存在しない場合はスキップ
+                if "Not found" in error_str or "notFound" in error_str:
+                    print(f"   ⚠️  一部ファイルが存在しないためスキップ")
+                    return False
+
+                # レート制限エラーの場合はリトライ
+                if "rate limit" in error_str.lower() or "exceeded" in error_str.lower():
+                    wait_time = (2 ** attempt) * 5  # 5, 10, 20秒
+                    print(f"   ⚠️  レート制限エラー: {wait_time}秒後にリトライ ({attempt + 1}/{max_retries})")
+                    time.sleep(wait_time)
+                    continue
+
+                # その他のエラー
+                print(f"   ❌ ロードエラー: {e}")
+                if hasattr(e, 'errors') and e.errors:
+                    for error in e.errors:
+                        print(f"      詳細: {error}")
+
+                log_pipeline_event(
+                    action="load_table_batch",
+                    status="ERROR",
+                    message=f"テーブル {table_name} の一括ロードに失敗",
+                    table_name=table_name,
+                    details={
+                        "target_months": target_months,
+                        "source_format": source_format,
+                        "error": str(e)
+                    },
+                    execution_id=exec_id
+                )
                 return False
 
-            # レート制限エラーの場合はリトライ
-            if "rate limit" in error_str.lower() or "exceeded" in error_str.lower():
-                wait_time = (2 ** attempt) * 5  # 5, 10, 20秒
-                print(f"   ⚠️  レート制限エラー: {wait_time}秒後にリトライ ({attempt + 1}/{max_retries})")
-                time.sleep(wait_time)
-                continue
+            except Exception as e:
+                print(f"   ❌ 予期しないエラー: {e}")
+                log_pipeline_event(
+                    action="load_table_batch",
+                    status="ERROR",
+                    message=f"テーブル {table_name} の一括ロードで予期しないエラー",
+                    table_name=table_name,
+                    details={
+                        "target_months": target_months,
+                        "source_format": source_format,
+                        "error": str(e)
+                    },
+                    execution_id=exec_id
+                )
+                return False
+        else:
+            # リトライ上限到達
+            print(f"   ❌ リトライ上限に到達: {table_name}")
+            return False
 
-            # その他のエラー
-            print(f"   ❌ ロードエラー: {e}")
-            if hasattr(e, 'errors') and e.errors:
-                for error in e.errors:
-                    print(f"      詳細: {error}")
+    destination_table = bq_client.get_table(table_id)
+    print(f"      総レコード数: {destination_table.num_rows:,} 行")
 
-            log_pipeline_event(
-                action="load_table_batch",
-                status="ERROR",
-                message=f"テーブル {table_name} の一括ロードに失敗",
-                table_name=table_name,
-                details={
-                    "target_months": target_months,
-                    "error": str(e)
-                },
-                execution_id=exec_id
-            )
-            return False
+    # 統一ログ出力
+    log_pipeline_event(
+        action="load_table_batch",
+        status="OK",
+        message=f"テーブル {table_name} の一括ロード完了",
+        table_name=table_name,
+        details={
+            "target_months": target_months,
+            "file_count": file_count,
+            "source_formats": sorted(gcs_uris_by_format),
+            "rows_added": rows_added,
+            "total_rows": destination_table.num_rows
+        },
+        execution_id=exec_id
+    )
 
-        except Exception as e:
-            print(f"   ❌ 予期しないエラー: {e}")
-            log_pipeline_event(
-                action="load_table_batch",
-                status="ERROR",
-                message=f"テーブル {table_name} の一括ロードで予期しないエラー",
-                table_name=table_name,
-                details={
-                    "target_months": target_months,
-                    "error": str(e)
-                },
-                execution_id=exec_id
-            )
-            return False
+    if stats is not None:
+        stats["rows_added"] = rows_added
 
-    # リトライ上限到達
-    print(f"   ❌ リトライ上限に到達: {table_name}")
-    return False
+    return True
 
 
 def load_csv_to_bigquery(
@@ -1352,7 +2137,8 @@ def process_cumulative_table(
     storage_client: storage.Client,
     table_name: str,
     target_months: list,
-    execution_id: str = None
+    execution_id: str = None,
+    inventory: Optional[ProceedInventory] = None
 ) -> bool:
     """
     累積型テーブルのロード処理
@@ -1366,6 +2152,7 @@ def process_cumulative_table(
         table_name: テーブル名
         target_months: 対象年月リスト
         execution_id: 実行ID（オプション）
+        inventory: proceed/ のファイル一覧（オプション）
 
     Returns:
         成功時True
@@ -1377,13 +2164,12 @@ def process_cumulative_table(
     unique_keys = config["unique_keys"]
     bucket = storage_client.bucket(LANDING_BUCKET)
 
-    # 全月のCSVを読み込み、source_folderカラムを追加
+    # 全月のファイル（CSV / Parquet）を読み込み、source_folderカラムを追加
     all_dfs = []
     for yyyymm in target_months:
-        blob = bucket.blob(f"google-drive/proceed/{yyyymm}/{table_name}.csv")
-        if blob.exists():
-            csv_content = blob.download_as_string().decode("utf-8")
-            df = pd.read_csv(io.StringIO(csv_content))
+        found = find_proceed_file(bucket, yyyymm, table_name, inventory)
+        if found:
+            df = read_proceed_file(bucket, *found)
             df["source_folder"] = int(yyyymm)
             all_dfs.append(df)
             print(f"   📁 {yyyymm}: {len(df)}行")
@@ -1491,6 +2277,136 @@ def process_cumulative_table(
         return False
 
 
+# ============================================================
+# テーブル単位のロード（並列実行）
+# ============================================================
+# テーブルごとの処理（削除 → ロード → 説明更新 → 重複チェック）は互いに独立しているため、
+# BigQuery ジョブの待ち時間が重なるようスレッドで並列に実行する。
+# レート制限エラーは load_csv_batch_to_bigquery のリトライで吸収する。
+
+def run_load_tasks(
+    tasks: List[Callable[[], Dict[str, Any]]],
+    concurrency: int,
+    on_done: Optional[Callable[[int, Dict[str, Any]], None]] = None
+) -> List[Dict[str, Any]]:
+    """
+    テーブル単位のロード処理を最大 concurrency 件ずつ並列実行
+
+    Args:
+        tasks: テーブル1件分のロード処理（結果の辞書を返す）
+        concurrency: 並列数（1以下は逐次処理）
+        on_done: 完了した順に (tasks のインデックス, 結果) で呼ばれる（進捗記録用）
+
+    Returns:
+        tasks と同じ順序の結果リスト
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(tasks)
+    if concurrency <= 1 or len(tasks) <= 1:
+        for i, task in enumerate(tasks):
+            results[i] = task()
+            if on_done:
+                on_done(i, results[i])
+        return results
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {executor.submit(task): i for i, task in enumerate(tasks)}
+        for future in as_completed(futures):
+            i = futures[future]
+            results[i] = future.result()
+            if on_done:
+                on_done(i, results[i])
+    return results
+
+
+def print_duplicate_check_result(dup_result: Dict[str, Any]) -> None:
+    """重複チェック結果を出力"""
+    table_name = dup_result.get("table_name")
+    if dup_result.get("status") == "ERROR":
+        for error in dup_result.get("errors", []):
+            print(f"   ⚠️  {table_name}: 重複チェックエラー: {error.get('message')}")
+    elif dup_result.get("status") == "SKIPPED":
+        print(f"   ⏭️  {table_name}: 重複チェックスキップ: ユニークキー未定義")
+    else:
+        print(f"   ✅ {table_name}: バリデーションOK: 重複チェック passed")
+
+
+def run_duplicate_validation(bq_client: bigquery.Client, table_names: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    ロード済みテーブルの重複チェックを1クエリで実行し、テーブルごとに結果をログ出力
+
+    Returns:
+        {テーブル名: 検証結果の辞書}
+    """
+    if not table_names:
+        return {}
+    print(f"\n🔍 重複チェック: {len(table_names)}テーブル（1クエリ）")
+    dup_results = validate_duplicates_batch(bq_client, table_names)
+    for dup_result in dup_results.values():
+        log_validation_result(dup_result)
+        print_duplicate_check_result(dup_result)
+    return dup_results
+
+
+def load_drive_table(
+    bq_client: bigquery.Client,
+    storage_client: storage.Client,
+    table_name: str,
+    target_months: list,
+    execution_id: str,
+    load_months: Optional[List[str]] = None,
+    inventory: Optional[ProceedInventory] = None
+) -> Dict[str, Any]:
+    """
+    Drive連携テーブル1件のロード（累積型 / 単月型のロード → 説明更新）
+
+    重複チェックは全テーブルのロード後に run_duplicate_validation でまとめて行う。
+
+    load_months 指定時、単月型テーブルは指定月のファイルが含むパーティションのみを置き換える。
+
+    Returns:
+        {"table", "status": success/error, "rows_added"}
+    """
+    table_stats = {}
+
+    # 累積型テーブルかどうかで処理を分岐
+    if table_name in CUMULATIVE_TABLE_CONFIG:
+        # 累積型テーブル: 専用処理（source_folder追加、重複除去）
+        table_success = process_cumulative_table(
+            bq_client, storage_client, table_name, target_months, execution_id, inventory
+        )
+    else:
+        # 単月型テーブル: 全年月のファイルを一括ロード（レート制限対策）
+        print(f"\n📊 処理中（単月型）: {table_name}")
+
+        if load_months:
+            # 指定月のパーティションのみ置き換え
+            table_success = load_table_partitions(
+                bq_client, storage_client, table_name, load_months, target_months, execution_id,
+                stats=table_stats, inventory=inventory
+            )
+        elif LOAD_STRATEGY == "delete_append":
+            # 2020年1月以降のデータを削除してから追記（削除に失敗した場合はロードしない）
+            table_success = delete_partition_data(bq_client, table_name) and load_csv_batch_to_bigquery(
+                bq_client, storage_client, table_name, target_months, execution_id,
+                stats=table_stats, inventory=inventory
+            )
+        else:
+            # ステージングにロード・検証してから本番テーブルを置き換え
+            table_success = load_table_via_staging(
+                bq_client, storage_client, table_name, target_months, execution_id,
+                stats=table_stats, inventory=inventory
+            )
+
+        if table_success:
+            # テーブルとカラムの説明を更新
+            update_table_and_column_descriptions(bq_client, storage_client, table_name)
+
+    if not table_success:
+        return {"table": table_name, "status": "error", "rows_added": 0}
+
+    return {"table": table_name, "status": "success", "rows_added": table_stats.get("rows_added", 0)}
+
+
 # ============================================================
 # スプレッドシート → BigQuery ロード処理
 # ============================================================
@@ -1766,7 +2682,7 @@ def validate_spreadsheet_duplicates_in_bq(
     bq_table_name: str
 ) -> Dict[str, Any]:
     """
-    スプレッドシートテーブルの重複をチェック
+    スプレッドシートテーブルの重複をチェック（1テーブル分の validate_duplicates_batch）
 
     Args:
         bq_client: BigQueryクライアント
@@ -1775,70 +2691,7 @@ def validate_spreadsheet_duplicates_in_bq(
     Returns:
         検証結果の辞書
     """
-    errors = []
-
-    # ユニークキー定義を取得
-    unique_keys = SPREADSHEET_UNIQUE_KEYS_CONFIG.get(bq_table_name, [])
-    if not unique_keys:
-        return {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "service": "gcs-to-bq",
-            "validation_type": "spreadsheet_duplicate_check",
-            "table_name": bq_table_name,
-            "status": "SKIPPED",
-            "message": "ユニークキーが定義されていません"
-        }
-
-    table_id = f"{PROJECT_ID}.{DATASET_ID}.{bq_table_name}"
-    key_cols = ", ".join(unique_keys)
-
-    # 重複チェッククエリ
-    query = f"""
-    SELECT {key_cols}, COUNT(*) as duplicate_count
-    FROM `{table_id}`
-    GROUP BY {key_cols}
-    HAVING COUNT(*) > 1
-    LIMIT 10
-    """
-
-    try:
-        result = bq_client.query(query).result()
-        duplicates = [dict(row) for row in result]
-        duplicate_count = len(duplicates)
-
-        if duplicate_count > 0:
-            errors.append({
-                "type": "DUPLICATE_RECORDS",
-                "message": f"重複レコードが存在します（サンプル: {duplicate_count}件）",
-                "details": {
-                    "unique_keys": unique_keys,
-                    "sample_duplicates": duplicates
-                }
-            })
-
-        return {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "service": "gcs-to-bq",
-            "validation_type": "spreadsheet_duplicate_check",
-            "table_name": bq_table_name,
-            "status": "ERROR" if errors else "OK",
-            "unique_keys": unique_keys,
-            "duplicate_sample_count": duplicate_count,
-            "errors": errors
-        }
-
-    except Exception as e:
-        return {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "service": "gcs-to-bq",
-            "validation_type": "spreadsheet_duplicate_check",
-            "table_name": bq_table_name,
-            "status": "ERROR",
-            "errors": [{
-                "type": "QUERY_ERROR",
-                "message": f"重複チェッククエリ実行エラー: {str(e)}"
-            }]
-        }
+    return validate_duplicates_batch(bq_client, [bq_table_name])[bq_table_name]
 
 
 def process_spreadsheet_tables(
@@ -1862,6 +2715,18 @@ def process_spreadsheet_tables(
     exec_id = execution_id or get_execution_id()
     target_tables = tables or list(SPREADSHEET_TABLE_CONFIG.keys())
 
+    log_spreadsheet_load_start(target_tables, exec_id)
+    results = run_load_tasks(
+        [lambda t=t: load_spreadsheet_table(bq_client, storage_client, t, exec_id) for t in target_tables],
+        LOAD_CONCURRENCY
+    )
+    if VALIDATION_ENABLED:
+        run_duplicate_validation(bq_client, [r["bq_table"] for r in results if r["status"] == "success"])
+    return summarize_spreadsheet_results(results, exec_id)
+
+
+def log_spreadsheet_load_start(target_tables: List[str], execution_id: str) -> None:
+    """スプレッドシートロード処理の開始を出力"""
     print("\n" + "=" * 60)
     print(f"スプレッドシート → BigQuery ロード処理")
     print(f"対象テーブル: {', '.join(target_tables)}")
@@ -1876,43 +2741,40 @@ def process_spreadsheet_tables(
             "tables": target_tables,
             "table_count": len(target_tables)
         },
-        execution_id=exec_id
+        execution_id=execution_id
     )
 
-    success_count = 0
-    error_count = 0
-    results = []
 
-    for table_name in target_tables:
-        config = SPREADSHEET_TABLE_CONFIG.get(table_name)
-        if not config:
-            print(f"⚠️  未定義のテーブル: {table_name}")
-            error_count += 1
-            results.append({"table": table_name, "status": "error", "reason": "undefined"})
-            continue
+def load_spreadsheet_table(
+    bq_client: bigquery.Client,
+    storage_client: storage.Client,
+    table_name: str,
+    execution_id: str
+) -> Dict[str, Any]:
+    """
+    スプレッドシートテーブル1件のロード（洗い替え。重複チェックはロード後にまとめて行う）
+
+    Returns:
+        {"table", "bq_table", "status": success/error}（未定義のテーブルは "reason": "undefined"）
+    """
+    config = SPREADSHEET_TABLE_CONFIG.get(table_name)
+    if not config:
+        print(f"⚠️  未定義のテーブル: {table_name}")
+        return {"table": table_name, "status": "error", "reason": "undefined"}
 
-        bq_table_name = config["bq_table_name"]
+    bq_table_name = config["bq_table_name"]
 
-        # ロード実行
-        if load_spreadsheet_to_bigquery(bq_client, storage_client, table_name, exec_id):
-            # 重複チェック
-            if VALIDATION_ENABLED:
-                dup_result = validate_spreadsheet_duplicates_in_bq(bq_client, bq_table_name)
-                log_validation_result(dup_result)
+    # ロード実行
+    if not load_spreadsheet_to_bigquery(bq_client, storage_client, table_name, execution_id):
+        return {"table": table_name, "bq_table": bq_table_name, "status": "error"}
 
-                if dup_result.get("status") == "ERROR":
-                    for error in dup_result.get("errors", []):
-                        print(f"   ⚠️  重複チェックエラー: {error.get('message')}")
-                elif dup_result.get("status") == "SKIPPED":
-                    print(f"   ⏭️  重複チェックスキップ: ユニークキー未定義")
-                else:
-                    print(f"   ✅ バリデーションOK: 重複チェック passed")
+    return {"table": table_name, "bq_table": bq_table_name, "status": "success"}
 
-            success_count += 1
-            results.append({"table": table_name, "bq_table": bq_table_name, "status": "success"})
-        else:
-            error_count += 1
-            results.append({"table": table_name, "bq_table": bq_table_name, "status": "error"})
+
+def summarize_spreadsheet_results(results: List[Dict[str, Any]], execution_id: str) -> Dict[str, Any]:
+    """スプレッドシートテーブルの結果を集計し、完了ログを出力"""
+    success_count = sum(1 for r in results if r["status"] == "success")
+    error_count = len(results) - success_count
 
     print("\n" + "=" * 60)
     print(f"スプレッドシート処理完了: 成功 {success_count} / エラー {error_count}")
@@ -1929,7 +2791,7 @@ def process_spreadsheet_tables(
             "error_count": error_count,
             "results": results
         },
-        execution_id=exec_id
+        execution_id=execution_id
     )
 
     return {
@@ -1946,22 +2808,14 @@ def process_spreadsheet_tables(
 # 期首（データ開始日）
 FISCAL_START_YYYYMM = "202409"  # 2024年9月
 
-def get_available_months_from_gcs(storage_client: storage.Client) -> list:
+def get_available_months_from_gcs(
+    storage_client: storage.Client,
+    inventory: Optional[ProceedInventory] = None
+) -> list:
     """GCSのgoogle-drive/proceed/フォルダから利用可能な年月リストを取得（2024/9以降）"""
-    bucket = storage_client.bucket(LANDING_BUCKET)
-    blobs = bucket.list_blobs(prefix="google-drive/proceed/")
-
-    months = set()
-    for blob in blobs:
-        # google-drive/proceed/202409/xxx.csv のような形式からyyyymmを抽出
-        parts = blob.name.split("/")
-        if len(parts) >= 3 and parts[2].isdigit() and len(parts[2]) == 6:
-            yyyymm = parts[2]
-            # 2024/9以降のみ対象
-            if yyyymm >= FISCAL_START_YYYYMM:
-                months.add(yyyymm)
-
-    return sorted(list(months))
+    inventory = inventory or ProceedInventory.from_bucket(storage_client.bucket(LANDING_BUCKET))
+    # 2024/9以降のみ対象
+    return [yyyymm for yyyymm in inventory.months() if yyyymm >= FISCAL_START_YYYYMM]
 
 # ============================================================
 # Flask アプリケーション
@@ -1996,13 +2850,14 @@ def transform_endpoint():
         print("=" * 60)
 
         storage_client = storage.Client()
+        monetary_rules = load_monetary_rules(storage_client)
 
         success_count = 0
         error_count = 0
         results = []
 
         for table_name in tables:
-            if transform_excel_to_csv(storage_client, table_name, yyyymm):
+            if transform_excel_to_csv(storage_client, table_name, yyyymm, monetary_rules):
                 success_count += 1
                 results.append({"table": table_name, "status": "success"})
             else:
@@ -2025,43 +2880,80 @@ def transform_endpoint():
         traceback.print_exc()
         return jsonify({"error": str(e)}), 500
 
-@app.route("/load", methods=["POST"])
-def load_endpoint():
+def parse_load_months(payload: Dict[str, Any], available_months: List[str]) -> List[str]:
     """
-    CSV → BigQuery ロードエンドポイント
+    差分ロードの対象月（yyyymm / months）を proceed/ に存在する月に絞り込んで返す
 
-    リクエスト例:
-    {
-        "yyyymm": "202509",  # 省略時は2024/9以降の全年月を処理
-        "tables": ["sales_target_and_achievements"],
-        "replace": true
-    }
+    yyyymm は "202511" または "202510,202511"、months は "202409-202412,202501" の形式。
+    いずれも省略時は空リスト
 
-    注意: 冪等性を保証するため、2024/9以降のデータは全て削除されてから追加されます。
+    Raises:
+        ValueError: 形式が不正な場合
     """
-    exec_id = get_execution_id()
+    specs = [str(payload.get(key) or "") for key in ("yyyymm", "months")]
+    ranges = []
+    for part in ",".join(specs).split(","):
+        part = part.strip()
+        if not part:
+            continue
+        m = re.match(r'^(\d{6})(?:-(\d{6}))?$', part)
+        if not m:
+            raise ValueError(f"無効な対象月の形式: {part}")
+        ranges.append((m.group(1), m.group(2) or m.group(1)))
+    return [m for m in sorted(available_months) if any(start <= m <= end for start, end in ranges)]
+
+
+def run_load(
+    payload: Dict[str, Any],
+    exec_id: str,
+    progress: Optional["JobProgress"] = None,
+    completed_units: Optional[List[str]] = None
+) -> Tuple[Dict[str, Any], int]:
+    """
+    proceed/ → BigQuery ロード処理本体
+
+    Args:
+        payload: /load のリクエストボディ
+        exec_id: 実行ID
+        progress: 非同期ジョブの進捗記録（テーブル単位 + "spreadsheet"）
+        completed_units: 再開時にスキップするロード済みテーブル
 
+    Returns:
+        (レスポンスボディ, HTTPステータス)
+    """
     try:
-        payload = request.get_json(force=True, silent=True) or {}
         yyyymm = payload.get("yyyymm")  # 省略可能
+        mode = payload.get("mode") or "replace"
         tables = payload.get("tables", list(TABLE_CONFIG.keys()))
+        concurrency = int(payload.get("concurrency") or LOAD_CONCURRENCY)
 
         bq_client = bigquery.Client(project=PROJECT_ID)
         storage_client = storage.Client()
 
-        # 対象年月リストを決定
-        if yyyymm:
-            # 特定月が指定された場合でも、2024/9以降の全データを処理
-            target_months = get_available_months_from_gcs(storage_client)
+        # proceed/ のファイル一覧を1回だけ取得し、年月の決定・整合性チェック・ロード対象の検索で共有
+        inventory = ProceedInventory.from_bucket(storage_client.bucket(LANDING_BUCKET))
+        print(f"proceed/ ファイル一覧: {len(inventory.blobs)}ファイル")
+
+        # 対象年月リストを決定（2024/9以降の全年月）
+        target_months = get_available_months_from_gcs(storage_client, inventory)
+
+        # 差分ロード: 指定月のパーティションのみ置き換え（月の指定がなければ全データを再ロード）
+        load_months = []
+        if mode in INCREMENTAL_LOAD_MODES:
+            try:
+                load_months = parse_load_months(payload, target_months)
+            except ValueError as e:
+                return {"status": "error", "error": str(e)}, 400
+            if not load_months:
+                print(f"モード {mode}: 対象月の指定がない（またはproceed/に存在しない）ため全データを再ロード")
+        elif yyyymm:
+            # replace モードでは特定月が指定された場合でも、2024/9以降の全データを処理
             print(f"指定月: {yyyymm}（ただし2024/9以降の全データを処理）")
-        else:
-            # 省略時は2024/9以降の全年月
-            target_months = get_available_months_from_gcs(storage_client)
 
         # ============================================================
         # TABLE_CONFIG整合性チェック（設定漏れ防止）
         # ============================================================
-        config_check = validate_table_config_completeness(storage_client, target_months)
+        config_check = validate_table_config_completeness(storage_client, target_months, inventory)
         if config_check["status"] == "ERROR":
             print("=" * 60)
             print("❌ TABLE_CONFIG整合性チェックエラー")
@@ -2082,16 +2974,19 @@ def load_endpoint():
                 execution_id=exec_id
             )
 
-            return jsonify({
+            return {
                 "status": "error",
                 "error": config_check["message"],
                 "missing_tables": config_check["missing_tables"]
-            }), 400
+            }, 400
 
         print("=" * 60)
         print(f"proceed/ → BigQuery ロード処理")
         print(f"対象年月: {', '.join(target_months)}")
-        print(f"モード: REPLACE（2024/1以降のデータを全て削除して再ロード）")
+        if load_months:
+            print(f"モード: {mode.upper()}（指定月のパーティションのみ置き換え: {', '.join(load_months)}）")
+        else:
+            print(f"モード: REPLACE（{LOAD_STRATEGY}: 全データを再ロード）")
         print("=" * 60)
 
         # 処理開始ログ
@@ -2101,71 +2996,91 @@ def load_endpoint():
             message=f"GCS → BigQueryロード処理を開始",
             details={
                 "target_months": target_months,
+                "load_months": load_months,
                 "tables": tables,
                 "table_count": len(tables)
             },
             execution_id=exec_id
         )
 
-        success_count = 0
-        error_count = 0
-        results = []
+        if progress:
+            progress.start(list(tables) + ["spreadsheet"])
 
-        for table_name in tables:
-            # 累積型テーブルかどうかで処理を分岐
-            if table_name in CUMULATIVE_TABLE_CONFIG:
-                # 累積型テーブル: 専用処理（source_folder追加、重複除去）
-                table_success = process_cumulative_table(
-                    bq_client, storage_client, table_name, target_months, exec_id
+        # ============================================================
+        # Drive連携テーブル・スプレッドシートテーブルを1つのプールで並列ロード
+        # ============================================================
+        # 再開時: 前回の実行でロード済みのテーブルはスキップ
+        results: List[Optional[Dict[str, Any]]] = [None] * len(tables)
+        tasks, drive_slots = [], []
+        for i, table_name in enumerate(tables):
+            if completed_units and table_name in completed_units:
+                print(f"\n⏭️  ロード済みのためスキップ（ジョブ再開）: {table_name}")
+                results[i] = {"table": table_name, "status": "resumed"}
+                continue
+            tasks.append(
+                lambda t=table_name: load_drive_table(
+                    bq_client, storage_client, t, target_months, exec_id, load_months, inventory
                 )
-            else:
-                # 単月型テーブル: ワイルドカードで一括ロード（レート制限対策）
-                print(f"\n📊 処理中（単月型）: {table_name}")
+            )
+            drive_slots.append(i)
 
-                # 2024/9以降のデータを全て削除（テーブルごとに1回だけ）
-                delete_partition_data(bq_client, table_name)
+        spreadsheet_resumed = bool(completed_units and "spreadsheet" in completed_units)
+        spreadsheet_tables = [] if spreadsheet_resumed else list(SPREADSHEET_TABLE_CONFIG.keys())
+        if spreadsheet_resumed:
+            print("\n⏭️  スプレッドシートはロード済みのためスキップ（ジョブ再開）")
+        else:
+            log_spreadsheet_load_start(spreadsheet_tables, exec_id)
+        tasks.extend(
+            lambda t=t: load_spreadsheet_table(bq_client, storage_client, t, exec_id) for t in spreadsheet_tables
+        )
 
-                # 全年月のCSVを一括ロード（ワイルドカード使用）
-                table_success = load_csv_batch_to_bigquery(
-                    bq_client, storage_client, table_name, target_months, exec_id
-                )
+        print(f"\n並列ロード: {len(tasks)}テーブル（並列数 {concurrency}）")
+        drive_count = len(drive_slots)
+        spreadsheet_progress = {"pending": len(spreadsheet_tables), "success": 0}
+
+        def record(index: int, outcome: Dict[str, Any]) -> None:
+            """完了したテーブルを進捗に反映（スプレッドシートは全テーブルの完了で1単位）"""
+            if not progress:
+                return
+            if index < drive_count:
+                if outcome["status"] == "success":
+                    progress.done(outcome["table"], success=1, rows_added=outcome["rows_added"])
+                else:
+                    progress.count(errors=1)
+                return
+            spreadsheet_progress["pending"] -= 1
+            spreadsheet_progress["success"] += outcome["status"] == "success"
+            if spreadsheet_progress["pending"] == 0:
+                progress.done("spreadsheet", success=spreadsheet_progress["success"])
 
-                if table_success:
-                    # テーブルとカラムの説明を更新
-                    update_table_and_column_descriptions(bq_client, storage_client, table_name)
-
-            if table_success:
-                # ============================================================
-                # バリデーション: 重複チェック
-                # ============================================================
-                if VALIDATION_ENABLED:
-                    dup_result = validate_duplicates_in_bq(bq_client, table_name)
-                    log_validation_result(dup_result)
-
-                    if dup_result.get("status") == "ERROR":
-                        for error in dup_result.get("errors", []):
-                            print(f"   ⚠️  重複チェックエラー: {error.get('message')}")
-                    elif dup_result.get("status") == "SKIPPED":
-                        print(f"   ⏭️  重複チェックスキップ: ユニークキー未定義")
-                    else:
-                        print(f"   ✅ バリデーションOK: 重複チェック passed")
+        outcomes = run_load_tasks(tasks, concurrency, on_done=record)
 
-                success_count += 1
-                results.append({"table": table_name, "status": "success"})
-            else:
-                error_count += 1
-                results.append({"table": table_name, "status": "error"})
+        # ============================================================
+        # バリデーション: ロードできたテーブルの重複チェック（全テーブルを1クエリで）
+        # ============================================================
+        if VALIDATION_ENABLED:
+            run_duplicate_validation(bq_client, [
+                outcome.get("bq_table", outcome["table"]) for outcome in outcomes if outcome["status"] == "success"
+            ])
+
+        rows_added = 0
+        for slot, outcome in zip(drive_slots, outcomes[:drive_count]):
+            results[slot] = {"table": outcome["table"], "status": outcome["status"]}
+            rows_added += outcome["rows_added"]
+        success_count = sum(1 for r in results if r["status"] in ("success", "resumed"))
+        error_count = len(results) - success_count
 
         print("\n" + "=" * 60)
         print(f"Drive処理完了: 成功 {success_count} / エラー {error_count}")
         print("=" * 60)
 
         # ============================================================
-        # スプレッドシートテーブルのロード処理
+        # スプレッドシートテーブルの結果
         # ============================================================
-        spreadsheet_result = process_spreadsheet_tables(
-            bq_client, storage_client, execution_id=exec_id
-        )
+        if spreadsheet_resumed:
+            spreadsheet_result = {"success_count": 0, "error_count": 0, "results": [], "resumed": True}
+        else:
+            spreadsheet_result = summarize_spreadsheet_results(outcomes[drive_count:], exec_id)
 
         # 全体の結果を集計
         total_success = success_count + spreadsheet_result["success_count"]
@@ -2191,9 +3106,11 @@ def load_endpoint():
             execution_id=exec_id
         )
 
-        return jsonify({
+        return {
             "status": "completed",
             "target_months": target_months,
+            "load_mode": "partitions" if load_months else "replace",
+            "load_months": load_months,
             "drive": {
                 "success": success_count,
                 "error": error_count,
@@ -2201,8 +3118,9 @@ def load_endpoint():
             },
             "spreadsheet": spreadsheet_result,
             "total_success": total_success,
-            "total_error": total_error
-        }), 200
+            "total_error": total_error,
+            "rows_added": rows_added
+        }, 200
 
     except Exception as e:
         traceback.print_exc()
@@ -2216,7 +3134,252 @@ def load_endpoint():
             execution_id=exec_id
         )
 
-        return jsonify({"error": str(e)}), 500
+        return {"error": str(e)}, 500
+
+
+# ============================================================
+# 非同期ジョブ
+# ============================================================
+# ロードをバックグラウンドスレッドで実行し、進捗を GCS 上の JSON に記録する。
+# ※ レスポンス返却後もCPUを割り当てるため、Cloud Run は --no-cpu-throttling でデプロイすること
+JOBS_GCS_PREFIX = os.environ.get("JOBS_GCS_PREFIX", "jobs/gcs-to-bq")
+JOB_STALE_SECONDS = int(os.environ.get("JOB_STALE_SECONDS", "900"))
+
+_job_lock = threading.Lock()
+_running_jobs = set()
+
+
+class JobProgress:
+    """ジョブの進捗（処理単位の総数・完了済み単位・カウンタ・経過時間）を記録する"""
+
+    def __init__(self, job: dict, bucket):
+        self.job = job
+        self.bucket = bucket
+        self.started = time.time()
+
+    def start(self, units: List[str]):
+        with _job_lock:
+            self.job["progress"]["units_total"] = len(units)
+            self._save()
+
+    def done(self, unit: str, **counters):
+        """処理単位の完了を記録（再開時はこの単位をスキップする）"""
+        with _job_lock:
+            p = self.job["progress"]
+            if unit not in p["completed_units"]:
+                p["completed_units"].append(unit)
+            p["units_done"] = len(p["completed_units"])
+            self._add(counters)
+            self._save()
+
+    def count(self, **counters):
+        """完了扱いにしないカウンタのみ加算（エラー等。再開時は再処理される）"""
+        with _job_lock:
+            self._add(counters)
+            self._save()
+
+    def _add(self, counters: Dict[str, int]):
+        for key, value in counters.items():
+            self.job["progress"]["counters"][key] = self.job["progress"]["counters"].get(key, 0) + value
+
+    def _save(self):
+        self.job["progress"]["elapsed_seconds"] = round(
+            self.job["progress"].get("elapsed_before_resume", 0) + time.time() - self.started, 1
+        )
+        save_job(self.bucket, self.job)
+
+
+def _job_blob(bucket, job_id: str):
+    return bucket.blob(f"{JOBS_GCS_PREFIX}/{job_id}.json")
+
+
+def save_job(bucket, job: dict, if_generation_match: Optional[int] = None) -> None:
+    """ジョブ状態をGCSに保存（if_generation_match 指定時は GCS 上の世代番号が一致する場合のみ）"""
+    job["updated_at"] = datetime.utcnow().isoformat() + "Z"
+    _job_blob(bucket, job["job_id"]).upload_from_string(
+        json.dumps(job, ensure_ascii=False, default=str), content_type="application/json",
+        if_generation_match=if_generation_match
+    )
+
+
+def load_job(bucket, job_id: str) -> Optional[dict]:
+    """GCSからジョブ状態を読み込み"""
+    if not re.match(r"^[0-9a-f]{32}$", job_id or ""):
+        return None
+    blob = _job_blob(bucket, job_id)
+    if not blob.exists():
+        return None
+    return json.loads(blob.download_as_text())
+
+
+def load_job_for_update(bucket, job_id: str) -> Optional[Tuple[dict, int]]:
+    """(ジョブ状態, GCS上の世代番号)。再開時に世代番号の一致を条件に書き込むために使う"""
+    if not re.match(r"^[0-9a-f]{32}$", job_id or ""):
+        return None
+    blob = bucket.get_blob(f"{JOBS_GCS_PREFIX}/{job_id}.json")
+    if not blob:
+        return None
+    return json.loads(blob.download_as_text()), blob.generation
+
+
+def new_job(params: dict) -> dict:
+    """ジョブ状態の初期値を生成"""
+    return {
+        "job_id": uuid.uuid4().hex,
+        "status": "queued",
+        "params": params,
+        "created_at": datetime.utcnow().isoformat() + "Z",
+        "progress": {
+            "units_total": None,
+            "units_done": 0,
+            "completed_units": [],
+            "counters": {},
+            "elapsed_seconds": 0,
+        },
+        "http_status": None,
+        "result": None,
+        "error": None,
+    }
+
+
+def is_resumable(job: dict) -> bool:
+    """失敗したジョブ、または更新が途絶えた（インスタンス停止等）running ジョブのみ再開可能"""
+    if job["status"] == "failed":
+        return True
+    if job["status"] in ("queued", "running") and job["job_id"] not in _running_jobs:
+        updated = datetime.fromisoformat(job["updated_at"].rstrip("Z"))
+        return (datetime.utcnow() - updated).total_seconds() > JOB_STALE_SECONDS
+    return False
+
+
+def _run_load_job(bucket, job: dict) -> None:
+    progress = JobProgress(job, bucket)
+    try:
+        job["status"] = "running"
+        save_job(bucket, job)
+        body, job["http_status"] = run_load(
+            job["params"], job["execution_id"],
+            progress=progress, completed_units=job["progress"]["completed_units"]
+        )
+        job["result"] = body
+        # 500（予期しないエラー）は再開可能な失敗として扱う
+        job["status"] = "failed" if job["http_status"] >= 500 else "succeeded"
+        job["error"] = body.get("error") if job["status"] == "failed" else None
+    except Exception as e:
+        traceback.print_exc()
+        job["status"] = "failed"
+        job["http_status"] = 500
+        job["error"] = str(e)
+    finally:
+        with _job_lock:
+            progress._save()
+            _running_jobs.discard(job["job_id"])
+
+
+def start_job(bucket, job: dict, if_generation_match: Optional[int] = None) -> bool:
+    """
+    ジョブをバックグラウンドスレッドで開始
+
+    if_generation_match 指定時（再開）は、読み込んだ時点から GCS 上のジョブが更新されていない場合のみ開始する。
+    複数インスタンスで同じジョブを同時に再開しても、引き継げるのは1つだけになる。
+
+    Returns:
+        開始した場合True（他のリクエストが先にジョブを更新していた場合False）
+    """
+    with _job_lock:
+        try:
+            save_job(bucket, job, if_generation_match=if_generation_match)
+        except PreconditionFailed:
+            return False
+        _running_jobs.add(job["job_id"])
+    threading.Thread(target=_run_load_job, args=(bucket, job), daemon=True).start()
+    return True
+
+
+@app.route("/load", methods=["POST"])
+def load_endpoint():
+    """
+    CSV → BigQuery ロードエンドポイント
+
+    リクエスト例:
+    {
+        "yyyymm": "202509",  # 省略時は2024/9以降の全年月を処理
+        "mode": "replace",  # append / incremental: yyyymm・months の月のパーティションのみ置き換え
+        "months": "202409-202412",  # 差分ロードの対象月（範囲・カンマ区切り可）
+        "tables": ["sales_target_and_achievements"],
+        "replace": true,
+        "concurrency": 4,  # テーブルロードの並列数（省略時は LOAD_CONCURRENCY）
+        "async": true  # ジョブを登録して即座に 202 と job_id を返す（?async=true でも可）
+    }
+
+    注意: 冪等性を保証するため、単月型テーブルは全年月のデータで丸ごと置き換えられます
+    （LOAD_STRATEGY=swap: ステージングテーブル経由、delete_append: 2020/1以降を削除してから追加）。
+    mode が append / incremental で対象月を指定した場合は、その月のファイルが含むパーティションのみを
+    置き換えます（スプレッドシートテーブルは常に全件置き換え）。
+    """
+    exec_id = get_execution_id()
+    payload = request.get_json(force=True, silent=True) or {}
+    run_async = (
+        payload.pop("async", False) is True
+        or request.args.get("async", "false").lower() == "true"
+    )
+
+    if run_async:
+        bucket = storage.Client().bucket(LANDING_BUCKET)
+        job = new_job(payload)
+        job["execution_id"] = exec_id
+        accepted = {
+            "job_id": job["job_id"],
+            "status": job["status"],
+            "status_url": f"/jobs/{job['job_id']}"
+        }
+        start_job(bucket, job)
+        return jsonify(accepted), 202
+
+    body, status_code = run_load(payload, exec_id)
+    return jsonify(body), status_code
+
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def get_job(job_id):
+    """非同期ジョブの状態・進捗を返す（完了時は result に /load と同じ結果を含む）"""
+    job = load_job(storage.Client().bucket(LANDING_BUCKET), job_id)
+    if not job:
+        return jsonify({"status": "error", "message": f"job not found: {job_id}"}), 404
+    return jsonify(job)
+
+
+@app.route("/jobs/<job_id>/resume", methods=["POST"])
+def resume_job(job_id):
+    """失敗・中断したジョブを、ロード済みのテーブルを飛ばして再開する"""
+    bucket = storage.Client().bucket(LANDING_BUCKET)
+    loaded = load_job_for_update(bucket, job_id)
+    if not loaded:
+        return jsonify({"status": "error", "message": f"job not found: {job_id}"}), 404
+    job, generation = loaded
+    if not is_resumable(job):
+        return jsonify({
+            "status": "error",
+            "message": f"job is not resumable (status={job['status']})",
+            "job": job
+        }), 409
+
+    job["progress"]["elapsed_before_resume"] = job["progress"].get("elapsed_seconds", 0)
+    job["resumed_at"] = datetime.utcnow().isoformat() + "Z"
+    job["status"] = "queued"
+    job["error"] = None
+    accepted = {
+        "job_id": job_id,
+        "status": job["status"],
+        "completed_units": len(job["progress"]["completed_units"]),
+        "status_url": f"/jobs/{job_id}"
+    }
+    if not start_job(bucket, job, if_generation_match=generation):
+        return jsonify({
+            "status": "error",
+            "message": f"job was updated by another request; not resumed: {job_id}"
+        }), 409
+    return jsonify(accepted), 202
 
 @app.route("/", methods=["GET"])
 def health():
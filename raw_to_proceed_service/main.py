@@ -10,13 +10,27 @@ Cloud Run Service として動作
 import os
 import io
 import re
+import ast
 import json
+import time
+import uuid
+import base64
+import hashlib
 import logging
+import resource
+import threading
+import importlib.util
+import multiprocessing
+from contextlib import contextmanager, nullcontext
+from decimal import Decimal, ROUND_HALF_UP
 import pandas as pd
 import numpy as np
-from datetime import datetime
-from typing import Dict, Optional, Any, Tuple, List
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, date
+from typing import Dict, Optional, Any, Tuple, List, Union, Callable, Iterator
 from flask import Flask, request, jsonify
+from google.api_core.exceptions import PreconditionFailed
 from google.cloud import storage
 from google.cloud import logging as cloud_logging
 
@@ -29,6 +43,26 @@ GCS_RAW_PREFIX = "google-drive/raw"
 GCS_PROCEED_PREFIX = "google-drive/proceed"
 GCS_COLUMNS_PATH = "google-drive/config/columns"
 GCS_MAPPING_PATH = "google-drive/config/mapping"
+MONETARY_SCALE_FILE = f"{GCS_MAPPING_PATH}/monetary_scale_conversion.csv"
+ZERO_DATE_FILE = f"{GCS_MAPPING_PATH}/zero_date_to_null.csv"
+JOBS_GCS_PREFIX = os.environ.get("JOBS_GCS_PREFIX", "jobs/raw-to-proceed")  # 非同期ジョブの状態保存先
+JOB_STALE_SECONDS = int(os.environ.get("JOB_STALE_SECONDS", "900"))  # 更新が途絶えた running ジョブを再開可能とみなす秒数
+TRANSFORM_WORKERS = int(os.environ.get("TRANSFORM_WORKERS", "1"))  # テーブル変換の並列プロセス数（1は逐次処理）
+TRANSFORM_WORKER_MEMORY_MB = int(os.environ.get("TRANSFORM_WORKER_MEMORY_MB", "1024"))  # ワーカー1プロセスあたりのメモリ上限（0で無制限）
+TRANSFORM_WORKER_MAX_TASKS = int(os.environ.get("TRANSFORM_WORKER_MAX_TASKS", "20"))  # ワーカーを作り直すまでの処理テーブル数
+EXCEL_ENGINE = os.environ.get("EXCEL_ENGINE", "auto")  # Excel読み込みエンジン: auto / openpyxl / calamine
+EXCEL_PRUNE_COLUMNS = os.environ.get("EXCEL_PRUNE_COLUMNS", "true").lower() == "true"  # マッピング対象外の列を読み込まない
+PROCEED_FORMAT = os.environ.get("PROCEED_FORMAT", "csv").lower()  # proceed/ の出力形式: csv / parquet
+PROCEED_FORMAT_OVERRIDES = os.environ.get("PROCEED_FORMAT_OVERRIDES", "")  # テーブル単位の出力形式（例: "ledger_income=parquet,stocks=csv"）
+PARQUET_COMPRESSION = os.environ.get("PARQUET_COMPRESSION", "snappy")  # Parquet の圧縮方式: snappy / zstd
+TRANSFORM_MANIFEST_PREFIX = os.environ.get("TRANSFORM_MANIFEST_PREFIX", "manifests/raw-to-proceed")  # 変換マニフェストの保存先
+STREAMING_TABLES = os.environ.get("STREAMING_TABLES", "")  # チャンク単位で変換するテーブル（例: "ledger_income,ledger_loss"）
+STREAM_CHUNK_ROWS = int(os.environ.get("STREAM_CHUNK_ROWS", "50000"))  # チャンク単位の変換で1回に処理する行数
+GCS_STREAM_TEMP_PREFIX = "google-drive/temp/proceed"  # チャンク単位の変換の書き込み先（完了後に proceed/ へコピー）
+
+# 変換処理のバージョン（本ファイルのハッシュ）。デプロイで変換処理が変わると全テーブルを再変換する
+with open(__file__, "rb") as _f:
+    TRANSFORMER_VERSION = os.environ.get("TRANSFORMER_VERSION") or hashlib.md5(_f.read()).hexdigest()[:12]
 
 # Flask アプリ
 app = Flask(__name__)
@@ -48,6 +82,10 @@ logger.setLevel(logging.INFO)
 validation_logger = logging.getLogger("validation_logger")
 validation_logger.setLevel(logging.INFO)
 
+# テーブルごとの処理段階の計測ロガー（構造化ログ）
+metrics_logger = logging.getLogger("transform_metrics")
+metrics_logger.setLevel(logging.INFO)
+
 
 # ============================================================
 # テーブル定義
@@ -134,6 +172,92 @@ def log_validation_warning(validation_type: str, details: dict):
     validation_logger.warning(json.dumps(log_entry, ensure_ascii=False))
 
 
+# ------------------------------------------------------------
+# 処理段階の計測
+# ------------------------------------------------------------
+TRANSFORM_STAGES = [
+    "download", "parse", "type_conversion", "rename", "monetary", "zero_date",
+    "post_process", "serialize", "upload",
+]
+
+
+def _peak_rss_mb() -> float:
+    """プロセスのピークRSS（MB）"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class StageMetrics:
+    """
+    テーブル1件の変換を処理段階（TRANSFORM_STAGES）ごとに計測
+
+    段階ごとに所要時間・行数・列数・入出力バイト数・ピークRSSの増分（段階の間にプロセスの
+    ピークRSSがどれだけ伸びたか）を記録する。チャンク単位の変換のように同じ段階を複数回計測した場合、
+    時間・行数・バイト数は合計、列数とピークRSSの増分は最大値で集計する。
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, Dict[str, Any]] = {}
+
+    @contextmanager
+    def span(self, stage: str):
+        """段階を計測（yield する辞書に rows / columns / input_bytes / output_bytes を設定する）"""
+        record: Dict[str, Any] = {}
+        rss_before = _peak_rss_mb()
+        started = time.perf_counter()
+        try:
+            yield record
+        finally:
+            entry = self.stages.setdefault(stage, {"seconds": 0.0, "calls": 0, "peak_rss_delta_mb": 0.0})
+            entry["seconds"] += time.perf_counter() - started
+            entry["calls"] += 1
+            entry["peak_rss_delta_mb"] = max(entry["peak_rss_delta_mb"], _peak_rss_mb() - rss_before)
+            for key in ("rows", "input_bytes", "output_bytes"):
+                if key in record:
+                    entry[key] = entry.get(key, 0) + record[key]
+            if "columns" in record:
+                entry["columns"] = max(entry.get("columns", 0), record["columns"])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """{"total_seconds", "peak_rss_delta_mb", "stages": {段階: 計測値}}（段階は処理順）"""
+        order = {stage: i for i, stage in enumerate(TRANSFORM_STAGES)}
+        stages = {
+            stage: {k: round(v, 3) if isinstance(v, float) else v for k, v in self.stages[stage].items()}
+            for stage in sorted(self.stages, key=lambda s: order.get(s, len(order)))
+        }
+        return {
+            "total_seconds": round(sum((e["seconds"] for e in self.stages.values()), 0.0), 3),
+            "peak_rss_delta_mb": round(max((e["peak_rss_delta_mb"] for e in self.stages.values()), default=0.0), 1),
+            "stages": stages,
+        }
+
+
+def measure(metrics: Optional[StageMetrics], stage: str):
+    """metrics.span(stage)。metrics が None の場合は計測しない"""
+    return metrics.span(stage) if metrics is not None else nullcontext({})
+
+
+def log_transform_metrics(yyyymm: str, outcome: dict) -> None:
+    """テーブル1件の変換結果と処理段階の計測値を構造化ログ（1テーブル1レコード）として出力"""
+    log_entry = {
+        "log_type": "transform_metrics",
+        "timestamp": datetime.utcnow().isoformat(),
+        "yyyymm": yyyymm,
+        "table_name": outcome["table"],
+        "status": outcome["status"],
+        "rows": outcome.get("rows"),
+        "transformer_version": TRANSFORMER_VERSION,
+        **outcome.get("metrics", {}),
+    }
+    metrics_logger.info(json.dumps(log_entry, ensure_ascii=False))
+
+
+def add_stage_seconds(total: Dict[str, float], stages: Dict[str, Any]) -> None:
+    """処理段階ごとの所要秒数を total に加算（stages は StageMetrics.to_dict()["stages"] または集計済みの秒数）"""
+    for stage, value in stages.items():
+        seconds = value["seconds"] if isinstance(value, dict) else value
+        total[stage] = round(total.get(stage, 0.0) + seconds, 3)
+
+
 def load_column_mapping_from_gcs(bucket, table_name: str) -> Dict[str, Dict[str, str]]:
     """GCSからカラムマッピング定義を読み込み"""
     blob_path = f"{GCS_COLUMNS_PATH}/{table_name}.csv"
@@ -155,22 +279,94 @@ def load_column_mapping_from_gcs(bucket, table_name: str) -> Dict[str, Dict[str,
     return mapping
 
 
-def load_monetary_scale_config_from_gcs(bucket) -> pd.DataFrame:
-    """GCSから金額単位変換設定を読み込み"""
-    blob_path = f"{GCS_MAPPING_PATH}/monetary_scale_conversion.csv"
-    blob = bucket.blob(blob_path)
+def parse_list_literal(text: Any) -> List[Any]:
+    """
+    "['売上高','売上総利益']" 形式の設定値をリストに変換
 
-    if not blob.exists():
-        return pd.DataFrame()
+    eval は使わず、文字列・数値のリテラル（リスト / タプル / 単一値）のみ受け付ける
+    """
+    value = ast.literal_eval(str(text).strip())
+    if isinstance(value, (str, int, float)):
+        value = [value]
+    if not isinstance(value, (list, tuple)) or not all(isinstance(v, (str, int, float)) for v in value):
+        raise ValueError(f"リスト形式ではありません: {text}")
+    return list(value)
+
+
+class MonetaryRuleSet:
+    """
+    テーブル単位にコンパイルした金額単位変換ルール
+
+    各ルールは (条件列, 条件値, 対象列, 倍率)。条件に一致する行の対象列を倍率倍する。
+    float64 の対象列はまとめて1回の配列演算で変換し、それ以外の型の列（整数のみの列等）は
+    従来どおり列単位で代入する（代入時の型の扱いを変えないため）。
+    """
+
+    def __init__(self, rules: List[Tuple[str, List[Any], List[str], float]]):
+        self.rules = rules
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """DataFrame（英語カラム名に変換済み）を直接更新して返す"""
+        for condition_col, condition_values, object_columns, convert_value in self.rules:
+            try:
+                if condition_col not in df.columns:
+                    continue
+                mask = df[condition_col].isin(condition_values).to_numpy()
+                if not mask.any():
+                    continue
+
+                targets = [col for col in object_columns if col in df.columns]
+                block_columns = [col for col in targets if df[col].dtype == np.float64]
+                if block_columns:
+                    block = np.array(df[block_columns], dtype=np.float64)
+                    block[mask] *= convert_value
+                    df[block_columns] = block
+                for col in targets:
+                    if col not in block_columns:
+                        df.loc[mask, col] = pd.to_numeric(df.loc[mask, col], errors='coerce') * convert_value
+            except Exception as e:
+                logger.warning(f"金額変換エラー: {e}")
+        return df
 
-    content = blob.download_as_text()
-    return pd.read_csv(io.StringIO(content))
+
+def compile_monetary_rules(config_df: pd.DataFrame) -> Dict[str, MonetaryRuleSet]:
+    """monetary_scale_conversion.csv の内容をテーブル単位のルールにコンパイル（解析できない行は警告して除外）"""
+    rules: Dict[str, List[Tuple[str, List[Any], List[str], float]]] = {}
+    for _, config in config_df.iterrows():
+        try:
+            rule = (
+                config['condition_column_name'],
+                parse_list_literal(config['condition_column_value']),
+                parse_list_literal(config['object_column_name']),
+                float(config['convert_value'])
+            )
+        except (ValueError, SyntaxError, TypeError) as e:
+            logger.warning(f"金額変換設定の解析エラー ({config['file_name']}): {e}")
+            continue
+        rules.setdefault(config['file_name'], []).append(rule)
+    return {table_name: MonetaryRuleSet(table_rules) for table_name, table_rules in rules.items()}
+
+
+# コンパイル済みの金額単位変換ルール（設定ファイルの generation が変わるまで月・テーブルをまたいで再利用）
+_monetary_rules_cache: Dict[str, Any] = {}
+
+
+def load_monetary_rules_from_gcs(bucket) -> Dict[str, MonetaryRuleSet]:
+    """GCSから金額単位変換設定を読み込み、テーブル単位のルールを返す"""
+    blob = bucket.get_blob(MONETARY_SCALE_FILE)
+
+    if blob is None:
+        return {}
+
+    if _monetary_rules_cache.get("generation") != blob.generation:
+        config_df = pd.read_csv(io.BytesIO(blob.download_as_bytes()))
+        _monetary_rules_cache.update(generation=blob.generation, rules=compile_monetary_rules(config_df))
+    return _monetary_rules_cache["rules"]
 
 
 def load_zero_date_config_from_gcs(bucket) -> pd.DataFrame:
     """GCSからゼロ日付変換設定を読み込み"""
-    blob_path = f"{GCS_MAPPING_PATH}/zero_date_to_null.csv"
-    blob = bucket.blob(blob_path)
+    blob = bucket.blob(ZERO_DATE_FILE)
 
     if not blob.exists():
         return pd.DataFrame()
@@ -182,7 +378,39 @@ def load_zero_date_config_from_gcs(bucket) -> pd.DataFrame:
 # ============================================================
 # ファイル検索
 # ============================================================
-def find_raw_file(bucket, table_name: str, yyyymm: str) -> Tuple[Optional[Any], Optional[str]]:
+def build_raw_file_index(bucket, yyyymm: str) -> Dict[str, Any]:
+    """
+    月フォルダ（raw/YYYYMM/）を1回だけ一覧取得し、ファイル検索用のインデックスを作成
+
+    ワーカープロセスへ渡せるよう Blob ではなく名前・世代番号・md5 のみを保持する。
+
+    Returns:
+        {
+            "prefix": "google-drive/raw/YYYYMM/",
+            "files": {フォルダ内の相対パス: generation}（一覧取得順）,
+            "md5": {フォルダ内の相対パス: md5ハッシュ（base64）},
+            "by_number": {番号プレフィックス: 最初に一致した相対パス}
+        }
+    """
+    prefix = f"{GCS_RAW_PREFIX}/{yyyymm}/"
+    files = {}
+    md5 = {}
+    by_number = {}
+    for b in bucket.list_blobs(prefix=prefix):
+        name = b.name[len(prefix):]
+        files[name] = b.generation
+        md5[name] = b.md5_hash
+        # "6_202410.xlsx" → "6", "12_5.xlsx" → "12", "9.xlsx" → "9"
+        by_number.setdefault(re.split(r'[_.]', name, maxsplit=1)[0], name)
+    return {"prefix": prefix, "files": files, "md5": md5, "by_number": by_number}
+
+
+def find_raw_file(
+    bucket,
+    table_name: str,
+    yyyymm: str,
+    index: Optional[Dict[str, Any]] = None
+) -> Tuple[Optional[Any], Optional[str]]:
     """
     GCS上のrawファイルを検索
 
@@ -191,18 +419,35 @@ def find_raw_file(bucket, table_name: str, yyyymm: str) -> Tuple[Optional[Any],
     2. テーブル名_{yyyymm}.xlsx で検索（department_summary用）
     3. 短縮名（slug）で検索
     4. 短縮名_{yyyymm}.xlsx で検索
+    5. 短縮名の番号部分で前方一致（例: "6" → "6_202410.xlsx"）
 
     Args:
         bucket: GCSバケット
         table_name: テーブル名（英語）
         yyyymm: 対象年月
+        index: build_raw_file_index の結果。省略時はここで月フォルダを一覧取得する
+               （月内の全テーブルで使い回すと GCS のメタデータ呼び出しが月1回で済む）
 
     Returns:
         見つかったBlobとパス、見つからない場合は (None, None)
     """
-    prefix = f"{GCS_RAW_PREFIX}/{yyyymm}/"
+    if index is None:
+        index = build_raw_file_index(bucket, yyyymm)
+
+    name, partial = resolve_raw_file_name(table_name, yyyymm, index)
+    if name is None:
+        logger.warning(
+            f"ファイルが見つかりません: table={table_name}, yyyymm={yyyymm}, 候補={_raw_file_candidates(table_name, yyyymm)}"
+        )
+        return None, None
+
+    raw_path = f"{index['prefix']}{name}"
+    logger.info(f"ファイル発見（部分マッチ）: {raw_path}" if partial else f"ファイル発見: {raw_path}")
+    return bucket.blob(raw_path), raw_path
+
 
-    # 候補ファイル名リストを生成
+def _raw_file_candidates(table_name: str, yyyymm: str) -> List[str]:
+    """rawファイル名の候補リスト（優先順）"""
     candidates = []
 
     # テーブル名ベースの候補
@@ -214,31 +459,32 @@ def find_raw_file(bucket, table_name: str, yyyymm: str) -> Tuple[Optional[Any],
     for slug in slugs:
         candidates.append(f"{slug}.xlsx")
         candidates.append(f"{slug}_{yyyymm}.xlsx")
+    return candidates
 
-    # 各候補を試す
-    for candidate in candidates:
-        raw_path = f"{prefix}{candidate}"
-        blob = bucket.blob(raw_path)
-        if blob.exists():
-            logger.info(f"ファイル発見: {raw_path}")
-            return blob, raw_path
 
-    # 見つからない場合、フォルダ内のファイル一覧から検索
-    blobs = list(bucket.list_blobs(prefix=prefix))
+def resolve_raw_file_name(table_name: str, yyyymm: str, index: Dict[str, Any]) -> Tuple[Optional[str], bool]:
+    """
+    インデックスからテーブルのrawファイル（月フォルダ内の相対パス）を解決
+
+    Returns:
+        (相対パス, 番号プレフィックスによる部分マッチか)。見つからない場合は (None, False)
+    """
+    files = index["files"]
+
+    # 各候補を試す
+    for candidate in _raw_file_candidates(table_name, yyyymm):
+        if candidate in files:
+            return candidate, False
 
     # 番号プレフィックスでマッチング
-    for slug in slugs:
+    for slug in TABLE_TO_SLUG.get(table_name, []):
         # 番号部分のみで検索（例: "6" → "6_202410.xlsx" にマッチ）
         number_prefix = slug.split('_')[0] if '_' in slug else slug
-        for b in blobs:
-            blob_name = b.name.replace(prefix, '')
-            # 番号で始まるファイルを検索
-            if blob_name.startswith(f"{number_prefix}_") or blob_name.startswith(f"{number_prefix}."):
-                logger.info(f"ファイル発見（部分マッチ）: {b.name}")
-                return b, b.name
+        name = index["by_number"].get(number_prefix)
+        if name:
+            return name, True
 
-    logger.warning(f"ファイルが見つかりません: table={table_name}, yyyymm={yyyymm}, 候補={candidates}")
-    return None, None
+    return None, False
 
 
 # ============================================================
@@ -313,84 +559,131 @@ def convert_date_format(value: Any, date_type: str, column_name: str = '') -> st
     return value_str
 
 
-def apply_data_type_conversion(df: pd.DataFrame, column_mapping: Dict) -> pd.DataFrame:
-    """データ型変換を適用"""
-    df = df.copy()
-
-    for col in df.columns:
-        if col not in column_mapping:
-            continue
-
-        data_type = column_mapping[col]['type']
-
-        if data_type in ['DATE', 'DATETIME']:
-            if pd.api.types.is_datetime64_any_dtype(df[col]):
-                if data_type == 'DATE':
-                    df[col] = pd.to_datetime(df[col]).dt.strftime('%Y-%m-%d')
-                else:
-                    df[col] = pd.to_datetime(df[col]).dt.strftime('%Y-%m-%d %H:%M:%S')
-            else:
-                df[col] = df[col].apply(lambda x: convert_date_format(x, data_type, col))
+# 列単位で一括変換する日付文字列の形式（正規表現, format）。これ以外の文字列はセル単位で変換する
+# ※ \d は全角数字にも一致し pd.to_datetime の解釈とずれるため [0-9] を使う
+DATE_STRING_FORMATS = [
+    (r'[0-9]{4}-[0-9]{1,2}-[0-9]{1,2}', '%Y-%m-%d'),
+    (r'[0-9]{4}/[0-9]{1,2}/[0-9]{1,2}', '%Y/%m/%d'),
+    (r'[0-9]{4}-[0-9]{1,2}-[0-9]{1,2} [0-9]{1,2}:[0-9]{2}:[0-9]{2}', '%Y-%m-%d %H:%M:%S'),
+    (r'[0-9]{4}/[0-9]{1,2}/[0-9]{1,2} [0-9]{1,2}:[0-9]{2}:[0-9]{2}', '%Y/%m/%d %H:%M:%S'),
+]
+EXCEL_SERIAL_BASE = pd.Timestamp('1899-12-30')
 
-        elif data_type == 'INT64':
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-            df[col] = df[col].round().astype('Int64')
 
-        elif data_type == 'NUMERIC':
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+def convert_date_series(series: pd.Series, date_type: str, column_name: str = '') -> pd.Series:
+    """
+    日付列を一括変換（convert_date_format を各セルに適用した結果と同一）
 
-        elif data_type == 'STRING':
-            df[col] = df[col].fillna('')
-            df[col] = df[col].astype(str)
-            df[col] = df[col].replace('nan', '')
+    Excelシリアル値・ナノ秒タイムスタンプ・datetime・代表的な日付文字列・
+    「YYYY年M月」・「YYYY/MM」を列単位の演算で変換し、
+    それ以外（解釈できない値など）のセルのみ convert_date_format にフォールバックする。
+    """
+    out_format = '%Y-%m-%d %H:%M:%S' if date_type == 'DATETIME' else '%Y-%m-%d'
+    values = series.to_numpy(dtype=object)
+    kinds = pd.Series(values, dtype=object).map(type)
+    result = np.full(len(values), None, dtype=object)
+    pending = np.ones(len(values), dtype=bool)
+
+    def resolve(mask: np.ndarray, converted) -> None:
+        """mask 位置のセルに変換結果を反映（None/NaN/NaT は未変換のまま残す）"""
+        positions = np.flatnonzero(mask)
+        converted = np.asarray(converted, dtype=object)
+        ok = pd.notna(converted) & pending[positions]
+        result[positions[ok]] = converted[ok]
+        pending[positions[ok]] = False
+
+    def formatted(timestamps) -> np.ndarray:
+        return pd.DatetimeIndex(timestamps).strftime(out_format).to_numpy(dtype=object)
+
+    # 欠損・空文字
+    str_mask = kinds.eq(str).to_numpy()
+    empty = pd.isna(values)
+    empty[str_mask] |= values[str_mask] == ''
+    resolve(empty, np.full(empty.sum(), ''))
+
+    # 数値: Excelシリアル日付 / Unixタイムスタンプ（ナノ秒）
+    num_mask = pending & kinds.isin([int, float, bool, np.float64]).to_numpy()
+    if num_mask.any():
+        try:
+            numbers = values[num_mask].astype(float)
+        except OverflowError:
+            numbers = None
+        if numbers is not None:
+            serial = (numbers > 0) & (numbers < 100000)
+            days = pd.to_timedelta(np.trunc(np.where(serial, numbers, 0)), unit='D')
+            resolve(num_mask.copy(), np.where(serial, formatted(EXCEL_SERIAL_BASE + days), None))
+
+            nanos = numbers > 1e15
+            if nanos.any():
+                ns_mask = np.zeros(len(values), dtype=bool)
+                ns_mask[np.flatnonzero(num_mask)[nanos]] = True
+                stamps = pd.to_datetime(pd.Series(values[ns_mask], dtype=object), unit='ns', errors='coerce')
+                resolve(ns_mask, np.where(stamps.notna(), formatted(stamps), None))
+
+    # datetime / date オブジェクト
+    dt_mask = pending & kinds.isin([datetime, pd.Timestamp, date]).to_numpy()
+    if dt_mask.any():
+        try:
+            stamps = pd.to_datetime(pd.Series(values[dt_mask], dtype=object), errors='coerce')
+            resolve(dt_mask, np.where(stamps.notna(), formatted(stamps), None))
+        except (ValueError, TypeError):
+            pass  # タイムゾーン混在等はセル単位で変換
 
-    return df
+    # 文字列
+    str_mask &= pending
+    if str_mask.any():
+        strings = pd.Series(values[str_mask], dtype=object)
 
+        # 年月形式（例: "2025年9月" → "2025-09-01"）
+        ym = strings.str.extract(r'^(\d{4})年(\d{1,2})月')
+        ym_values = ym[0] + '-' + ym[1].str.zfill(2) + '-01'
+        resolve(str_mask, ym_values.where(strings.str.contains('年') & strings.str.contains('月')))
 
-def rename_columns(df: pd.DataFrame, column_mapping: Dict) -> pd.DataFrame:
-    """カラム名を日本語から英語に変換"""
-    rename_dict = {}
+        # YYYY/MM 形式（DATE型のみ、1日を補完）
+        if date_type == 'DATE':
+            year_month = strings.str.fullmatch(r'\d{4}/\d{1,2}')
+            stamps = pd.to_datetime(strings.where(year_month) + '/01', format='%Y/%m/%d', errors='coerce')
+            resolve(str_mask, np.where(stamps.notna(), formatted(stamps), None))
 
-    for jp_col in df.columns:
-        if jp_col in column_mapping:
-            en_col = column_mapping[jp_col]['en_name']
-            rename_dict[jp_col] = en_col
-        else:
-            rename_dict[jp_col] = jp_col
+        for pattern, fmt in DATE_STRING_FORMATS:
+            matched = strings.str.fullmatch(pattern).fillna(False)
+            if matched.any():
+                stamps = pd.to_datetime(strings.where(matched), format=fmt, errors='coerce')
+                resolve(str_mask, np.where(stamps.notna(), formatted(stamps), None))
 
-    return df.rename(columns=rename_dict)
+    # 残り（一括変換できなかったセル）はセル単位で変換
+    for position in np.flatnonzero(pending):
+        result[position] = convert_date_format(values[position], date_type, column_name)
 
+    return pd.Series(result, index=series.index, dtype=object)
 
-def apply_monetary_scale_conversion(df: pd.DataFrame, table_name: str, config_df: pd.DataFrame) -> pd.DataFrame:
-    """金額単位変換を適用"""
-    if config_df.empty:
-        return df
 
-    target_config = config_df[config_df['file_name'] == table_name]
-    if target_config.empty:
-        return df
+ZERO_DATE_PATTERNS = ['0000/00/00', '0000-00-00', '0000/0/0', '0000-0-0']
 
-    df = df.copy()
 
-    for _, config in target_config.iterrows():
-        try:
-            condition_col = config['condition_column_name']
-            condition_values = eval(config['condition_column_value'])
-            object_columns = eval(config['object_column_name'])
-            convert_value = float(config['convert_value'])
+def convert_column(series: pd.Series, data_type: str, column_name: str = '') -> pd.Series:
+    """列を config/columns の型に合わせて変換（新しい Series を返す）"""
+    if data_type in ['DATE', 'DATETIME']:
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series.dt.strftime('%Y-%m-%d' if data_type == 'DATE' else '%Y-%m-%d %H:%M:%S')
+        return convert_date_series(series, data_type, column_name)
 
-            if condition_col not in df.columns:
-                continue
+    if data_type == 'INT64':
+        return pd.to_numeric(series, errors='coerce').round().astype('Int64')
 
-            mask = df[condition_col].isin(condition_values)
+    if data_type == 'NUMERIC':
+        return pd.to_numeric(series, errors='coerce')
 
-            for col in object_columns:
-                if col in df.columns:
-                    df.loc[mask, col] = pd.to_numeric(df.loc[mask, col], errors='coerce') * convert_value
-        except Exception as e:
-            logger.warning(f"金額変換エラー: {e}")
+    if data_type == 'STRING':
+        if pd.api.types.is_datetime64_any_dtype(series):
+            # datetime64 列は fillna('') で NaT が置き換わらないため従来どおりの変換（'NaT' が残る）
+            return series.fillna('').astype(str).replace('nan', '')
+        # 欠損値と 'nan' を空文字に（fillna → astype(str) → replace の3回の走査を1回の文字列化にまとめる）
+        text = series.astype(str)
+        text[series.isna().to_numpy() | (text == 'nan').to_numpy()] = ''
+        return text
 
-    return df
+    return series
 
 
 def reorder_columns_for_bigquery(df: pd.DataFrame, table_name: str, column_mapping: Dict) -> pd.DataFrame:
@@ -427,52 +720,371 @@ def reorder_columns_for_bigquery(df: pd.DataFrame, table_name: str, column_mappi
         cols.remove(partition_field)
         cols = [partition_field] + cols
 
-    return df[cols]
+    # df[cols] は元の DataFrame のコピー扱い（後処理の列追加で SettingWithCopyWarning）になるため reindex を使う
+    return df.reindex(columns=cols)
 
 
-def apply_zero_date_to_null_conversion(df: pd.DataFrame, table_name: str, config_df: pd.DataFrame) -> pd.DataFrame:
-    """ゼロ日付をnullに変換"""
-    if config_df.empty:
-        return df
+def resolve_excel_engine(engine: Optional[str] = None) -> str:
+    """
+    Excel読み込みエンジンを決定
+
+    auto の場合、python-calamine（Rust実装）がインストールされていて pandas が対応していれば
+    calamine、それ以外は openpyxl を使う
+    """
+    engine = engine or EXCEL_ENGINE
+    if engine != "auto":
+        return engine
+    pandas_version = tuple(int(v) for v in re.findall(r'\d+', pd.__version__)[:2])
+    if pandas_version >= (2, 2) and importlib.util.find_spec("python_calamine") is not None:
+        return "calamine"
+    return "openpyxl"
 
-    target_config = config_df[config_df['file_name'] == table_name]
-    if target_config.empty:
+
+def _normalize_column_name(col: Any) -> Any:
+    """カラム名の改行を除去"""
+    return col.replace('\n', '') if isinstance(col, str) else col
+
+
+def log_unmapped_columns(table_name: Optional[str], columns: List[Any]) -> None:
+    """列の絞り込みで読み込まなかったヘッダーの列（マッピング対象外）を警告ログに出す（テーブルごとに1件）"""
+    if columns:
+        logger.warning(
+            f"マッピング対象外の列を読み込みから除外: {table_name} {len(columns)}列 "
+            f"{[_normalize_column_name(col) for col in columns]}"
+        )
+
+
+def read_excel_sheet(
+    excel_source: Union[bytes, pd.ExcelFile],
+    sheet_name: Optional[str],
+    column_mapping: Dict[str, Dict[str, str]],
+    engine: Optional[str] = None,
+    prune_columns: Optional[bool] = None,
+    table_name: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Excelシートを読み込み
+
+    prune_columns が有効な場合、ヘッダー行でカラムマッピングに存在する列だけを選んで読み込む
+    （対象外の列はセル値の変換自体を行わない）。絞り込まない場合、マッピング対象外の列は
+    そのまま proceed/ に出力され、gcs_to_bq のロード（ignore_unknown_values=False）がエラーになる。
+    絞り込みではこの列を黙って除外することになるため、除外した列名を警告ログに出す。
+    1列も一致しない場合は従来どおり全列を読み込む。
+
+    Args:
+        excel_source: Excelファイルのバイト列、またはオープン済みの pd.ExcelFile（WorkbookCache）
+        sheet_name: シート名（省略時は先頭シート）
+        column_mapping: カラムマッピング（キーは日本語カラム名）
+        engine: 読み込みエンジン（省略時は EXCEL_ENGINE）
+        prune_columns: 列の絞り込みを行うか（省略時は EXCEL_PRUNE_COLUMNS）
+        table_name: 除外した列の警告ログに出すテーブル名（省略時はシート名）
+
+    Returns:
+        カラム名の改行を除去したDataFrame
+    """
+    prune_columns = EXCEL_PRUNE_COLUMNS if prune_columns is None else prune_columns
+    if isinstance(excel_source, pd.ExcelFile):
+        # オープン済みのブックはエンジンも決定済み
+        open_source, engine = (lambda: excel_source), None
+    else:
+        open_source, engine = (lambda: io.BytesIO(excel_source)), resolve_excel_engine(engine)
+
+    df = None
+    if prune_columns:
+        unmapped: List[Any] = []
+
+        def use_column(col: Any) -> bool:
+            if _normalize_column_name(col) in column_mapping:
+                return True
+            unmapped.append(col)
+            return False
+
+        df = pd.read_excel(open_source(), sheet_name=sheet_name or 0, engine=engine, usecols=use_column)
+        if len(df.columns) == 0:
+            logger.warning("マッピング対象の列がヘッダーに見つからないため全列を読み込みます")
+            df = None
+        else:
+            log_unmapped_columns(table_name or sheet_name, unmapped)
+    if df is None:
+        df = pd.read_excel(open_source(), sheet_name=sheet_name or 0, engine=engine)
+
+    if isinstance(df, dict):
+        df = list(df.values())[0]
+
+    # カラム名の改行を除去
+    df.columns = [_normalize_column_name(col) for col in df.columns]
+    return df
+
+
+class WorkbookCache:
+    """
+    rawファイル（Blob名 + generation）単位で Excel ブックをキャッシュ
+
+    profit_plan_term / _nagasaki / _fukuoka のように複数テーブルが同じブックの別シートを
+    参照する場合に、ダウンロードとブックのオープンを1回で済ませる。
+    テーブルのグループ（transform_table_group）ごとに作成し、処理後に close() する。
+    """
+
+    def __init__(self, engine: Optional[str] = None):
+        self.engine = engine
+        self._books: Dict[Tuple[str, Any], pd.ExcelFile] = {}
+
+    def open(self, blob, generation: Any = None, metrics: Optional[StageMetrics] = None) -> pd.ExcelFile:
+        key = (blob.name, generation)
+        book = self._books.get(key)
+        if book is None:
+            with measure(metrics, "download") as span:
+                data = blob.download_as_bytes()
+                span["output_bytes"] = len(data)
+            with measure(metrics, "parse") as span:
+                span["input_bytes"] = len(data)
+                book = pd.ExcelFile(io.BytesIO(data), engine=resolve_excel_engine(self.engine))
+            del data
+            self._books[key] = book
+        else:
+            logger.info(f"キャッシュ済みのブックを再利用: {blob.name}")
+        return book
+
+    def close(self) -> None:
+        for book in self._books.values():
+            book.close()
+        self._books.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# 変換後のDataFrameに適用するテーブル固有の後処理（DataFrame → DataFrame）
+PostStep = Callable[[pd.DataFrame], pd.DataFrame]
+
+
+def add_source_folder(yyyymm: str) -> PostStep:
+    """累積型テーブル用: 取得元フォルダ（YYYYMM）を source_folder カラムとして追加"""
+    def step(df: pd.DataFrame) -> pd.DataFrame:
+        df["source_folder"] = int(yyyymm)
+        logger.info(f"source_folder={yyyymm} を追加（累積型テーブル）")
         return df
+    return step
+
+
+def build_post_steps(table_name: str, yyyymm: str) -> List[PostStep]:
+    """テーブルごとの後処理を組み立て"""
+    steps = []
+    if table_name in CUMULATIVE_TABLES:
+        steps.append(add_source_folder(yyyymm))
+    return steps
+
 
-    df = df.copy()
-    zero_date_patterns = ['0000/00/00', '0000-00-00', '0000/0/0', '0000-0-0']
+def dataframe_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """DataFrameをUTF-8のCSVバイト列に変換（str を経由せずバイナリバッファに直接書き込む）"""
+    csv_buffer = io.BytesIO()
+    df.to_csv(csv_buffer, index=False, encoding='utf-8')
+    return csv_buffer.getvalue()
 
-    for _, config in target_config.iterrows():
-        column_name = config['condition_column_name']
 
-        if column_name not in df.columns:
+# ------------------------------------------------------------
+# proceed/ の出力形式（CSV / Parquet）
+# ------------------------------------------------------------
+PROCEED_FORMATS = {
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def parse_format_overrides(spec: str) -> Dict[str, str]:
+    """PROCEED_FORMAT_OVERRIDES（"table=format,..."）を辞書に変換"""
+    overrides = {}
+    for item in spec.split(","):
+        if "=" not in item:
             continue
+        table_name, fmt = (part.strip() for part in item.split("=", 1))
+        overrides[table_name] = fmt.lower()
+    return overrides
 
-        for pattern in zero_date_patterns:
-            mask = df[column_name].astype(str).str.strip() == pattern
-            if mask.any():
-                df.loc[mask, column_name] = None
 
-    return df
+def resolve_proceed_format(table_name: str) -> str:
+    """テーブルの proceed/ 出力形式を決定（テーブル単位の上書き > PROCEED_FORMAT）"""
+    fmt = parse_format_overrides(PROCEED_FORMAT_OVERRIDES).get(table_name, PROCEED_FORMAT)
+    if fmt not in PROCEED_FORMATS:
+        logger.warning(f"不明な出力形式のため csv を使用: {table_name}={fmt}")
+        return "csv"
+    return fmt
 
 
-def transform_excel_to_csv(
-    excel_bytes: bytes,
+def _to_arrow_array(series: pd.Series, bq_type: str):
+    """
+    config/columns の型に合わせて列を Arrow 配列に変換
+
+    空文字は NULL とする（CSV ロード時と同じ扱い）。
+    DATE/DATETIME は変換済みの "YYYY-MM-DD" / "YYYY-MM-DD HH:MM:SS" 文字列を想定。
+    """
+    import pyarrow as pa
+
+    values = series.mask(series.astype(object).eq(''))
+
+    if bq_type == 'STRING':
+        return pa.array(values.map(lambda v: v if isinstance(v, str) else str(v), na_action='ignore'),
+                        type=pa.string(), from_pandas=True)
+    if bq_type == 'INT64':
+        return pa.array(pd.to_numeric(values), from_pandas=True).cast(pa.int64())
+    if bq_type == 'FLOAT64':
+        return pa.array(pd.to_numeric(values), type=pa.float64(), from_pandas=True)
+    if bq_type == 'NUMERIC':
+        # BigQuery NUMERIC（精度38・スケール9）。CSV ロード時と同じく float の文字列表現を小数第9位で四捨五入
+        scale = Decimal('1e-9')
+        # 全て欠損の列は map の結果が float64 になり decimal に変換できないため object にする
+        decimals = pd.to_numeric(values).map(
+            lambda v: Decimal(repr(v)).quantize(scale, rounding=ROUND_HALF_UP), na_action='ignore'
+        ).astype(object)
+        return pa.array(decimals, type=pa.decimal128(38, 9), from_pandas=True)
+    if bq_type == 'DATE':
+        return pa.array(pd.to_datetime(values).dt.date, type=pa.date32(), from_pandas=True)
+    if bq_type == 'DATETIME':
+        # 年月のみの値（「YYYY年M月」等）は DATETIME 列でも "YYYY-MM-DD" になるため、
+        # CSV ロード時と同じく 00:00:00 として解釈する（形式推定に任せると混在時にエラーになる）
+        text = values.astype('string')
+        text = text.mask(text.str.len() == 10, text + ' 00:00:00')
+        return pa.array(pd.to_datetime(text, format='%Y-%m-%d %H:%M:%S'), type=pa.timestamp('us'), from_pandas=True)
+    return pa.array(values, from_pandas=True)
+
+
+def dataframe_to_arrow_table(df: pd.DataFrame, column_mapping: Dict):
+    """
+    DataFrameをArrowテーブルに変換
+
+    スキーマは config/columns の型（column_mapping）から決定する。
+    マッピングにない列（source_folder 等）は pandas の型から推定する。
+    """
+    import pyarrow as pa
+
+    types = {m['en_name']: m['type'] for m in column_mapping.values()}
+    arrays = [_to_arrow_array(df[col], types.get(col)) for col in df.columns]
+    return pa.Table.from_arrays(arrays, names=[str(col) for col in df.columns])
+
+
+def dataframe_to_parquet_bytes(df: pd.DataFrame, column_mapping: Dict) -> bytes:
+    """DataFrameをParquetのバイト列に変換"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = dataframe_to_arrow_table(df, column_mapping)
+    buffer = pa.BufferOutputStream()
+    pq.write_table(table, buffer, compression=PARQUET_COMPRESSION)
+    return buffer.getvalue().to_pybytes()
+
+
+class ConversionPlan:
+    """
+    テーブルの変換手順（型変換 → カラム名変換 → 金額単位変換 → ゼロ日付変換 → リオーダー → 後処理）
+
+    カラムマッピングとコンパイル済みの金額単位変換ルール・ゼロ日付設定から変換対象の列を1回だけ組み立て、
+    チャンク単位の変換ではチャンクごとに再利用する。
+    apply() は渡された DataFrame の列を置き換えながら処理し、フレーム全体のコピーは作らない
+    （read_excel / iter_sheet_chunks が返した、他から参照されていない DataFrame を渡すこと）。
+    """
+
+    def __init__(
+        self,
+        table_name: str,
+        column_mapping: Dict[str, Dict[str, str]],
+        monetary_rules: Dict[str, MonetaryRuleSet],
+        zero_date_config: pd.DataFrame,
+        post_steps: Optional[List[PostStep]] = None
+    ):
+        self.table_name = table_name
+        self.column_mapping = column_mapping
+        self.post_steps = list(post_steps or [])
+        self.monetary_rules = monetary_rules.get(table_name)
+
+        # ゼロ日付変換の対象列（重複除去）
+        self.zero_date_columns: List[str] = []
+        if not zero_date_config.empty:
+            target = zero_date_config[zero_date_config['file_name'] == table_name]
+            self.zero_date_columns = list(dict.fromkeys(target['condition_column_name']))
+
+    def apply(self, df: pd.DataFrame, metrics: Optional[StageMetrics] = None) -> pd.DataFrame:
+        """読み込んだシート（日本語カラム名）に変換を適用（metrics を渡すと段階ごとに計測）"""
+        shape = {"rows": len(df), "columns": len(df.columns)}
+
+        # データ型変換（列ごとに1回）
+        with measure(metrics, "type_conversion") as span:
+            span.update(shape)
+            for col in df.columns:
+                mapping = self.column_mapping.get(col)
+                if mapping is not None:
+                    df[col] = convert_column(df[col], mapping['type'], col)
+
+        # カラム名変換（データはコピーしない）
+        with measure(metrics, "rename") as span:
+            span.update(shape)
+            df.columns = [
+                self.column_mapping[col]['en_name'] if col in self.column_mapping else col
+                for col in df.columns
+            ]
+
+        # 金額単位変換
+        with measure(metrics, "monetary") as span:
+            span.update(shape)
+            if self.monetary_rules is not None:
+                df = self.monetary_rules.apply(df)
+
+        # ゼロ日付変換（全パターンを1回の比較で判定）
+        with measure(metrics, "zero_date") as span:
+            span.update(shape)
+            for col in self.zero_date_columns:
+                if col not in df.columns:
+                    continue
+                mask = df[col].astype(str).str.strip().isin(ZERO_DATE_PATTERNS)
+                if mask.any():
+                    df.loc[mask, col] = None
+
+        with measure(metrics, "post_process") as span:
+            # BigQueryスキーマ順序に合わせてカラムをリオーダー
+            # パーティションフィールドを先頭に配置（BigQueryテーブル作成時の順序と一致させる）
+            df = reorder_columns_for_bigquery(df, self.table_name, self.column_mapping)
+
+            # テーブル固有の後処理
+            for step in self.post_steps:
+                df = step(df)
+            span.update(rows=len(df), columns=len(df.columns))
+
+        return df
+
+
+def transform_excel_to_dataframe(
+    excel_bytes: Union[bytes, pd.ExcelFile],
     table_name: str,
     sheet_name: Optional[str],
     bucket,
-    monetary_config: pd.DataFrame,
-    zero_date_config: pd.DataFrame
-) -> Tuple[bool, Optional[bytes], Optional[str]]:
+    monetary_rules: Dict[str, MonetaryRuleSet],
+    zero_date_config: pd.DataFrame,
+    excel_engine: Optional[str] = None,
+    prune_columns: Optional[bool] = None,
+    post_steps: Optional[List[PostStep]] = None,
+    column_mapping: Optional[Dict] = None,
+    metrics: Optional[StageMetrics] = None
+) -> Tuple[bool, Optional[pd.DataFrame], Optional[str]]:
     """
-    Excelファイルを読み込んでCSVに変換
+    Excelファイルを読み込んで変換済みのDataFrameを返す
+
+    Args:
+        excel_bytes: Excelファイルのバイト列、またはオープン済みの pd.ExcelFile
+        excel_engine: Excel読み込みエンジン（省略時は EXCEL_ENGINE）
+        prune_columns: マッピング対象外の列を読み込まない（省略時は EXCEL_PRUNE_COLUMNS）
+        post_steps: 変換後に順に適用する後処理（build_post_steps）
+        column_mapping: 読み込み済みのカラムマッピング（省略時は GCS から読み込む）
+        metrics: 処理段階の計測（省略時は計測しない）
 
     Returns:
-        (成功フラグ, CSVバイト列, エラーメッセージ)
+        (成功フラグ, DataFrame, エラーメッセージ)
     """
     try:
         # カラムマッピング読み込み
-        column_mapping = load_column_mapping_from_gcs(bucket, table_name)
+        if column_mapping is None:
+            column_mapping = load_column_mapping_from_gcs(bucket, table_name)
         if not column_mapping:
             error_msg = f"カラムマッピングが見つかりません: {table_name}"
             log_validation_error("column_mapping_missing", {
@@ -482,42 +1094,62 @@ def transform_excel_to_csv(
             return False, None, error_msg
 
         # Excel読み込み
-        excel_io = io.BytesIO(excel_bytes)
-        if sheet_name:
-            df = pd.read_excel(excel_io, sheet_name=sheet_name)
-        else:
-            df = pd.read_excel(excel_io)
-
-        if isinstance(df, dict):
-            df = list(df.values())[0]
-
-        # カラム名の改行を除去
-        df.columns = [col.replace('\n', '') if isinstance(col, str) else col for col in df.columns]
+        with measure(metrics, "parse") as span:
+            df = read_excel_sheet(excel_bytes, sheet_name, column_mapping, excel_engine, prune_columns, table_name)
+            span.update(rows=len(df), columns=len(df.columns))
+            if isinstance(excel_bytes, bytes):
+                span["input_bytes"] = len(excel_bytes)
 
         logger.info(f"データ読み込み: {len(df)}行 × {len(df.columns)}列")
 
-        # データ型変換
-        df = apply_data_type_conversion(df, column_mapping)
+        plan = ConversionPlan(table_name, column_mapping, monetary_rules, zero_date_config, post_steps)
+        return True, plan.apply(df, metrics), None
+
+    except Exception as e:
+        error_msg = f"変換エラー ({table_name}): {str(e)}"
+        log_validation_error("transform_error", {
+            "table_name": table_name,
+            "error": str(e)
+        })
+        return False, None, error_msg
 
-        # カラム名変換
-        df = rename_columns(df, column_mapping)
 
-        # 金額単位変換
-        df = apply_monetary_scale_conversion(df, table_name, monetary_config)
+def transform_excel_to_csv(
+    excel_bytes: Union[bytes, pd.ExcelFile],
+    table_name: str,
+    sheet_name: Optional[str],
+    bucket,
+    monetary_rules: Dict[str, MonetaryRuleSet],
+    zero_date_config: pd.DataFrame,
+    stats: Optional[Dict[str, Any]] = None,
+    excel_engine: Optional[str] = None,
+    prune_columns: Optional[bool] = None,
+    post_steps: Optional[List[PostStep]] = None
+) -> Tuple[bool, Optional[bytes], Optional[str]]:
+    """
+    Excelファイルを読み込んでCSVに変換
 
-        # ゼロ日付変換
-        df = apply_zero_date_to_null_conversion(df, table_name, zero_date_config)
+    後処理（post_steps）まで適用したDataFrameを1回だけCSVに書き出す。
 
-        # BigQueryスキーマ順序に合わせてカラムをリオーダー
-        # パーティションフィールドを先頭に配置（BigQueryテーブル作成時の順序と一致させる）
-        df = reorder_columns_for_bigquery(df, table_name, column_mapping)
+    Args:
+        stats: 指定した場合、出力行数・列数を格納する（進捗集計用）
+        その他は transform_excel_to_dataframe と同じ
 
-        # CSV出力
-        csv_buffer = io.StringIO()
-        df.to_csv(csv_buffer, index=False, encoding='utf-8')
-        csv_bytes = csv_buffer.getvalue().encode('utf-8')
+    Returns:
+        (成功フラグ, CSVバイト列, エラーメッセージ)
+    """
+    success, df, error_msg = transform_excel_to_dataframe(
+        excel_bytes, table_name, sheet_name, bucket, monetary_rules, zero_date_config,
+        excel_engine=excel_engine, prune_columns=prune_columns, post_steps=post_steps
+    )
+    if not success:
+        return False, None, error_msg
 
-        return True, csv_bytes, None
+    try:
+        if stats is not None:
+            stats["rows"] = len(df)
+            stats["columns"] = len(df.columns)
+        return True, dataframe_to_csv_bytes(df), None
 
     except Exception as e:
         error_msg = f"変換エラー ({table_name}): {str(e)}"
@@ -531,24 +1163,781 @@ def transform_excel_to_csv(
 # ============================================================
 # メイン処理
 # ============================================================
-def process_month(yyyymm: str, mode: str = "replace") -> dict:
+# ------------------------------------------------------------
+# チャンク単位の変換（大規模な台帳ブック向け）
+# ------------------------------------------------------------
+# pandas.read_excel が欠損値として扱う文字列（既定の na_values と Excel のエラー値）
+STREAM_NA_STRINGS = frozenset([
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+    "#NULL!", "#DIV/0!", "#VALUE!", "#REF!", "#NAME?", "#NUM!",
+])
+
+
+def is_streaming_table(table_name: str) -> bool:
+    """STREAMING_TABLES に含まれるテーブルか"""
+    return table_name in {t.strip() for t in STREAMING_TABLES.split(",") if t.strip()}
+
+
+def _stream_cell_value(value: Any) -> Any:
+    """openpyxl のセル値を pandas.read_excel と同じ規則で変換（整数値の float は int、欠損値文字列は None）"""
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else value
+    if isinstance(value, str) and value in STREAM_NA_STRINGS:
+        return None
+    return value
+
+
+def iter_sheet_chunks(
+    workbook,
+    sheet_name: Optional[str],
+    column_mapping: Dict[str, Dict[str, str]],
+    chunk_rows: int,
+    table_name: Optional[str] = None
+) -> Optional[Iterator[pd.DataFrame]]:
+    """
+    read_only で開いたブックのシートを chunk_rows 行ずつの DataFrame として読み込む
+
+    ヘッダー行でカラムマッピングに存在する列だけを選び、値は object 型のまま渡す。
+    table_name を指定した場合は、選ばなかった列を read_excel_sheet と同じく警告ログに出す。
+    途中の空行は read_excel と同じく欠損行として残し、末尾の空行は除く。
+    データ行がない場合もヘッダー出力のため空の DataFrame を1つ返す。
+
+    Returns:
+        チャンクのイテレータ。マッピング対象の列がヘッダーに見つからない場合は None
+    """
+    sheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+    sheet.reset_dimensions()
+    rows = sheet.iter_rows(values_only=True)
+
+    # 重複した列名は read_excel では "名前.1" になりマッピング対象外となるため、最初の列のみ使う
+    positions: Dict[str, int] = {}
+    unmapped: List[Any] = []
+    for i, name in enumerate(_normalize_column_name(v) for v in next(rows, ())):
+        if name in column_mapping and name not in positions:
+            positions[name] = i
+        elif name is not None:
+            unmapped.append(name)
+    if not positions:
+        return None
+    if table_name:
+        log_unmapped_columns(table_name, unmapped)
+    columns, indices = list(positions), list(positions.values())
+
+    def chunks() -> Iterator[pd.DataFrame]:
+        buffer: List[List[Any]] = []
+        blank_rows = 0
+        emitted = False
+        for row in rows:
+            if all(v is None or v == "" for v in row):
+                blank_rows += 1
+                continue
+            # 後続にデータ行がある場合のみ空行を出力
+            buffer.extend([None] * len(indices) for _ in range(blank_rows))
+            blank_rows = 0
+            buffer.append([_stream_cell_value(row[i]) if i < len(row) else None for i in indices])
+            if len(buffer) >= chunk_rows:
+                yield pd.DataFrame(buffer, columns=columns, dtype=object)
+                buffer, emitted = [], True
+        if buffer or not emitted:
+            yield pd.DataFrame(buffer, columns=columns, dtype=object)
+
+    return chunks()
+
+
+def _chunk_value_kind(values: np.ndarray) -> str:
+    """
+    欠損以外のセル値の種類（read_excel の列の型推定で区別するもの）
+
+    数値・真偽値・数値として解釈できる文字列のみの場合は pd.to_numeric（read_excel と同じ解釈）の
+    結果の型で bool / int / float、datetime のみの場合は datetime、それ以外は object。値がなければ empty。
+    """
+    if len(values) == 0:
+        return "empty"
+    kinds = set(pd.Series(values, dtype=object).map(type).unique())
+    if kinds <= {datetime, pd.Timestamp}:
+        return "datetime"
+    if not kinds <= {bool, int, float, str}:
+        return "object"
+    numbers = pd.to_numeric(pd.Series(values, dtype=object), errors="coerce")
+    if numbers.isna().any():
+        return "object"
+    return {"b": "bool", "i": "int", "u": "int"}.get(numbers.dtype.kind, "float")
+
+
+# 2つのチャンクの値の種類を合わせた列全体の種類
+_VALUE_KIND_ORDER = {"bool": 0, "int": 1, "float": 2}
+
+
+def _merge_value_kinds(left: str, right: str) -> str:
+    if left == "empty" or left == right:
+        return right
+    if right == "empty":
+        return left
+    if left in _VALUE_KIND_ORDER and right in _VALUE_KIND_ORDER:
+        return max(left, right, key=_VALUE_KIND_ORDER.get)
+    return "object"
+
+
+def _datetime_format_level(stamps: pd.Series) -> pd.Series:
+    """astype(str) の書式を決める日時の細かさ（0: 日付のみ, 1: 秒, 2: ミリ秒, 3: マイクロ秒）"""
+    micros = stamps.dt.microsecond
+    return pd.Series(
+        np.select(
+            [micros % 1000 != 0, micros != 0, stamps != stamps.dt.normalize()],
+            [3, 2, 1], 0
+        ),
+        index=stamps.index
+    )
+
+
+class StreamColumnTypes:
+    """
+    チャンク単位の変換で使う、シート全体の列の型（read_excel の列単位の型推定と同じ結果）
+
+    read_excel はシート全体を読んでから列ごとに型を決める（欠損のない整数のみの列は int64、
+    欠損や小数を含む数値の列は float64、datetime のみの列は datetime64、それ以外は object）。
+    チャンクごとに型を決めると STRING 列の "123" と "123.0" 等が揃わないため、
+    1回目の走査（observe）で列ごとの値の種類を集め、2回目の走査（apply）で各チャンクをその型に揃える。
+    """
+
+    def __init__(self, columns: List[str]):
+        self.kinds: Dict[str, str] = {col: "empty" for col in columns}
+        self.has_na: Dict[str, bool] = {col: False for col in columns}
+        # datetime 列の astype(str) の書式を決める値（列内で最も細かい時刻を持つ値）
+        self.datetime_samples: Dict[str, pd.Timestamp] = {}
+
+    def observe(self, chunk: pd.DataFrame) -> None:
+        """1回目の走査: チャンクの値の種類を列ごとに集計"""
+        for col in chunk.columns:
+            if self.kinds[col] == "object":
+                continue  # object に決まった列は以降のチャンクを見ない
+            values = chunk[col].to_numpy(dtype=object)
+            present = values[pd.notna(values)]
+            self.has_na[col] |= len(present) < len(values)
+            kind = _chunk_value_kind(present)
+            self.kinds[col] = _merge_value_kinds(self.kinds[col], kind)
+            if kind == "datetime":
+                stamps = pd.Series(pd.to_datetime(present))
+                levels = _datetime_format_level(stamps)
+                sample = self.datetime_samples.get(col)
+                if sample is None or levels.max() > _datetime_format_level(pd.Series([sample])).iloc[0]:
+                    self.datetime_samples[col] = stamps.iloc[int(levels.to_numpy().argmax())]
+
+    def dtype(self, col: str) -> str:
+        """read_excel が列に付ける型（int64 / float64 / bool / datetime64 / object）"""
+        kind, has_na = self.kinds[col], self.has_na[col]
+        if kind in ("bool", "int"):
+            return "float64" if has_na else ("bool" if kind == "bool" else "int64")
+        if kind == "float" or (kind == "empty" and has_na):
+            return "float64"
+        if kind == "datetime":
+            return "datetime64"
+        return "object"
+
+    def apply(self, chunk: pd.DataFrame, column_mapping: Dict[str, Dict[str, str]]) -> pd.DataFrame:
+        """2回目の走査: チャンクの列をシート全体の型に変換（チャンクの列を置き換える）"""
+        for col in chunk.columns:
+            dtype = self.dtype(col)
+            values = chunk[col]
+            if dtype in ("int64", "float64", "bool"):
+                numbers = pd.to_numeric(values)
+                chunk[col] = numbers if numbers.dtype.kind == "u" and dtype == "int64" else numbers.astype(dtype)
+            elif dtype == "datetime64":
+                stamps = pd.to_datetime(values)
+                if column_mapping.get(col, {}).get("type") == "STRING":
+                    # astype(str) の書式（日付のみ / 時刻 / 小数秒）は列全体の値で決まるため、
+                    # 列内で最も細かい時刻を持つ値を加えて文字列化する
+                    sample = pd.Series([self.datetime_samples[col]], dtype=stamps.dtype)
+                    text = convert_column(pd.concat([stamps, sample], ignore_index=True), "STRING", col)
+                    chunk[col] = text.iloc[:len(stamps)].set_axis(values.index)
+                else:
+                    chunk[col] = stamps
+            else:
+                # 欠損値は read_excel と同じく NaN（ndarray のまま代入すると datetime のみのチャンクが datetime64 になる）
+                objects = values.to_numpy(dtype=object)
+                objects[pd.isna(objects)] = np.nan
+                chunk[col] = pd.Series(objects, index=values.index, dtype=object)
+        return chunk
+
+
+def stream_excel_to_proceed(
+    excel_bytes: bytes,
+    table_name: str,
+    sheet_name: Optional[str],
+    column_mapping: Dict[str, Dict[str, str]],
+    monetary_rules: Dict[str, MonetaryRuleSet],
+    zero_date_config: pd.DataFrame,
+    post_steps: Optional[List[PostStep]],
+    output_format: str,
+    out,
+    chunk_rows: Optional[int] = None,
+    metrics: Optional[StageMetrics] = None
+) -> Optional[int]:
+    """
+    Excelシートをチャンク単位で変換し、出力ストリームに逐次書き込み
+
+    openpyxl の read_only モードで行を順に読み、chunk_rows 行ごとに transform_excel_to_dataframe と
+    同じ変換（ConversionPlan）を適用して書き出すため、メモリ使用量はシート全体ではなく
+    チャンクの大きさで決まる。列の型は先にシート全体を1回走査して read_excel と同じ規則で決め
+    （StreamColumnTypes）、各チャンクをその型に揃えてから変換するため、出力は
+    transform_excel_to_dataframe の結果と同じになる（シートの読み込みは2回になる）。
+
+    Args:
+        excel_bytes: Excelファイルのバイト列
+        output_format: csv / parquet
+        out: 書き込み先（blob.open("wb") 等のバイナリストリーム）
+        chunk_rows: 1チャンクの行数（省略時は STREAM_CHUNK_ROWS）
+        metrics: 処理段階の計測（チャンクごとの計測値を段階ごとに合算）
+
+    Returns:
+        書き込んだ行数。マッピング対象の列がヘッダーに見つからない場合は None（何も書き込まない）
+    """
+    import openpyxl
+
+    with measure(metrics, "parse") as span:
+        span["input_bytes"] = len(excel_bytes)
+        workbook = openpyxl.load_workbook(io.BytesIO(excel_bytes), read_only=True, data_only=True, keep_links=False)
+    try:
+        chunk_rows = chunk_rows or STREAM_CHUNK_ROWS
+        with measure(metrics, "parse"):
+            chunks = iter_sheet_chunks(workbook, sheet_name, column_mapping, chunk_rows, table_name)
+            if chunks is None:
+                return None
+            # 1回目の走査: 列の型の推定
+            column_types = None
+            for chunk in chunks:
+                column_types = column_types or StreamColumnTypes(list(chunk.columns))
+                column_types.observe(chunk)
+            chunks = iter_sheet_chunks(workbook, sheet_name, column_mapping, chunk_rows)
+
+        plan = ConversionPlan(table_name, column_mapping, monetary_rules, zero_date_config, post_steps)
+        parquet_writer = None
+        rows = 0
+        while True:
+            # チャンクの読み込み（シートの行の読み進め）も parse として計測
+            with measure(metrics, "parse") as span:
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    chunk = column_types.apply(chunk, column_mapping)
+                    span.update(rows=len(chunk), columns=len(chunk.columns))
+            if chunk is None:
+                break
+
+            df = plan.apply(chunk, metrics)
+            with measure(metrics, "serialize") as span:
+                position = out.tell()
+                if output_format == "parquet":
+                    import pyarrow.parquet as pq
+
+                    table = dataframe_to_arrow_table(df, column_mapping)
+                    if parquet_writer is None:
+                        parquet_writer = pq.ParquetWriter(out, table.schema, compression=PARQUET_COMPRESSION)
+                    else:
+                        # 型を推定する列（全て欠損のチャンク等）を先頭チャンクのスキーマに揃える
+                        table = table.cast(parquet_writer.schema)
+                    parquet_writer.write_table(table)
+                else:
+                    df.to_csv(out, index=False, header=(rows == 0 and position == 0), encoding='utf-8')
+                span.update(rows=len(df), columns=len(df.columns), output_bytes=out.tell() - position)
+            rows += len(df)
+            logger.info(f"チャンク変換: {table_name} 累計{rows}行")
+
+        if parquet_writer is not None:
+            with measure(metrics, "serialize") as span:
+                position = out.tell()
+                parquet_writer.close()
+                span["output_bytes"] = out.tell() - position
+        return rows
+    finally:
+        workbook.close()
+
+
+def stream_table_to_proceed(
+    bucket,
+    raw_blob,
+    yyyymm: str,
+    table_name: str,
+    sheet_name: Optional[str],
+    column_mapping: Dict[str, Dict[str, str]],
+    monetary_rules: Dict[str, MonetaryRuleSet],
+    zero_date_config: pd.DataFrame,
+    post_steps: List[PostStep],
+    output_format: str,
+    metrics: Optional[StageMetrics] = None
+) -> Optional[Tuple[Any, int]]:
+    """
+    チャンク単位で変換した結果を一時ファイルに逐次アップロードし、完了後に proceed/ へコピー
+
+    書き込み途中で失敗しても proceed/ の既存ファイルは置き換わらない。
+    チャンクの書き込み（BlobWriter によるアップロードを含む）は serialize、
+    アップロードの完了と proceed/ へのコピーは upload として計測する。
+
+    Returns:
+        (proceed/ の Blob, 行数)。マッピング対象の列がヘッダーに見つからない場合は None
+    """
+    proceed_path = f"{GCS_PROCEED_PREFIX}/{yyyymm}/{table_name}.{output_format}"
+    temp_blob = bucket.blob(f"{GCS_STREAM_TEMP_PREFIX}/{yyyymm}/{table_name}.{uuid.uuid4().hex[:8]}.{output_format}")
+    # 一時ファイルはダウンロードの成功後に開く（ダウンロードの失敗で空の一時ファイルを作らない）
+    with measure(metrics, "download") as span:
+        excel_bytes = raw_blob.download_as_bytes()
+        span["output_bytes"] = len(excel_bytes)
+    # to_csv は書き込み後に flush() を呼ぶが、BlobWriter の flush() は ignore_flush を指定しないと例外になる
+    writer = temp_blob.open("wb", content_type=PROCEED_FORMATS[output_format], ignore_flush=True)
+    try:
+        rows = stream_excel_to_proceed(
+            excel_bytes, table_name, sheet_name, column_mapping,
+            monetary_rules, zero_date_config, post_steps, output_format, writer, metrics=metrics
+        )
+        del excel_bytes
+        with measure(metrics, "upload") as span:
+            span["input_bytes"] = writer.tell()
+            writer.close()
+            if rows is None:
+                return None
+            return bucket.copy_blob(temp_blob, bucket, proceed_path), rows
+    finally:
+        try:
+            if not writer.closed:
+                writer.close()
+            temp_blob.delete()
+        except Exception as e:
+            logger.warning(f"一時ファイルの削除に失敗: {temp_blob.name}: {e}")
+
+
+def transform_table(
+    bucket,
+    yyyymm: str,
+    table_name: str,
+    monetary_rules: Dict[str, MonetaryRuleSet],
+    zero_date_config: pd.DataFrame,
+    raw_index: Optional[Dict[str, Any]] = None,
+    workbooks: Optional[WorkbookCache] = None
+) -> dict:
+    """
+    1テーブル分のraw → proceed変換（ダウンロード・変換・アップロード）
+
+    処理段階ごとの計測値を結果の "metrics" に含め、構造化ログ（log_type=transform_metrics）にも出力する。
+
+    Args:
+        raw_index: 月フォルダのファイルインデックス（build_raw_file_index）
+        workbooks: 指定時はブックをキャッシュから取得（同じブックを参照するテーブル間で共有）
+
+    Returns:
+        {"table", "status": success/error/skipped, "rows", "metrics", "error" or "reason"}
+    """
+    metrics = StageMetrics()
+    outcome = _transform_table(
+        bucket, yyyymm, table_name, monetary_rules, zero_date_config, raw_index, workbooks, metrics
+    )
+    outcome["metrics"] = metrics.to_dict()
+    log_transform_metrics(yyyymm, outcome)
+    return outcome
+
+
+def _transform_table(
+    bucket,
+    yyyymm: str,
+    table_name: str,
+    monetary_rules: Dict[str, MonetaryRuleSet],
+    zero_date_config: pd.DataFrame,
+    raw_index: Optional[Dict[str, Any]],
+    workbooks: Optional[WorkbookCache],
+    metrics: StageMetrics
+) -> dict:
+    """transform_table の本体（metrics に処理段階ごとの計測値を記録）"""
+    try:
+        # シート名取得
+        sheet_name = TABLE_SHEET_MAPPING.get(table_name)
+
+        # rawファイル検索
+        raw_blob, raw_path = find_raw_file(bucket, table_name, yyyymm, index=raw_index)
+
+        if raw_blob is None:
+            log_validation_warning("file_not_found", {
+                "table_name": table_name,
+                "yyyymm": yyyymm,
+                "message": f"rawファイルが見つかりません"
+            })
+            return {"table": table_name, "status": "skipped", "reason": "file_not_found"}
+
+        column_mapping = load_column_mapping_from_gcs(bucket, table_name)
+        post_steps = build_post_steps(table_name, yyyymm)
+        output_format = resolve_proceed_format(table_name)
+        proceed_path = f"{GCS_PROCEED_PREFIX}/{yyyymm}/{table_name}.{output_format}"
+
+        # 大規模な台帳ブックはチャンク単位で変換し、シート全体をメモリに載せない
+        streamed = None
+        if is_streaming_table(table_name) and column_mapping:
+            streamed = stream_table_to_proceed(
+                bucket, raw_blob, yyyymm, table_name, sheet_name, column_mapping,
+                monetary_rules, zero_date_config, post_steps, output_format, metrics
+            )
+            if streamed is None:
+                logger.warning(f"マッピング対象の列がヘッダーに見つからないため一括で変換します: {table_name}")
+
+        if streamed is not None:
+            proceed_blob, rows = streamed
+        else:
+            # Excelダウンロード
+            if workbooks is not None:
+                generation = raw_index["files"].get(raw_path[len(raw_index["prefix"]):]) if raw_index else None
+                excel_source = workbooks.open(raw_blob, generation, metrics)
+            else:
+                with measure(metrics, "download") as span:
+                    excel_source = raw_blob.download_as_bytes()
+                    span["output_bytes"] = len(excel_source)
+
+            # 変換（累積型テーブルの source_folder 追加等の後処理も含め、書き出しは1回のみ）
+            success, df, error_msg = transform_excel_to_dataframe(
+                excel_source, table_name, sheet_name, bucket,
+                monetary_rules, zero_date_config,
+                post_steps=post_steps,
+                column_mapping=column_mapping,
+                metrics=metrics
+            )
+            del excel_source
+
+            if not success:
+                return {"table": table_name, "status": "error", "error": error_msg}
+
+            rows = len(df)
+            with measure(metrics, "serialize") as span:
+                if output_format == "parquet":
+                    data = dataframe_to_parquet_bytes(df, column_mapping)
+                else:
+                    data = dataframe_to_csv_bytes(df)
+                span.update(rows=rows, columns=len(df.columns), output_bytes=len(data))
+            del df
+
+            # proceedにアップロード
+            with measure(metrics, "upload") as span:
+                span["input_bytes"] = len(data)
+                proceed_blob = bucket.blob(proceed_path)
+                proceed_blob.upload_from_string(data, content_type=PROCEED_FORMATS[output_format])
+
+        # 出力形式を切り替えた場合、もう一方の形式の古いファイルを削除（ロード時の二重取り込み防止）
+        for other_format in PROCEED_FORMATS:
+            if other_format != output_format:
+                stale_blob = bucket.blob(f"{GCS_PROCEED_PREFIX}/{yyyymm}/{table_name}.{other_format}")
+                if stale_blob.exists():
+                    stale_blob.delete()
+                    logger.info(f"旧形式のファイルを削除: {stale_blob.name}")
+
+        logger.info(f"変換完了: {table_name} → {proceed_path}")
+        return {
+            "table": table_name, "status": "success", "rows": rows,
+            "output": proceed_path, "generation": proceed_blob.generation
+        }
+
+    except Exception as e:
+        log_validation_error("process_error", {
+            "table_name": table_name,
+            "yyyymm": yyyymm,
+            "error": str(e)
+        })
+        return {"table": table_name, "status": "error", "error": f"処理エラー: {str(e)}"}
+
+
+def group_tables_by_raw_file(yyyymm: str, table_names: List[str], raw_index: Dict[str, Any]) -> List[List[str]]:
+    """同じrawファイルを参照するテーブルをまとめる（rawファイルがないテーブルは単独のグループ）"""
+    groups: Dict[str, List[str]] = {}
+    for table_name in table_names:
+        name, _ = resolve_raw_file_name(table_name, yyyymm, raw_index)
+        groups.setdefault(name or f"missing:{table_name}", []).append(table_name)
+    return list(groups.values())
+
+
+def transform_table_group(
+    bucket,
+    yyyymm: str,
+    table_names: List[str],
+    monetary_rules: Dict[str, MonetaryRuleSet],
+    zero_date_config: pd.DataFrame,
+    raw_index: Dict[str, Any]
+) -> List[dict]:
+    """同じrawファイルを参照するテーブル群を、ブックを1回だけ開いて順に変換"""
+    with WorkbookCache() as workbooks:
+        return [
+            transform_table(bucket, yyyymm, table_name, monetary_rules, zero_date_config, raw_index, workbooks)
+            for table_name in table_names
+        ]
+
+
+# ------------------------------------------------------------
+# プロセスプールによるテーブル並列変換
+# ------------------------------------------------------------
+# pd.read_excel は CPU バウンドかつ GIL を保持するため、スレッドではなくプロセスで並列化する。
+# gunicorn のスレッドから fork すると GCS クライアント等の状態を引き継いでしまうため spawn で起動し、
+# 各ワーカーは RLIMIT_AS でメモリ上限を設ける（超過時は MemoryError となり当該テーブルのみエラー）
+_worker_bucket = None
+
+
+def _init_transform_worker(memory_limit_mb: int) -> None:
+    """ワーカープロセス初期化: メモリ上限の設定とGCSクライアント生成"""
+    global _worker_bucket
+    if memory_limit_mb > 0:
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    _worker_bucket = storage.Client().bucket(LANDING_BUCKET)
+
+
+def _transform_table_group_in_worker(
+    yyyymm: str,
+    table_names: List[str],
+    monetary_rules: Dict[str, MonetaryRuleSet],
+    zero_date_config: pd.DataFrame,
+    raw_index: Dict[str, Any]
+) -> List[dict]:
+    return transform_table_group(_worker_bucket, yyyymm, table_names, monetary_rules, zero_date_config, raw_index)
+
+
+class TransformPool:
+    """
+    テーブル変換用のプロセスプール
+
+    複数のジョブ（スレッド）から同時に投入できる。
+    ワーカーが異常終了（OOM Kill 等）してプールが壊れた場合は次回の投入時に作り直す。
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._executor = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def submit(self, *args):
+        """テーブルのグループを投入（Future の pool_generation に投入先のプールの世代を記録）"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_transform_worker,
+                    initargs=(TRANSFORM_WORKER_MEMORY_MB,),
+                    max_tasks_per_child=TRANSFORM_WORKER_MAX_TASKS or None,
+                )
+                self._generation += 1
+            future = self._executor.submit(_transform_table_group_in_worker, *args)
+            future.pool_generation = self._generation
+            return future
+
+    def discard(self, generation: Optional[int] = None) -> None:
+        """
+        壊れたプールを破棄（次回 submit で作り直す）
+
+        generation を指定した場合は、そのプールがまだ使われているときのみ破棄する
+        （他のジョブが作り直したプールを破棄しない）。
+        """
+        with self._lock:
+            if self._executor is not None and generation in (None, self._generation):
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+
+# Cloud Run は非同期ジョブの受付後に同じインスタンスへ別のリクエスト（他のシャード等）を送るため、
+# ジョブごとにプールを作るとインスタンス内のワーカーがジョブ数 × TRANSFORM_WORKERS に増える。
+# プロセス内で1つのプールを共有し、同時に動くジョブ数によらずワーカー数を TRANSFORM_WORKERS に抑える
+_shared_pool: Optional[TransformPool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def shared_transform_pool() -> TransformPool:
+    """プロセス内で共有するテーブル変換用のプロセスプール（ワーカー数は TRANSFORM_WORKERS）"""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = TransformPool(TRANSFORM_WORKERS)
+        return _shared_pool
+
+
+def _transform_tables_in_pool(
+    pool: TransformPool,
+    yyyymm: str,
+    groups: List[List[str]],
+    monetary_rules: Dict[str, MonetaryRuleSet],
+    zero_date_config: pd.DataFrame,
+    raw_index: Dict[str, Any]
+):
+    """テーブルのグループをプロセスプールで並列変換し、完了順に結果を返す"""
+    futures = {
+        pool.submit(yyyymm, group, monetary_rules, zero_date_config, raw_index): group
+        for group in groups
+    }
+    broken = set()
+    for future in as_completed(futures):
+        try:
+            yield from future.result()
+        except Exception as e:
+            # BrokenProcessPool: ワーカーの異常終了で、未完了のテーブルは全てここに来る
+            if isinstance(e, BrokenProcessPool):
+                broken.add(future.pool_generation)
+            for table_name in futures[future]:
+                log_validation_error("process_error", {
+                    "table_name": table_name,
+                    "yyyymm": yyyymm,
+                    "error": f"ワーカープロセスでの処理に失敗しました: {e!r}"
+                })
+                yield {"table": table_name, "status": "error", "error": f"ワーカープロセスエラー: {e!r}"}
+    for generation in broken:
+        pool.discard(generation)
+
+
+# ------------------------------------------------------------
+# 変換マニフェスト（入力が前回と同一のテーブルの再変換を省略）
+# ------------------------------------------------------------
+# 出力ごとに rawファイルの md5・設定ファイル（カラムマッピング / 金額単位 / ゼロ日付）の md5・
+# 変換処理のバージョンから求めたフィンガープリントを manifests/raw-to-proceed/YYYYMM.json に記録する。
+# md5 は一覧取得のメタデータから得るため、未変更のテーブルはダウンロードも発生しない
+def _manifest_blob(bucket, yyyymm: str):
+    return bucket.blob(f"{TRANSFORM_MANIFEST_PREFIX}/{yyyymm}.json")
+
+
+def load_transform_manifest(bucket, yyyymm: str) -> Dict[str, Any]:
+    """月の変換マニフェストを読み込み（{テーブル名: 前回変換時の記録}）"""
+    blob = _manifest_blob(bucket, yyyymm)
+    if not blob.exists():
+        return {}
+    try:
+        return json.loads(blob.download_as_text()).get("tables", {})
+    except ValueError as e:
+        logger.warning(f"変換マニフェストを読み込めないため無視: {blob.name}: {e}")
+        return {}
+
+
+def save_transform_manifest(bucket, yyyymm: str, updates: Dict[str, Any], max_attempts: int = 5) -> None:
+    """
+    月の変換マニフェストに変換したテーブルの記録を反映
+
+    GCS 完了通知による変換が同じ月で並行して走るため、最新のマニフェストを読み直して更新分をマージし、
+    世代番号の一致を条件に書き込む（競合時は再試行）
+    """
+    for attempt in range(max_attempts):
+        blob = bucket.get_blob(f"{TRANSFORM_MANIFEST_PREFIX}/{yyyymm}.json")
+        generation = blob.generation if blob else 0
+        tables = json.loads(blob.download_as_text()).get("tables", {}) if blob else {}
+        tables.update(updates)
+        manifest = {
+            "yyyymm": yyyymm,
+            "updated_at": datetime.utcnow().isoformat() + "Z",
+            "tables": tables,
+        }
+        try:
+            _manifest_blob(bucket, yyyymm).upload_from_string(
+                json.dumps(manifest, ensure_ascii=False, indent=2), content_type="application/json",
+                if_generation_match=generation
+            )
+            return
+        except PreconditionFailed:
+            logger.info(f"変換マニフェストの更新が競合したため再試行: {yyyymm} ({attempt + 1}/{max_attempts})")
+    logger.warning(f"変換マニフェストを更新できませんでした（次回は再変換されます）: {yyyymm} {sorted(updates)}")
+
+
+def load_config_hashes(bucket) -> Dict[str, Optional[str]]:
+    """config/columns・config/mapping 配下のファイルの md5（{GCSパス: md5}）を一覧取得"""
+    hashes = {}
+    for path in (GCS_COLUMNS_PATH, GCS_MAPPING_PATH):
+        for blob in bucket.list_blobs(prefix=f"{path}/"):
+            hashes[blob.name] = blob.md5_hash
+    return hashes
+
+
+def transform_fingerprint(
+    table_name: str,
+    yyyymm: str,
+    raw_index: Dict[str, Any],
+    config_hashes: Dict[str, Optional[str]]
+) -> Optional[Dict[str, Any]]:
+    """
+    テーブルの変換入力からフィンガープリントを計算
+
+    Returns:
+        {"fingerprint": ハッシュ, "inputs": 計算に使った入力}
+        rawファイルがない、または md5 がない（コンポジットオブジェクト等）場合は None（常に変換）
+    """
+    raw_name, _ = resolve_raw_file_name(table_name, yyyymm, raw_index)
+    if raw_name is None or not raw_index["md5"].get(raw_name):
+        return None
+    inputs = {
+        "raw_file": raw_name,
+        "raw_md5": raw_index["md5"].get(raw_name),
+        "column_mapping_md5": config_hashes.get(f"{GCS_COLUMNS_PATH}/{table_name}.csv"),
+        "monetary_scale_md5": config_hashes.get(MONETARY_SCALE_FILE),
+        "zero_date_md5": config_hashes.get(ZERO_DATE_FILE),
+        "transformer_version": TRANSFORMER_VERSION,
+        "output_format": resolve_proceed_format(table_name),
+        "excel_engine": resolve_excel_engine(),
+        "prune_columns": EXCEL_PRUNE_COLUMNS,
+        "streaming": is_streaming_table(table_name),
+    }
+    fingerprint = hashlib.md5(json.dumps(inputs, sort_keys=True).encode("utf-8")).hexdigest()
+    return {"fingerprint": fingerprint, "inputs": inputs}
+
+
+def is_transform_unchanged(
+    entry: Optional[Dict[str, Any]],
+    fingerprint: Optional[Dict[str, Any]],
+    outputs: Dict[str, Any]
+) -> bool:
+    """前回と入力が同一で、前回の出力ファイル（同じ世代）が proceed/ に残っているか"""
+    if not entry or not fingerprint or entry.get("fingerprint") != fingerprint["fingerprint"]:
+        return False
+    return entry.get("output") in outputs and outputs[entry["output"]] == entry.get("output_generation")
+
+
+def process_month(
+    yyyymm: str,
+    mode: str = "replace",
+    progress: Optional["JobProgress"] = None,
+    completed_units: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+    pool: Optional[TransformPool] = None,
+    force: bool = False,
+    tables: Optional[List[str]] = None,
+    raw_index: Optional[Dict[str, Any]] = None
+) -> dict:
     """
     指定月のraw → proceed変換を実行
 
+    入力（rawファイル・設定ファイル・変換処理）が前回変換時と同一のテーブルは変換せず unchanged とする。
+
     Args:
         yyyymm: 対象年月
         mode: 処理モード（replace/append）
+        progress: 非同期ジョブの進捗記録。テーブル単位（"YYYYMM/テーブル名"）で完了を記録する
+        completed_units: ジョブ再開時に処理済みの単位（"YYYYMM/テーブル名"）のリスト
+        workers: 2以上の場合はプロセスプールで並列変換（省略時は TRANSFORM_WORKERS、1以下は逐次処理）
+        pool: 使うプロセスプール（省略時は shared_transform_pool。並列数はプールのワーカー数）
+        force: True の場合は入力が同一でも全テーブルを再変換
+        tables: 対象テーブル（省略時は TABLES 全て。GCS 完了通知では届いたブックのテーブルのみ）
+        raw_index: 取得済みの月フォルダのインデックス（省略時はここで取得）
 
     Returns:
         処理結果
     """
-    logger.info(f"処理開始: yyyymm={yyyymm}, mode={mode}")
+    completed_units = set(completed_units or [])
+    if pool is None and (workers or TRANSFORM_WORKERS) > 1:
+        pool = shared_transform_pool()
+    workers = pool.workers if pool else 1
+    logger.info(f"処理開始: yyyymm={yyyymm}, mode={mode}, workers={workers}, force={force}")
 
     client = storage.Client()
     bucket = client.bucket(LANDING_BUCKET)
 
     # 設定読み込み
-    monetary_config = load_monetary_scale_config_from_gcs(bucket)
+    monetary_rules = load_monetary_rules_from_gcs(bucket)
     zero_date_config = load_zero_date_config_from_gcs(bucket)
 
     results = {
@@ -556,98 +1945,162 @@ def process_month(yyyymm: str, mode: str = "replace") -> dict:
         "mode": mode,
         "success": [],
         "errors": [],
-        "skipped": []
+        "skipped": [],
+        "unchanged": [],
+        "resumed": [],
+        "rows": 0,
+        "stage_seconds": {},
+        "metrics": {}
     }
 
-    for table_name in TABLES:
-        try:
-            # シート名取得
-            sheet_name = TABLE_SHEET_MAPPING.get(table_name)
-
-            # rawファイル検索
-            raw_blob, raw_path = find_raw_file(bucket, table_name, yyyymm)
-
-            if raw_blob is None:
-                log_validation_warning("file_not_found", {
-                    "table_name": table_name,
-                    "yyyymm": yyyymm,
-                    "message": f"rawファイルが見つかりません"
-                })
-                results["skipped"].append({
-                    "table": table_name,
-                    "reason": "file_not_found"
-                })
-                continue
+    # 月フォルダの一覧は1回だけ取得し、全テーブルのファイル検索に使い回す
+    if raw_index is None:
+        raw_index = build_raw_file_index(bucket, yyyymm)
 
-            # Excelダウンロード
-            excel_bytes = raw_blob.download_as_bytes()
+    # 前回変換時の記録と現在の入力を比較
+    manifest = load_transform_manifest(bucket, yyyymm)
+    config_hashes = load_config_hashes(bucket)
+    outputs = {b.name: b.generation for b in bucket.list_blobs(prefix=f"{GCS_PROCEED_PREFIX}/{yyyymm}/")}
+    fingerprints = {}
 
-            # 変換
-            success, csv_bytes, error_msg = transform_excel_to_csv(
-                excel_bytes, table_name, sheet_name, bucket,
-                monetary_config, zero_date_config
-            )
+    pending = []
+    for table_name in tables or TABLES:
+        if f"{yyyymm}/{table_name}" in completed_units:
+            results["resumed"].append(table_name)
+            continue
+        fingerprints[table_name] = transform_fingerprint(table_name, yyyymm, raw_index, config_hashes)
+        if not force and is_transform_unchanged(manifest.get(table_name), fingerprints[table_name], outputs):
+            _record_table_outcome(results, {"table": table_name, "status": "unchanged"}, progress)
+        else:
+            pending.append(table_name)
 
-            if not success:
-                results["errors"].append({
-                    "table": table_name,
-                    "error": error_msg
-                })
-                continue
+    if results["unchanged"]:
+        logger.info(f"入力が前回と同一のため変換を省略: {results['unchanged']}")
 
-            # 累積型テーブルのみsource_folderカラムを追加
-            if table_name in CUMULATIVE_TABLES:
-                csv_df = pd.read_csv(io.BytesIO(csv_bytes))
-                csv_df["source_folder"] = int(yyyymm)
-                csv_buffer = io.StringIO()
-                csv_df.to_csv(csv_buffer, index=False, encoding='utf-8')
-                csv_bytes = csv_buffer.getvalue().encode('utf-8')
-                logger.info(f"source_folder={yyyymm} を追加（累積型テーブル）")
+    manifest_updated = {}
 
-            # proceedにアップロード
-            proceed_path = f"{GCS_PROCEED_PREFIX}/{yyyymm}/{table_name}.csv"
-            proceed_blob = bucket.blob(proceed_path)
-            proceed_blob.upload_from_string(csv_bytes, content_type='text/csv')
+    def record(outcome: dict) -> None:
+        _record_table_outcome(results, outcome, progress)
+        fingerprint = fingerprints.get(outcome["table"])
+        if outcome["status"] == "success" and fingerprint:
+            manifest_updated[outcome["table"]] = {
+                **fingerprint,
+                "output": outcome["output"],
+                "output_generation": outcome["generation"],
+                "rows": outcome["rows"],
+                "transformed_at": datetime.utcnow().isoformat() + "Z",
+            }
 
-            logger.info(f"変換完了: {table_name} → {proceed_path}")
-            results["success"].append(table_name)
+    # 同じブックを参照するテーブル（profit_plan_term の各シート等）は1グループとして
+    # ダウンロード・ブックのオープンを1回で済ませる
+    groups = group_tables_by_raw_file(yyyymm, pending, raw_index)
 
-        except Exception as e:
-            error_msg = f"処理エラー: {str(e)}"
-            log_validation_error("process_error", {
-                "table_name": table_name,
-                "yyyymm": yyyymm,
-                "error": str(e)
-            })
-            results["errors"].append({
-                "table": table_name,
-                "error": error_msg
-            })
+    try:
+        # プールのワーカーはメモリ上限付きのため、グループが1つでもプールで変換する
+        if workers > 1:
+            for outcome in _transform_tables_in_pool(
+                pool, yyyymm, groups, monetary_rules, zero_date_config, raw_index
+            ):
+                record(outcome)
+            # 完了順に格納されるため TABLES の順序に揃える
+            order = {t: i for i, t in enumerate(TABLES)}
+            results["success"].sort(key=order.get)
+            results["errors"].sort(key=lambda e: order[e["table"]])
+            results["skipped"].sort(key=lambda s: order[s["table"]])
+        else:
+            for group in groups:
+                for outcome in transform_table_group(
+                    bucket, yyyymm, group, monetary_rules, zero_date_config, raw_index
+                ):
+                    record(outcome)
+    finally:
+        # 途中で失敗しても変換済みのテーブルは記録する
+        if manifest_updated:
+            save_transform_manifest(bucket, yyyymm, manifest_updated)
 
     # サマリログ
-    logger.info(f"処理完了: 成功={len(results['success'])}, エラー={len(results['errors'])}, スキップ={len(results['skipped'])}")
+    logger.info(
+        f"処理完了: 成功={len(results['success'])}, エラー={len(results['errors'])}, "
+        f"スキップ={len(results['skipped'])}, 未変更={len(results['unchanged'])}"
+    )
 
     return results
 
 
-def process_all_months(mode: str = "replace") -> dict:
+def _record_table_outcome(results: dict, outcome: dict, progress: Optional["JobProgress"]) -> None:
+    """transform_table の結果を月次結果（success/errors/skipped/unchanged）と進捗に反映"""
+    table_name = outcome["table"]
+    unit = f"{results['yyyymm']}/{table_name}"
+    if outcome.get("metrics"):
+        results["metrics"][table_name] = outcome["metrics"]
+        add_stage_seconds(results["stage_seconds"], outcome["metrics"]["stages"])
+    if outcome["status"] == "success":
+        results["success"].append(table_name)
+        results["rows"] += outcome.get("rows", 0)
+        if progress:
+            progress.done(unit, success=1, rows=outcome.get("rows", 0))
+    elif outcome["status"] == "skipped":
+        results["skipped"].append({"table": table_name, "reason": outcome["reason"]})
+        if progress:
+            progress.done(unit, skipped=1)
+    elif outcome["status"] == "unchanged":
+        results["unchanged"].append(table_name)
+        if progress:
+            progress.done(unit, unchanged=1)
+    else:
+        results["errors"].append({"table": table_name, "error": outcome["error"]})
+        if progress:
+            progress.count(errors=1)
+
+
+def parse_months_spec(spec: str) -> List[Tuple[str, str]]:
     """
-    全月のraw → proceed変換を実行
+    対象月指定をパース
 
-    Args:
-        mode: 処理モード
+    "202409-202412" や "202409,202411,202501-202503" の形式を受け付け、
+    (開始月, 終了月) の範囲リストを返す（単月は開始=終了）
 
-    Returns:
-        処理結果
+    Raises:
+        ValueError: 形式が不正な場合
     """
-    logger.info(f"全月処理開始: mode={mode}")
+    ranges = []
+    for part in spec.split(","):
+        part = part.strip()
+        m = re.match(r'^(\d{6})(?:-(\d{6}))?$', part)
+        if not m:
+            raise ValueError(f"無効なmonths形式: {part}")
+        start, end = m.group(1), m.group(2) or m.group(1)
+        if start > end:
+            raise ValueError(f"無効なmonths範囲（開始 > 終了）: {part}")
+        ranges.append((start, end))
+    return ranges
+
+
+def select_months(
+    months: List[str],
+    months_spec: Optional[str] = None,
+    shard_index: Optional[int] = None,
+    shard_count: Optional[int] = None
+) -> List[str]:
+    """
+    処理対象月を絞り込み
 
-    client = storage.Client()
-    bucket = client.bucket(LANDING_BUCKET)
+    months_spec で範囲指定し、さらに shard_count 指定時は
+    ソート済みの月を shard_count 個に振り分けたうち shard_index 番目（0始まり）を返す。
+    振り分けは i % shard_count の巡回方式で、直近月に偏らないようにしている
+    """
+    months = sorted(months)
+    if months_spec:
+        ranges = parse_months_spec(months_spec)
+        months = [m for m in months if any(start <= m <= end for start, end in ranges)]
+    if shard_count:
+        months = [m for i, m in enumerate(months) if i % shard_count == shard_index]
+    return months
 
-    # raw/フォルダから年月一覧を取得
-    prefix = f"{GCS_RAW_PREFIX}/"
-    blobs = bucket.list_blobs(prefix=prefix, delimiter='/')
+
+def list_raw_months(bucket) -> List[str]:
+    """raw/ 配下の年月フォルダ（YYYYMM）の一覧"""
+    blobs = bucket.list_blobs(prefix=f"{GCS_RAW_PREFIX}/", delimiter='/')
 
     # prefixesから年月フォルダを取得
     months = []
@@ -657,32 +2110,306 @@ def process_all_months(mode: str = "replace") -> dict:
             folder_name = prefix_path.rstrip('/').split('/')[-1]
             if re.match(r'^\d{6}$', folder_name):
                 months.append(folder_name)
+    return months
+
+
+def process_all_months(
+    mode: str = "replace",
+    progress: Optional["JobProgress"] = None,
+    completed_units: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+    months_spec: Optional[str] = None,
+    shard_index: Optional[int] = None,
+    shard_count: Optional[int] = None,
+    force: bool = False
+) -> dict:
+    """
+    全月（または指定範囲・シャードの月）のraw → proceed変換を実行
 
-    months.sort()
+    Args:
+        mode: 処理モード
+        progress: 非同期ジョブの進捗記録
+        completed_units: ジョブ再開時に処理済みの単位（"YYYYMM/テーブル名"）のリスト
+        workers: 1 の場合は逐次変換（並列数は shared_transform_pool のワーカー数 TRANSFORM_WORKERS）
+        months_spec: 対象月の範囲指定（例: "202409-202412"）。省略時は全月
+        shard_index: シャード番号（0始まり）。shard_count と併せて指定
+        shard_count: シャード数。Workflows から複数インスタンスに月を振り分ける際に使う
+        force: True の場合は入力が前回と同一のテーブルも再変換
+
+    Returns:
+        処理結果
+    """
+    logger.info(f"全月処理開始: mode={mode}, months={months_spec}, shard={shard_index}/{shard_count}, force={force}")
+
+    client = storage.Client()
+    bucket = client.bucket(LANDING_BUCKET)
+
+    months = select_months(list_raw_months(bucket), months_spec, shard_index, shard_count)
     logger.info(f"処理対象月: {months}")
 
     all_results = {
         "mode": mode,
+        "months_requested": months_spec,
+        "shard": {"index": shard_index, "count": shard_count} if shard_count else None,
         "months_processed": [],
         "total_success": 0,
         "total_errors": 0,
         "total_skipped": 0,
+        "total_unchanged": 0,
+        "total_rows": 0,
+        "stage_seconds": {},
         "details": {}
     }
 
+    if progress:
+        progress.start([f"{m}/{t}" for m in months for t in TABLES])
+
+    # ワーカープロセスは全月・同じインスタンスで並行するジョブ間で共有する（shared_transform_pool）
     for yyyymm in months:
-        result = process_month(yyyymm, mode)
+        result = process_month(
+            yyyymm, mode, progress=progress, completed_units=completed_units,
+            workers=workers, force=force
+        )
         all_results["months_processed"].append(yyyymm)
         all_results["total_success"] += len(result["success"])
         all_results["total_errors"] += len(result["errors"])
         all_results["total_skipped"] += len(result["skipped"])
+        all_results["total_unchanged"] += len(result["unchanged"])
+        all_results["total_rows"] += result["rows"]
+        add_stage_seconds(all_results["stage_seconds"], result["stage_seconds"])
         all_results["details"][yyyymm] = result
 
-    logger.info(f"全月処理完了: 成功={all_results['total_success']}, エラー={all_results['total_errors']}, スキップ={all_results['total_skipped']}")
+    logger.info(
+        f"全月処理完了: 成功={all_results['total_success']}, エラー={all_results['total_errors']}, "
+        f"スキップ={all_results['total_skipped']}, 未変更={all_results['total_unchanged']}"
+    )
 
     return all_results
 
 
+# ============================================================
+# 非同期ジョブ
+# ============================================================
+# Cloud Run のリクエストタイムアウトに縛られないよう、変換をバックグラウンドスレッドで実行し
+# 進捗を GCS 上の JSON に記録する。別インスタンスからも GET /jobs/<id> で参照できる。
+# ※ レスポンス返却後もCPUを割り当てるため、Cloud Run は --no-cpu-throttling でデプロイすること
+_job_lock = threading.Lock()
+_running_jobs = set()
+
+
+class JobProgress:
+    """ジョブの進捗（処理単位の総数・完了済み単位・カウンタ・経過時間）を記録する"""
+
+    def __init__(self, job: dict, bucket):
+        self.job = job
+        self.bucket = bucket
+        self.started = time.time()
+
+    def start(self, units: List[str]):
+        with _job_lock:
+            self.job["progress"]["units_total"] = len(units)
+            self._save()
+
+    def done(self, unit: str, **counters):
+        """処理単位の完了を記録（再開時はこの単位をスキップする）"""
+        with _job_lock:
+            p = self.job["progress"]
+            if unit not in p["completed_units"]:
+                p["completed_units"].append(unit)
+            p["units_done"] = len(p["completed_units"])
+            self._add(counters)
+            self._save()
+
+    def count(self, **counters):
+        """完了扱いにしないカウンタのみ加算（エラー等。再開時は再処理される）"""
+        with _job_lock:
+            self._add(counters)
+            self._save()
+
+    def _add(self, counters: Dict[str, int]):
+        for key, value in counters.items():
+            self.job["progress"]["counters"][key] = self.job["progress"]["counters"].get(key, 0) + value
+
+    def _save(self):
+        self.job["progress"]["elapsed_seconds"] = round(
+            self.job["progress"].get("elapsed_before_resume", 0) + time.time() - self.started, 1
+        )
+        save_job(self.bucket, self.job)
+
+
+def _job_blob(bucket, job_id: str):
+    return bucket.blob(f"{JOBS_GCS_PREFIX}/{job_id}.json")
+
+
+def save_job(bucket, job: dict, if_generation_match: Optional[int] = None) -> None:
+    """ジョブ状態をGCSに保存（if_generation_match 指定時は GCS 上の世代番号が一致する場合のみ）"""
+    job["updated_at"] = datetime.utcnow().isoformat() + "Z"
+    _job_blob(bucket, job["job_id"]).upload_from_string(
+        json.dumps(job, ensure_ascii=False, default=str), content_type="application/json",
+        if_generation_match=if_generation_match
+    )
+
+
+def load_job(bucket, job_id: str) -> Optional[dict]:
+    """GCSからジョブ状態を読み込み"""
+    if not re.match(r"^[0-9a-f]{32}$", job_id or ""):
+        return None
+    blob = _job_blob(bucket, job_id)
+    if not blob.exists():
+        return None
+    return json.loads(blob.download_as_text())
+
+
+def load_job_for_update(bucket, job_id: str) -> Optional[Tuple[dict, int]]:
+    """(ジョブ状態, GCS上の世代番号)。再開時に世代番号の一致を条件に書き込むために使う"""
+    if not re.match(r"^[0-9a-f]{32}$", job_id or ""):
+        return None
+    blob = bucket.get_blob(f"{JOBS_GCS_PREFIX}/{job_id}.json")
+    if not blob:
+        return None
+    return json.loads(blob.download_as_text()), blob.generation
+
+
+def new_job(params: dict) -> dict:
+    """ジョブ状態の初期値を生成"""
+    return {
+        "job_id": uuid.uuid4().hex,
+        "status": "queued",
+        "params": params,
+        "created_at": datetime.utcnow().isoformat() + "Z",
+        "progress": {
+            "units_total": None,
+            "units_done": 0,
+            "completed_units": [],
+            "counters": {},
+            "elapsed_seconds": 0,
+        },
+        "http_status": None,
+        "result": None,
+        "error": None,
+    }
+
+
+def is_resumable(job: dict) -> bool:
+    """失敗したジョブ、または更新が途絶えた（インスタンス停止等）running ジョブのみ再開可能"""
+    if job["status"] == "failed":
+        return True
+    if job["status"] in ("queued", "running") and job["job_id"] not in _running_jobs:
+        updated = datetime.fromisoformat(job["updated_at"].rstrip("Z"))
+        return (datetime.utcnow() - updated).total_seconds() > JOB_STALE_SECONDS
+    return False
+
+
+def pending_transform_tables(bucket, yyyymm: str, config_hashes: Dict[str, Optional[str]]) -> List[str]:
+    """
+    入力が前回の変換時と異なり、変換が必要なテーブル（process_month で unchanged にならないテーブル）
+
+    rawファイルがないテーブル（変換してもスキップとなる）は含めない。
+    """
+    raw_index = build_raw_file_index(bucket, yyyymm)
+    manifest = load_transform_manifest(bucket, yyyymm)
+    outputs = {b.name: b.generation for b in bucket.list_blobs(prefix=f"{GCS_PROCEED_PREFIX}/{yyyymm}/")}
+    return [
+        table_name for table_name in TABLES
+        if resolve_raw_file_name(table_name, yyyymm, raw_index)[0] is not None
+        and not is_transform_unchanged(
+            manifest.get(table_name), transform_fingerprint(table_name, yyyymm, raw_index, config_hashes), outputs
+        )
+    ]
+
+
+def check_transforms(target_month: str, months_spec: Optional[str] = None) -> dict:
+    """
+    変換が必要なテーブルを月ごとに返す（変換は行わない）
+
+    GCS 完了通知で変換する運用で、Workflows が通知による変換の完了を確認するために使う。
+    """
+    bucket = storage.Client().bucket(LANDING_BUCKET)
+    months = [target_month] if target_month else select_months(list_raw_months(bucket), months_spec)
+    config_hashes = load_config_hashes(bucket)
+    pending = {}
+    for yyyymm in months:
+        tables = pending_transform_tables(bucket, yyyymm, config_hashes)
+        if tables:
+            pending[yyyymm] = tables
+    return {
+        "status": "success",
+        "mode": "check",
+        "months_checked": months,
+        "pending": pending,
+        "total_pending": sum(len(tables) for tables in pending.values())
+    }
+
+
+def run_transform(mode: str, target_month: str, progress: Optional[JobProgress] = None,
+                  completed_units: Optional[List[str]] = None, workers: Optional[int] = None,
+                  months_spec: Optional[str] = None, shard_index: Optional[int] = None,
+                  shard_count: Optional[int] = None, force: bool = False) -> dict:
+    """変換を実行（target_month 指定時は単月、省略時は全月または months/シャード指定の月）"""
+    if target_month:
+        if progress:
+            progress.start([f"{target_month}/{t}" for t in TABLES])
+        return process_month(target_month, mode, progress=progress, completed_units=completed_units,
+                             workers=workers, force=force)
+    return process_all_months(mode, progress=progress, completed_units=completed_units, workers=workers,
+                              months_spec=months_spec, shard_index=shard_index, shard_count=shard_count,
+                              force=force)
+
+
+def _run_transform_job(bucket, job: dict) -> None:
+    params = job["params"]
+    progress = JobProgress(job, bucket)
+    try:
+        job["status"] = "running"
+        save_job(bucket, job)
+        result = run_transform(
+            params.get("mode", "replace"), params.get("target_month"),
+            progress=progress, completed_units=job["progress"]["completed_units"],
+            workers=params.get("workers"), months_spec=params.get("months"),
+            shard_index=params.get("shard_index"), shard_count=params.get("shard_count"),
+            force=params.get("force", False)
+        )
+        body, job["http_status"] = transform_response(result)
+        job["result"] = body
+        job["status"] = "succeeded"
+    except Exception as e:
+        logger.error(f"ジョブエラー: {job['job_id']}: {e}")
+        job["status"] = "failed"
+        job["http_status"] = 500
+        job["error"] = str(e)
+    finally:
+        with _job_lock:
+            progress._save()
+            _running_jobs.discard(job["job_id"])
+
+
+def start_job(bucket, job: dict, if_generation_match: Optional[int] = None) -> bool:
+    """
+    ジョブをバックグラウンドスレッドで開始
+
+    if_generation_match 指定時（再開）は、読み込んだ時点から GCS 上のジョブが更新されていない場合のみ開始する。
+    複数インスタンスで同じジョブを同時に再開しても、引き継げるのは1つだけになる。
+
+    Returns:
+        開始した場合True（他のリクエストが先にジョブを更新していた場合False）
+    """
+    with _job_lock:
+        try:
+            save_job(bucket, job, if_generation_match=if_generation_match)
+        except PreconditionFailed:
+            return False
+        _running_jobs.add(job["job_id"])
+    threading.Thread(target=_run_transform_job, args=(bucket, job), daemon=True).start()
+    return True
+
+
+def transform_response(result: dict) -> Tuple[dict, int]:
+    """変換結果からレスポンスボディとHTTPステータスを生成（エラーがある場合は207 Multi-Status）"""
+    if result.get("errors") or result.get("total_errors", 0) > 0:
+        return {"status": "partial_success", "result": result}, 207
+    return {"status": "success", "result": result}, 200
+
+
 # ============================================================
 # Flask エンドポイント
 # ============================================================
@@ -700,37 +2427,76 @@ def transform():
     Query Parameters:
         mode: replace（デフォルト）/ append
         target_month: 対象月（YYYYMM形式）。省略時は全月処理
+        async: "true" の場合はジョブを登録して即座に 202 と job_id を返す
+               （進捗は GET /jobs/<job_id> で確認）
+        workers: 1 の場合はプロセスプールを使わず逐次変換（並列数はインスタンスごとに環境変数 TRANSFORM_WORKERS で固定）
+        months: 全月処理の対象月を絞り込む（例: 202409-202412, 202409,202411）
+        shard_index / shard_count: 全月処理の対象月を shard_count 個に振り分けたうち
+               shard_index 番目（0始まり）のみ処理（Workflows の並列実行用）
+        force: "true" の場合は入力（rawファイル・設定ファイル・変換処理）が前回と同一のテーブルも再変換
+        check: "true" の場合は変換せず、入力が前回と異なる（変換が必要な）テーブルを月ごとに返す
+               （target_month / months で対象月を指定。GCS 完了通知による変換の完了確認用）
     """
     try:
         mode = request.args.get("mode", "replace")
         target_month = request.args.get("target_month", "")
+        run_async = request.args.get("async", "false").lower() == "true"
+        workers = request.args.get("workers", type=int)
+        months_spec = request.args.get("months") or None
+        shard_index = request.args.get("shard_index", type=int)
+        shard_count = request.args.get("shard_count", type=int)
+        force = request.args.get("force", "false").lower() == "true"
+        check = request.args.get("check", "false").lower() == "true"
+
+        logger.info(
+            f"リクエスト受信: mode={mode}, target_month={target_month}, async={run_async}, workers={workers}, "
+            f"months={months_spec}, shard={shard_index}/{shard_count}, force={force}, check={check}"
+        )
+
+        if target_month and not re.match(r'^\d{6}$', target_month):
+            return jsonify({
+                "status": "error",
+                "message": f"無効なtarget_month形式: {target_month}"
+            }), 400
 
-        logger.info(f"リクエスト受信: mode={mode}, target_month={target_month}")
-
-        if target_month:
-            # 特定月のみ処理
-            if not re.match(r'^\d{6}$', target_month):
-                return jsonify({
-                    "status": "error",
-                    "message": f"無効なtarget_month形式: {target_month}"
-                }), 400
-
-            result = process_month(target_month, mode)
-        else:
-            # 全月処理
-            result = process_all_months(mode)
+        if months_spec:
+            try:
+                parse_months_spec(months_spec)
+            except ValueError as e:
+                return jsonify({"status": "error", "message": str(e)}), 400
 
-        # エラーがある場合は207 Multi-Status
-        if result.get("errors") or result.get("total_errors", 0) > 0:
+        if (shard_index is None) != (shard_count is None) or (
+            shard_count is not None and not 0 <= shard_index < shard_count
+        ):
             return jsonify({
-                "status": "partial_success",
-                "result": result
-            }), 207
+                "status": "error",
+                "message": f"shard_index/shard_count が不正です: {shard_index}/{shard_count}"
+            }), 400
+
+        if check:
+            return jsonify(check_transforms(target_month, months_spec)), 200
+
+        if run_async:
+            bucket = storage.Client().bucket(LANDING_BUCKET)
+            job = new_job({
+                "mode": mode, "target_month": target_month or None, "workers": workers,
+                "months": months_spec, "shard_index": shard_index, "shard_count": shard_count,
+                "force": force
+            })
+            accepted = {
+                "job_id": job["job_id"],
+                "status": job["status"],
+                "status_url": f"/jobs/{job['job_id']}"
+            }
+            start_job(bucket, job)
+            return jsonify(accepted), 202
 
-        return jsonify({
-            "status": "success",
-            "result": result
-        })
+        # target_month 指定時は特定月のみ、省略時は全月処理
+        result = run_transform(mode, target_month, workers=workers, months_spec=months_spec,
+                               shard_index=shard_index, shard_count=shard_count, force=force)
+
+        body, status_code = transform_response(result)
+        return jsonify(body), status_code
 
     except Exception as e:
         logger.error(f"エンドポイントエラー: {e}")
@@ -743,6 +2509,149 @@ def transform():
         }), 500
 
 
+# ------------------------------------------------------------
+# GCS オブジェクト完了通知（Eventarc / Pub/Sub push）
+# ------------------------------------------------------------
+STORAGE_FINALIZED_EVENT = "google.cloud.storage.object.v1.finalized"
+RAW_OBJECT_PATTERN = re.compile(rf"^{re.escape(GCS_RAW_PREFIX)}/(\d{{6}})/([^/]+\.xlsx)$")
+
+
+def parse_storage_event(headers, body: dict) -> Optional[Dict[str, Any]]:
+    """
+    GCS オブジェクト finalize 通知から {"bucket", "name", "generation"} を取り出す
+
+    対応形式:
+      - Eventarc CloudEvent（binary モード）: ce-type ヘッダ + 本文に StorageObjectData
+      - CloudEvent（structured モード）: 本文 {"specversion", "type", "data": StorageObjectData}
+      - Pub/Sub push（GCS の Pub/Sub 通知）: 本文 {"message": {"attributes": {...}, "data": base64}}
+
+    Returns:
+        オブジェクト情報。finalize 以外のイベントは None
+    """
+    if "message" in body:
+        message = body["message"] or {}
+        attributes = message.get("attributes") or {}
+        if attributes.get("eventType") != "OBJECT_FINALIZE":
+            return None
+        data = json.loads(base64.b64decode(message["data"])) if message.get("data") else {}
+        return {
+            "bucket": attributes.get("bucketId") or data.get("bucket"),
+            "name": attributes.get("objectId") or data.get("name"),
+            "generation": attributes.get("objectGeneration") or data.get("generation"),
+        }
+
+    if "specversion" in body:
+        event_type, data = body.get("type"), body.get("data") or {}
+    else:
+        event_type, data = headers.get("ce-type"), body
+    if event_type != STORAGE_FINALIZED_EVENT:
+        return None
+    return {"bucket": data.get("bucket"), "name": data.get("name"), "generation": data.get("generation")}
+
+
+def tables_for_raw_file(yyyymm: str, file_name: str, raw_index: Dict[str, Any]) -> List[str]:
+    """rawファイル（月フォルダ内の相対パス）を参照するテーブルを逆引き（find_raw_file と同じ検索規則）"""
+    return [t for t in TABLES if resolve_raw_file_name(t, yyyymm, raw_index)[0] == file_name]
+
+
+def handle_raw_object_finalized(event: Dict[str, Any]) -> Tuple[dict, int]:
+    """
+    届いた rawファイルを参照するテーブルのみ変換
+
+    対象外・既に上書きされた世代の通知は変換せず ignored を返す
+    """
+    match = RAW_OBJECT_PATTERN.match(event.get("name") or "")
+    if event.get("bucket") != LANDING_BUCKET or not match:
+        return {"status": "ignored", "reason": "not_raw_workbook", "object": event.get("name")}, 200
+
+    yyyymm, file_name = match.groups()
+    bucket = storage.Client().bucket(LANDING_BUCKET)
+    raw_index = build_raw_file_index(bucket, yyyymm)
+
+    current_generation = raw_index["files"].get(file_name)
+    if current_generation is None:
+        return {"status": "ignored", "reason": "object_not_found", "object": event["name"]}, 200
+    if event.get("generation") and int(event["generation"]) != current_generation:
+        # 新しい世代の通知で改めて変換する
+        return {"status": "ignored", "reason": "superseded", "object": event["name"]}, 200
+
+    table_names = tables_for_raw_file(yyyymm, file_name, raw_index)
+    if not table_names:
+        return {"status": "ignored", "reason": "no_matching_table", "object": event["name"]}, 200
+
+    logger.info(f"GCS完了通知: {event['name']} (generation={current_generation}) → {table_names}")
+    result = process_month(yyyymm, tables=table_names, raw_index=raw_index)
+    body, status_code = transform_response(result)
+    body["object"] = event["name"]
+    return body, status_code
+
+
+@app.route("/events/gcs-finalize", methods=["POST"])
+def gcs_finalize_event():
+    """
+    GCS オブジェクト finalize 通知（Eventarc CloudEvent / Pub/Sub push）の受信エンドポイント
+
+    google-drive/raw/YYYYMM/*.xlsx が届いたら、そのブックを参照するテーブルのみ変換する。
+    2xx 以外を返すと再送されるため、対象外の通知や変換エラー（207）は 2xx で応答し、
+    予期しない例外のみ 500 とする。
+    """
+    try:
+        event = parse_storage_event(request.headers, request.get_json(silent=True) or {})
+        if event is None:
+            return jsonify({"status": "ignored", "reason": "not_finalize_event"}), 200
+        body, status_code = handle_raw_object_finalized(event)
+        return jsonify(body), status_code
+
+    except Exception as e:
+        logger.error(f"GCS完了通知の処理エラー: {e}")
+        log_validation_error("event_error", {
+            "error": str(e)
+        })
+        return jsonify({"status": "error", "message": str(e)}), 500
+
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def get_job(job_id):
+    """非同期ジョブの状態・進捗を返す（完了時は result に /transform と同じ結果を含む）"""
+    job = load_job(storage.Client().bucket(LANDING_BUCKET), job_id)
+    if not job:
+        return jsonify({"status": "error", "message": f"job not found: {job_id}"}), 404
+    return jsonify(job)
+
+
+@app.route("/jobs/<job_id>/resume", methods=["POST"])
+def resume_job(job_id):
+    """失敗・中断したジョブを、完了済みのテーブルを飛ばして再開する"""
+    bucket = storage.Client().bucket(LANDING_BUCKET)
+    loaded = load_job_for_update(bucket, job_id)
+    if not loaded:
+        return jsonify({"status": "error", "message": f"job not found: {job_id}"}), 404
+    job, generation = loaded
+    if not is_resumable(job):
+        return jsonify({
+            "status": "error",
+            "message": f"job is not resumable (status={job['status']})",
+            "job": job
+        }), 409
+
+    job["progress"]["elapsed_before_resume"] = job["progress"].get("elapsed_seconds", 0)
+    job["resumed_at"] = datetime.utcnow().isoformat() + "Z"
+    job["status"] = "queued"
+    job["error"] = None
+    accepted = {
+        "job_id": job_id,
+        "status": job["status"],
+        "completed_units": len(job["progress"]["completed_units"]),
+        "status_url": f"/jobs/{job_id}"
+    }
+    if not start_job(bucket, job, if_generation_match=generation):
+        return jsonify({
+            "status": "error",
+            "message": f"job was updated by another request; not resumed: {job_id}"
+        }), 409
+    return jsonify(accepted), 202
+
+
 # ============================================================
 # エントリポイント
 # ============================================================
@@ -1,9 +1,12 @@
-import os, io, json, datetime as dt, pandas as pd, re, traceback
+import os, io, json, datetime as dt, pandas as pd, re, traceback, threading, time, uuid
+from concurrent.futures import ThreadPoolExecutor
 from flask import Flask, request, jsonify  # ← jsonify を追加
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaIoBaseDownload
 from google.oauth2 import service_account
 from google.cloud import storage
+from google.api_core.exceptions import NotFound, PreconditionFailed
 from google.auth import default as google_auth_default
 
 # === 環境変数 ===
@@ -15,6 +18,18 @@ SERVICE_JSON       = os.environ.get("SERVICE_JSON_PATH")    # 任意: 鍵ファ
 SERVICE_JSON_GCS   = os.environ.get("SERVICE_JSON_GCS_PATH") # 任意: 鍵ファイルパス（GCS）
 IMPERSONATE_USER   = os.environ.get("IMPERSONATE_USER")     # ドメイン全体の委任: なりすますユーザー
 DEFAULT_MODE       = os.environ.get("DEFAULT_MODE", "replace")  # デフォルトモード: replace / append
+SYNC_MAX_WORKERS   = int(os.environ.get("SYNC_MAX_WORKERS", "8"))  # ファイル転送の並列数
+SYNC_MANIFEST_PATH = os.environ.get("SYNC_MANIFEST_GCS_PATH", "google-drive/manifest/drive_sync_manifest.json")  # 差分同期用マニフェスト
+CHANGES_STATE_PATH = os.environ.get("CHANGES_STATE_GCS_PATH", "google-drive/manifest/drive_changes_state.json")  # Changes API のページトークン
+DEBUG_FOLDER_LISTING = os.environ.get("DEBUG_FOLDER_LISTING", "false").lower() == "true"  # 月フォルダ未検出時のデバッグ用一覧取得
+FOLDER_MIME_TYPE   = "application/vnd.google-apps.folder"
+GCS_RAW_PREFIX     = "google-drive/raw/"
+GCS_RAW_TEMP_PREFIX = "google-drive/temp/raw/"  # ストリーミング転送の書き込み先（完了後に raw/ へコピー）
+# Drive→GCS ストリーミング転送のチャンクサイズ（GCS resumable upload の制約により 256KiB の倍数）
+STREAM_CHUNK_SIZE  = int(os.environ.get("STREAM_CHUNK_SIZE_MB", "8")) * 1024 * 1024
+XLSX_CONTENT_TYPE  = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+JOBS_GCS_PREFIX    = os.environ.get("JOBS_GCS_PREFIX", "jobs/drive-to-gcs")  # 非同期ジョブの状態保存先
+JOB_STALE_SECONDS  = int(os.environ.get("JOB_STALE_SECONDS", "900"))  # 更新が途絶えた running ジョブを再開可能とみなす秒数
 
 # === GCSからJSONキーをダウンロード ===
 def _download_service_json_from_gcs():
@@ -71,6 +86,17 @@ def _build_drive_service():
         print("[INFO] Using default credentials (no impersonation)")
     return build("drive", "v3", credentials=creds, cache_discovery=False)
 
+# httplib2ベースのDriveクライアントはスレッド間で共有できないため、ワーカースレッドごとに構築する
+_thread_local = threading.local()
+
+def _get_thread_drive_service():
+    """呼び出し元スレッド専用のDrive APIサービスを返す（初回のみ構築）"""
+    drive = getattr(_thread_local, "drive", None)
+    if drive is None:
+        drive = _build_drive_service()
+        _thread_local.drive = drive
+    return drive
+
 def _get_drive_id_of(drive, file_id: str) -> str | None:
     """file_id がフォルダIDなら、その所属共有ドライブIDを返す。共有ドライブIDが渡された場合は None の可能性。"""
     try:
@@ -106,8 +132,9 @@ def _find_month_subfolder(drive, parent_or_drive_id: str, yyyymm: str) -> str |
         if files:
             return files[0]["id"]
         # --- 3-2) 見つからなければ親直下の子フォルダ名をデバッグ出力 ---
-        kids = _list_children_folders(drive, parent_or_drive_id)
-        print(f"[DEBUG] children under {parent_or_drive_id}: {[k.get('name') for k in kids]}")
+        if DEBUG_FOLDER_LISTING:
+            kids = _list_children_folders(drive, parent_or_drive_id)
+            print(f"[DEBUG] children under {parent_or_drive_id}: {[k.get('name') for k in kids]}")
     except HttpError as e:
         print(f"[DEBUG] parent search failed (assumed folderId={parent_or_drive_id}): {e}")
 
@@ -127,7 +154,7 @@ def _find_month_subfolder(drive, parent_or_drive_id: str, yyyymm: str) -> str |
                 print(f"[DEBUG] multiple '{yyyymm}' folders in driveId={drive_id_for_wide}: "
                       f"{[(f.get('name'), f.get('id')) for f in files2]}")
             return files2[0]["id"]
-        else:
+        elif DEBUG_FOLDER_LISTING:
             # drive-wide でも見つからない場合、候補一覧をデバッグ出力
             res3 = drive.files().list(
                 corpora="drive", driveId=drive_id_for_wide,
@@ -142,13 +169,48 @@ def _find_month_subfolder(drive, parent_or_drive_id: str, yyyymm: str) -> str |
     print(f"[WARN] No subfolder {yyyymm} under/within {parent_or_drive_id}")
     return None
 
+def _get_start_page_token(drive, drive_id: str | None) -> str:
+    """Changes API の開始ページトークンを取得（共有ドライブの場合は driveId を指定）"""
+    kwargs = {"supportsAllDrives": True}
+    if drive_id:
+        kwargs["driveId"] = drive_id
+    return drive.changes().getStartPageToken(**kwargs).execute()["startPageToken"]
+
+def _list_drive_changes(drive, page_token: str, drive_id: str | None) -> tuple:
+    """
+    page_token 以降の変更を全て取得
+
+    変更がなければ1回の API 呼び出しで完了する。
+
+    Returns:
+        (変更リスト, 次回用の newStartPageToken)
+    """
+    changes = []
+    kwargs = {
+        "spaces": "drive",
+        "pageSize": 1000,
+        "includeItemsFromAllDrives": True,
+        "supportsAllDrives": True,
+        "includeRemoved": True,
+        "fields": "nextPageToken, newStartPageToken, "
+                  "changes(fileId, removed, file(id,name,mimeType,parents,trashed,md5Checksum,modifiedTime))",
+    }
+    if drive_id:
+        kwargs["driveId"] = drive_id
+    while True:
+        res = drive.changes().list(pageToken=page_token, **kwargs).execute()
+        changes.extend(res.get("changes", []))
+        if res.get("newStartPageToken"):
+            return changes, res["newStartPageToken"]
+        page_token = res["nextPageToken"]
+
 def _iter_files(drive, folder_id):
     q = f"'{folder_id}' in parents and trashed=false"
     page_token = None
     while True:
         res = drive.files().list(
             q=q,
-            fields="nextPageToken, files(id,name,mimeType,size)",
+            fields="nextPageToken, files(id,name,mimeType,size,md5Checksum,modifiedTime)",
             pageToken=page_token,
             pageSize=1000,
             includeItemsFromAllDrives=True,
@@ -160,14 +222,42 @@ def _iter_files(drive, folder_id):
         if not page_token:
             break
 
-def _download_xlsx(drive, file_id, name_hint=None):
-    """Drive上の .xlsx をそのままダウンロード"""
-    meta = drive.files().get(fileId=file_id, fields="name", supportsAllDrives=True).execute()
-    name = meta.get("name", name_hint or "file")
-    out_name = name if name.lower().endswith(".xlsx") else re.sub(r"\.[^.]+$", "", name) + ".xlsx"
+def _stream_xlsx_to_gcs(drive, bucket, file_id: str, gcs_path: str):
+    """
+    Drive上の .xlsx を GCS へストリーミング転送
+
+    MediaIoBaseDownload のチャンクをそのまま GCS の resumable upload（blob.open("wb")）に
+    書き込むため、メモリ使用量はファイルサイズによらず STREAM_CHUNK_SIZE 程度に収まる。
+
+    書き込みは一時オブジェクト（GCS_RAW_TEMP_PREFIX）に行い、ダウンロードが完了した場合のみ gcs_path へ
+    コピーするため、途中で失敗しても raw/ の既存ファイルは途中までの内容で置き換わらない。
+    （BlobWriter は例外時も close() でオブジェクトを確定させるため、失敗時は一時オブジェクトを確定後に削除する）
+
+    Returns:
+        (転送バイト数, アップロード後のオブジェクト generation)
+    """
+    temp_blob = bucket.blob(f"{GCS_RAW_TEMP_PREFIX}{uuid.uuid4().hex}.xlsx")
     req = drive.files().get_media(fileId=file_id, supportsAllDrives=True)
-    buf = io.BytesIO(req.execute()); buf.seek(0)
-    return out_name, buf, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    writer = temp_blob.open("wb", chunk_size=STREAM_CHUNK_SIZE, content_type=XLSX_CONTENT_TYPE)
+    try:
+        downloader = MediaIoBaseDownload(writer, req, chunksize=STREAM_CHUNK_SIZE)
+        done = False
+        while not done:
+            _, done = downloader.next_chunk(num_retries=3)
+        size = writer.tell()
+        writer.close()
+        blob = bucket.copy_blob(temp_blob, bucket, gcs_path)
+        return size, blob.generation
+    finally:
+        try:
+            if not writer.closed:
+                # terminate() のない版（2.16）は close() で途中までの内容を確定させてから削除する
+                getattr(writer, "terminate", writer.close)()
+            temp_blob.delete()
+        except NotFound:
+            pass  # アップロードを取り消した場合、一時オブジェクトは作成されていない
+        except Exception as e:
+            print(f"[WARN] Failed to delete {temp_blob.name}: {e}")
 
 # ============== マッピング ==============
 def _load_mapping_csv():
@@ -255,20 +345,179 @@ def _delete_gcs_folder(bucket, prefix: str) -> int:
         print(f"[INFO] Deleted {deleted_count} files from gs://{bucket.name}/{prefix}")
     return deleted_count
 
-def _gcs_upload_raw(bucket, bytes_io: io.BytesIO, yyyymm: str, slug: str, out_name: str, content_type: str) -> str:
-    path = f"google-drive/raw/{yyyymm}/{slug}.xlsx"
-    blob = bucket.blob(path)
-    blob.content_type = content_type
-    blob.upload_from_file(bytes_io)
-    return f"gs://{LANDING_BUCKET}/{path}"
+def _raw_gcs_path(yyyymm: str, slug: str) -> str:
+    return f"{GCS_RAW_PREFIX}{yyyymm}/{slug}.xlsx"
+
+# ============== 差分同期マニフェスト ==============
+def _load_sync_manifest(bucket) -> dict:
+    """
+    差分同期マニフェストを読み込み
+
+    Returns:
+        {Drive fileId: {"name", "yyyymm", "gcs_path", "md5Checksum", "modifiedTime", "generation"}}
+    """
+    blob = bucket.blob(SYNC_MANIFEST_PATH)
+    try:
+        if not blob.exists():
+            print(f"[INFO] Sync manifest not found (first run): gs://{LANDING_BUCKET}/{SYNC_MANIFEST_PATH}")
+            return {}
+        return json.loads(blob.download_as_text()).get("files", {})
+    except Exception as e:
+        print(f"[WARN] Failed to load sync manifest, treating all files as new: {e}")
+        return {}
+
+def _save_sync_manifest(bucket, entries: dict) -> None:
+    blob = bucket.blob(SYNC_MANIFEST_PATH)
+    body = {
+        "updated_at": dt.datetime.utcnow().isoformat() + "Z",
+        "files": entries,
+    }
+    blob.upload_from_string(json.dumps(body, ensure_ascii=False, indent=2), content_type="application/json")
+    print(f"[INFO] Saved sync manifest ({len(entries)} files): gs://{LANDING_BUCKET}/{SYNC_MANIFEST_PATH}")
+
+def _load_changes_state(bucket) -> dict:
+    """
+    Changes API の同期状態を読み込み
+
+    Returns:
+        {"page_token": str, "drive_id": str | None, "month_folders": {folderId: "YYYYMM"}}
+    """
+    blob = bucket.blob(CHANGES_STATE_PATH)
+    try:
+        if not blob.exists():
+            return {}
+        return json.loads(blob.download_as_text())
+    except Exception as e:
+        print(f"[WARN] Failed to load changes state, falling back to full scan: {e}")
+        return {}
+
+def _save_changes_state(bucket, state: dict) -> None:
+    blob = bucket.blob(CHANGES_STATE_PATH)
+    body = dict(state, updated_at=dt.datetime.utcnow().isoformat() + "Z")
+    blob.upload_from_string(json.dumps(body, ensure_ascii=False, indent=2), content_type="application/json")
+    print(f"[INFO] Saved changes state: gs://{LANDING_BUCKET}/{CHANGES_STATE_PATH}")
+
+def _resolve_drive_changes(drive, changes: list, state: dict, manifest: dict) -> tuple:
+    """
+    Changes API の変更リストを、処理対象の月フォルダとファイルに振り分ける
+
+    - 親フォルダ直下の YYYYMM フォルダの作成・名前変更・親フォルダ直下への移動を月フォルダの対応表に反映し、
+      新しく見つかった月フォルダと名前が変わった月フォルダは配下のファイルを取得する
+      （既存のフォルダを移動した場合、配下のファイルの変更は通知されないため）
+    - 既知の月フォルダ配下のファイルは、その月の変更候補として扱う
+    - 削除・ゴミ箱移動・月フォルダ外への移動は、マニフェストから外す対象として扱う
+
+    state は変更しない。更新後の対応表は、ページトークンを進める場合のみ呼び出し側で保存する
+    （トークンを進めずに同じ変更を再処理する際に、前回の対応表から同じ結果を得るため）。
+
+    Returns:
+        (月フォルダのリスト [{"id", "name", "files"}], マニフェストから外す fileId の集合,
+         更新後の月フォルダの対応表 {folderId: "YYYYMM"})
+    """
+    month_folders = dict(state.get("month_folders", {}))
+    root_ids = {DRIVE_FOLDER_ID, state.get("drive_id")}
+    changed = {}
+    removed_ids = set()
+
+    # 先にフォルダの変更を反映し、同じページ内で新しい月フォルダに追加されたファイルも拾えるようにする
+    for change in changes:
+        f = change.get("file") or {}
+        if f.get("mimeType") != FOLDER_MIME_TYPE:
+            continue
+        folder_id = change.get("fileId")
+        is_month = (not change.get("removed") and not f.get("trashed")
+                    and root_ids & set(f.get("parents", [])) and re.match(r"^\d{6}$", f.get("name", "")))
+        if is_month:
+            if month_folders.get(folder_id) != f["name"]:
+                # 月フォルダの作成・移動・名前変更: 配下のファイルを新しい月として取得する
+                changed[f["name"]] = {"id": folder_id, "name": f["name"], "files": list(_iter_files(drive, folder_id))}
+            month_folders[folder_id] = f["name"]
+        elif folder_id in month_folders:
+            # 月フォルダの削除・移動: 配下のファイルの変更は通知されないため、マニフェストから月単位で外す
+            yyyymm = month_folders.pop(folder_id)
+            removed_ids.update(k for k, v in manifest.items() if v.get("yyyymm") == yyyymm)
+
+    for change in changes:
+        f = change.get("file") or {}
+        file_id = change.get("fileId")
+        if f.get("mimeType") == FOLDER_MIME_TYPE:
+            continue
+        parent_months = [month_folders[p] for p in f.get("parents", []) if p in month_folders]
+        if change.get("removed") or f.get("trashed") or not parent_months:
+            if file_id in manifest:
+                removed_ids.add(file_id)
+            continue
+        yyyymm = parent_months[0]
+        folder_id = next(k for k, v in month_folders.items() if v == yyyymm)
+        month = changed.setdefault(yyyymm, {"id": folder_id, "name": yyyymm, "files": []})
+        if all(x.get("id") != file_id for x in month["files"]):
+            month["files"].append(f)
+        # 別の月フォルダへ移動された場合は旧エントリを外す
+        if manifest.get(file_id, {}).get("yyyymm") not in (None, yyyymm):
+            removed_ids.add(file_id)
+
+    return [changed[k] for k in sorted(changed)], removed_ids, month_folders
+
+def _list_raw_generations(bucket) -> dict:
+    """raw/ 配下の全オブジェクトを1回のリストで取得し {オブジェクト名: generation} を返す"""
+    return {b.name: b.generation for b in bucket.list_blobs(prefix=GCS_RAW_PREFIX)}
+
+def _manifest_entry(f: dict, yyyymm: str, gcs_path: str, generation) -> dict:
+    return {
+        "name": f.get("name"),
+        "yyyymm": yyyymm,
+        "gcs_path": gcs_path,
+        "md5Checksum": f.get("md5Checksum"),
+        "modifiedTime": f.get("modifiedTime"),
+        "generation": generation,
+    }
+
+def _is_unchanged(f: dict, entry: dict, gcs_path: str, raw_generations: dict) -> bool:
+    """
+    前回同期時から Drive 側・GCS 側ともに変更がないかを判定
+
+    - 出力先パスが同じで、GCS オブジェクトの generation が前回記録と一致すること
+    - md5Checksum があれば md5 で比較、なければ modifiedTime で比較
+    """
+    if not entry or entry.get("gcs_path") != gcs_path:
+        return False
+    if raw_generations.get(gcs_path) != entry.get("generation"):
+        return False
+    if f.get("md5Checksum") and entry.get("md5Checksum"):
+        return f["md5Checksum"] == entry["md5Checksum"]
+    return bool(f.get("modifiedTime")) and f.get("modifiedTime") == entry.get("modifiedTime")
 
 # ============== 同期処理 ==============
-def _process_month_folder(drive, bucket, df_map, month_folder: dict) -> dict:
+def _transfer_file(bucket, df_map, yyyymm: str, f: dict) -> dict:
     """
-    1つの月フォルダを処理してGCSにアップロード
+    1ファイルを Drive からダウンロードして GCS にアップロード（ワーカースレッドで実行）
+
+    Returns:
+        {"file": str, "gcs_uri": str, "generation": int}
+    """
+    drive = _get_thread_drive_service()
+    name = f.get("name", "")
+    slug, sheet_name = _slug_from_mapping(df_map, name)
+    gcs_path = _raw_gcs_path(yyyymm, slug)
+
+    # ファイル名は _iter_files の一覧取得結果を使い、files().get の往復を省略
+    size, generation = _stream_xlsx_to_gcs(drive, bucket, f["id"], gcs_path)
+    gcs_uri = f"gs://{LANDING_BUCKET}/{gcs_path}"
+
+    print(f"[OK] saved {gcs_uri} from {name} ({size:,} bytes)")
+    return {"file": name, "gcs_uri": gcs_uri, "generation": generation}
+
+def _submit_month_folder(drive, bucket, df_map, month_folder: dict, executor,
+                         manifest: dict = None, raw_generations: dict = None) -> tuple:
+    """
+    1つの月フォルダのファイル一覧を取得し、転送処理をワーカープールに投入
+
+    manifest が渡された場合（incremental/changesモード）は、前回同期時から変更のない
+    ファイルを転送せず unchanged として扱う。
+    month_folder に "files" がある場合（changesモード）は一覧取得を行わずそれを使う。
 
     Returns:
-        {"yyyymm": str, "processed": int, "skipped": int, "failed": list, "success": list}
+        (結果の辞書, [(Driveファイル, 出力先パス, Future), ...])
     """
     yyyymm = month_folder.get("name")
     month_id = month_folder.get("id")
@@ -277,11 +526,15 @@ def _process_month_folder(drive, bucket, df_map, month_folder: dict) -> dict:
         "yyyymm": yyyymm,
         "processed": 0,
         "skipped": 0,
+        "unchanged": 0,
         "failed": [],
-        "success": []
+        "success": [],
+        "manifest": {}
     }
+    futures = []
 
-    for f in _iter_files(drive, month_id):
+    files = month_folder["files"] if "files" in month_folder else _iter_files(drive, month_id)
+    for f in files:
         name = f.get("name", "")
         lname = name.lower()
 
@@ -290,46 +543,104 @@ def _process_month_folder(drive, bucket, df_map, month_folder: dict) -> dict:
             print(f"[SKIP] not xlsx: name={name}")
             continue
 
-        try:
-            out_name, filebytes, ctype = _download_xlsx(drive, f["id"], name_hint=name)
-            slug, sheet_name = _slug_from_mapping(df_map, name)
+        slug, _ = _slug_from_mapping(df_map, name)
+        gcs_path = _raw_gcs_path(yyyymm, slug)
+
+        if manifest is not None:
+            entry = manifest.get(f["id"])
+            if _is_unchanged(f, entry, gcs_path, raw_generations or {}):
+                result["unchanged"] += 1
+                result["manifest"][f["id"]] = entry
+                continue
+
+        futures.append((f, gcs_path, executor.submit(_transfer_file, bucket, df_map, yyyymm, f)))
+
+    return result, futures
 
-            gcs_uri = _gcs_upload_raw(bucket, filebytes, yyyymm, slug, out_name, ctype)
+def _collect_month_folder(result: dict, futures: list, manifest: dict = None) -> dict:
+    """
+    投入済みの転送処理の完了を待ち、success/failed に振り分ける
 
-            print(f"[OK] saved {gcs_uri} from {name}")
+    転送に成功したファイルはマニフェストのエントリを更新する。
+    失敗したファイルは前回のエントリを引き継ぎ、次回の同期で再転送させる。
+    """
+    yyyymm = result["yyyymm"]
+    for f, gcs_path, future in futures:
+        name = f.get("name", "")
+        try:
+            transferred = future.result()
+            result["success"].append({"file": transferred["file"], "gcs_uri": transferred["gcs_uri"]})
             result["processed"] += 1
-            result["success"].append({"file": name, "gcs_uri": gcs_uri})
+            result["manifest"][f["id"]] = _manifest_entry(f, yyyymm, gcs_path, transferred["generation"])
         except Exception as e:
             print(f"[ERROR] file '{name}' failed: {e}\n{traceback.format_exc()}")
             result["failed"].append({"file": name, "error": str(e)})
-
+            if manifest and f["id"] in manifest:
+                result["manifest"][f["id"]] = manifest[f["id"]]
     return result
 
+def _remove_orphaned_raw_objects(bucket, old_manifest: dict, new_manifest: dict, raw_generations: dict) -> int:
+    """
+    前回マニフェストに記録されていたが、今回の同期で対応する Drive ファイルが
+    存在しなくなった raw オブジェクトのみを削除
+
+    Returns:
+        削除したファイル数
+    """
+    current_paths = {e.get("gcs_path") for e in new_manifest.values()}
+    orphaned = sorted({
+        e.get("gcs_path") for e in old_manifest.values()
+        if e.get("gcs_path") and e.get("gcs_path") not in current_paths and e.get("gcs_path") in raw_generations
+    })
+
+    removed = 0
+    for path in orphaned:
+        try:
+            bucket.blob(path).delete()
+            removed += 1
+            print(f"[INFO] Removed orphaned raw object: gs://{LANDING_BUCKET}/{path}")
+        except Exception as e:
+            print(f"[WARN] Failed to delete {path}: {e}")
+    return removed
 
-def sync_drive_to_gcs(mode: str = "replace", target_month: str = None) -> dict:
+def sync_drive_to_gcs(mode: str = "replace", target_month: str = None, max_workers: int = None,
+                      progress=None, completed_months: list = None) -> dict:
     """
     Google Drive から GCS へ同期
 
     Args:
         mode: "replace"(全データ洗い替え) / "append"(指定月のみ追加)
+              / "incremental"(マニフェストとの差分のみ転送)
+              / "changes"(Drive Changes API で前回同期以降に変更されたファイルのみ転送)
         target_month: appendモード時の対象月（YYYYMM形式）
+        max_workers: ファイル転送の並列数（省略時は SYNC_MAX_WORKERS）
+        progress: 非同期ジョブの進捗記録（JobProgress）。月フォルダ単位で完了を記録する
+        completed_months: ジョブ再開時に処理済みの月リスト（再処理せず、削除も行わない）
 
     Returns:
         同期結果の辞書
     """
+    completed_months = set(completed_months or [])
+    max_workers = max(1, max_workers or SYNC_MAX_WORKERS)
+
     print("=" * 60)
     print(f"drive-to-gcs 同期開始")
     print(f"  モード: {mode}")
     print(f"  対象月: {target_month if target_month else '全月'}")
+    print(f"  並列数: {max_workers}")
     print("=" * 60)
 
     results = {
         "mode": mode,
         "target_month": target_month,
+        "max_workers": max_workers,
         "timestamp": dt.datetime.utcnow().isoformat() + "Z",
         "months_processed": [],
         "total_processed": 0,
         "total_skipped": 0,
+        "total_copied": 0,
+        "total_unchanged": 0,
+        "total_removed": 0,
         "total_failed": [],
         "total_success": [],
         "errors": []
@@ -351,14 +662,25 @@ def sync_drive_to_gcs(mode: str = "replace", target_month: str = None) -> dict:
     storage_client = storage.Client()
     bucket = storage_client.bucket(LANDING_BUCKET)
 
+    old_manifest = _load_sync_manifest(bucket)
+    changes_state = _load_changes_state(bucket)
+    # incremental/changesモードのみ、マニフェストとGCSのgenerationで変更判定を行う
+    diff_manifest = None
+    raw_generations = {}
+    removed_ids = set()
+    next_month_folders = None  # changesモードで変更を反映した月フォルダの対応表
+
     # 処理対象の月フォルダを決定
     if mode == "replace":
         # 全月フォルダを取得
         month_folders = _list_all_month_folders(drive, DRIVE_FOLDER_ID)
 
-        # GCSの既存データを削除
-        print("[INFO] Deleting existing GCS data (replace mode)...")
-        _delete_gcs_folder(bucket, "google-drive/raw/")
+        # GCSの既存データを削除（ジョブ再開時は処理済みの月を残すため削除しない）
+        if completed_months:
+            print(f"[INFO] Resuming job; skipping deletion and completed months: {sorted(completed_months)}")
+        else:
+            print("[INFO] Deleting existing GCS data (replace mode)...")
+            results["total_removed"] = _delete_gcs_folder(bucket, GCS_RAW_PREFIX)
 
     elif mode == "append":
         if not target_month:
@@ -368,8 +690,9 @@ def sync_drive_to_gcs(mode: str = "replace", target_month: str = None) -> dict:
             })
             return results
 
-        # 指定月のフォルダのみ取得
-        month_id = _find_month_subfolder(drive, DRIVE_FOLDER_ID, target_month)
+        # 指定月のフォルダのみ取得（Changes API の状態に記録済みならフォルダ探索を省略）
+        cached_ids = [k for k, v in changes_state.get("month_folders", {}).items() if v == target_month]
+        month_id = cached_ids[0] if cached_ids else _find_month_subfolder(drive, DRIVE_FOLDER_ID, target_month)
         if not month_id:
             results["errors"].append({
                 "type": "FOLDER_NOT_FOUND",
@@ -380,29 +703,134 @@ def sync_drive_to_gcs(mode: str = "replace", target_month: str = None) -> dict:
         month_folders = [{"id": month_id, "name": target_month}]
 
         # 指定月のGCSデータのみ削除
-        print(f"[INFO] Deleting GCS data for {target_month} (append mode)...")
-        _delete_gcs_folder(bucket, f"google-drive/raw/{target_month}/")
+        if target_month not in completed_months:
+            print(f"[INFO] Deleting GCS data for {target_month} (append mode)...")
+            results["total_removed"] = _delete_gcs_folder(bucket, f"{GCS_RAW_PREFIX}{target_month}/")
+
+    elif mode == "incremental":
+        # 全月フォルダを取得し、マニフェストと比較して新規・変更分のみ転送
+        month_folders = _list_all_month_folders(drive, DRIVE_FOLDER_ID)
+        diff_manifest = old_manifest
+        raw_generations = _list_raw_generations(bucket)
+        print(f"[INFO] Incremental sync: {len(old_manifest)} files in manifest, "
+              f"{len(raw_generations)} raw objects in GCS")
+
+    elif mode == "changes":
+        diff_manifest = old_manifest
+        try:
+            if changes_state.get("page_token"):
+                # 前回同期以降の変更のみ取得（変更なしならAPI呼び出し1回で完了）
+                changes, new_token = _list_drive_changes(
+                    drive, changes_state["page_token"], changes_state.get("drive_id")
+                )
+                print(f"[INFO] Drive changes since last sync: {len(changes)}")
+                month_folders, removed_ids, next_month_folders = _resolve_drive_changes(
+                    drive, changes, changes_state, old_manifest
+                )
+                results["changes"] = len(changes)
+                if month_folders or removed_ids:
+                    raw_generations = _list_raw_generations(bucket)
+            else:
+                # 初回: 先に開始トークンを取得してから全体を走査し、走査中の変更を取りこぼさない
+                print("[INFO] No changes page token yet; running full incremental scan as baseline")
+                # 共有ドライブ配下なら driveId 単位、マイドライブならユーザー単位で変更を追跡
+                drive_id = _get_drive_id_of(drive, DRIVE_FOLDER_ID)
+                new_token = _get_start_page_token(drive, drive_id)
+                month_folders = _list_all_month_folders(drive, DRIVE_FOLDER_ID)
+                changes_state = {
+                    "drive_id": drive_id,
+                    "month_folders": {f["id"]: f["name"] for f in month_folders},
+                }
+                raw_generations = _list_raw_generations(bucket)
+        except HttpError as e:
+            results["errors"].append({"type": "DRIVE_CHANGES_ERROR", "message": str(e)})
+            print(f"[ERROR] Drive changes listing failed: {e}")
+            return results
 
     else:
         results["errors"].append({
             "type": "INVALID_MODE",
-            "message": f"無効なモード: {mode}（replace / append のみ有効）"
+            "message": f"無効なモード: {mode}（replace / append / incremental / changes のみ有効）"
         })
         return results
 
-    # 各月フォルダを処理
-    for month_folder in month_folders:
-        print(f"\n[INFO] Processing month folder: {month_folder.get('name')}")
-        month_result = _process_month_folder(drive, bucket, df_map, month_folder)
-
+    if progress:
+        progress.start([f.get("name") for f in month_folders])
+    results["resumed_months"] = sorted(completed_months)
+
+    # 各月フォルダを処理（全月のファイル転送を1つのワーカープールで並列実行）
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = []
+        for month_folder in month_folders:
+            if month_folder.get("name") in completed_months:
+                continue
+            print(f"\n[INFO] Processing month folder: {month_folder.get('name')}")
+            pending.append(_submit_month_folder(
+                drive, bucket, df_map, month_folder, executor,
+                manifest=diff_manifest, raw_generations=raw_generations
+            ))
+
+        month_results = []
+        for result, futures in pending:
+            month_result = _collect_month_folder(result, futures, old_manifest)
+            month_results.append(month_result)
+            if progress:
+                progress.done(month_result["yyyymm"], files=month_result["processed"],
+                              failed=len(month_result["failed"]))
+
+    # マニフェストを更新（appendモードは対象月以外の既存エントリを引き継ぐ）
+    new_manifest = {}
+    if mode == "append":
+        new_manifest = {k: v for k, v in old_manifest.items() if v.get("yyyymm") != target_month}
+    elif mode == "changes" and changes_state.get("page_token"):
+        # 変更のなかったファイルは前回のエントリをそのまま引き継ぐ
+        new_manifest = {k: v for k, v in old_manifest.items() if k not in removed_ids}
+
+    for month_result in month_results:
         results["months_processed"].append(month_result["yyyymm"])
         results["total_processed"] += month_result["processed"]
         results["total_skipped"] += month_result["skipped"]
+        results["total_unchanged"] += month_result["unchanged"]
         results["total_failed"].extend(month_result["failed"])
         results["total_success"].extend(month_result["success"])
+        new_manifest.update(month_result["manifest"])
+    results["total_copied"] = results["total_processed"]
+
+    # ジョブ再開時: 処理済みの月は今回転送していないため前回のエントリを引き継ぐ
+    # （引き継がないと孤立オブジェクトとして raw/ から削除され、マニフェストからも消える）
+    if completed_months:
+        for file_id, entry in old_manifest.items():
+            if entry.get("yyyymm") in completed_months and file_id not in removed_ids:
+                new_manifest.setdefault(file_id, entry)
+
+    if mode in ("incremental", "changes"):
+        results["total_removed"] = _remove_orphaned_raw_objects(bucket, old_manifest, new_manifest, raw_generations)
+
+    if new_manifest != old_manifest:
+        try:
+            _save_sync_manifest(bucket, new_manifest)
+        except Exception as e:
+            print(f"[WARN] Failed to save sync manifest: {e}")
 
-    # 0件アラートのチェック
-    if results["total_processed"] == 0 and not results["total_failed"]:
+    if mode == "changes":
+        # 失敗ファイルがある場合はトークンと月フォルダの対応表を進めず、次回同じ変更を再処理する
+        if results["total_failed"]:
+            print("[WARN] Some files failed; keeping previous changes page token for retry")
+        else:
+            changes_state["page_token"] = new_token
+            if next_month_folders is not None:
+                changes_state["month_folders"] = next_month_folders
+        try:
+            _save_changes_state(bucket, changes_state)
+        except Exception as e:
+            print(f"[WARN] Failed to save changes state: {e}")
+
+    # 0件アラートのチェック（changesモードで月フォルダに関わる変更がない場合は正常）
+    # ドライブ内の別の場所の編集など、変更フィードに項目があっても対象外なら変更なしとして扱う
+    # （初回のベースライン走査は対象外）
+    no_changes = mode == "changes" and "changes" in results and not month_folders and not removed_ids
+    if (results["total_processed"] == 0 and results["total_unchanged"] == 0
+            and not results["total_failed"] and not no_changes and not completed_months):
         results["errors"].append({
             "type": "EMPTY_DATA",
             "message": "取り込み件数が0件です"
@@ -413,6 +841,8 @@ def sync_drive_to_gcs(mode: str = "replace", target_month: str = None) -> dict:
     print("drive-to-gcs 同期完了")
     print(f"  処理月数: {len(results['months_processed'])}")
     print(f"  成功ファイル数: {results['total_processed']}")
+    print(f"  未変更ファイル数: {results['total_unchanged']}")
+    print(f"  削除ファイル数: {results['total_removed']}")
     print(f"  スキップ数: {results['total_skipped']}")
     print(f"  失敗ファイル数: {len(results['total_failed'])}")
     if results["total_failed"]:
@@ -424,57 +854,223 @@ def sync_drive_to_gcs(mode: str = "replace", target_month: str = None) -> dict:
     return results
 
 
+# ============== 非同期ジョブ ==============
+# Cloud Run のリクエストタイムアウトに縛られないよう、処理をバックグラウンドスレッドで実行し
+# 進捗を GCS 上の JSON に記録する。別インスタンスからも GET /jobs/<id> で参照できる。
+# ※ レスポンス返却後もCPUを割り当てるため、Cloud Run は --no-cpu-throttling でデプロイすること
+_job_lock = threading.Lock()
+_running_jobs = set()
+
+class JobProgress:
+    """ジョブの進捗（処理単位の総数・完了済み単位・カウンタ・経過時間）を記録する"""
+
+    def __init__(self, job: dict, bucket):
+        self.job = job
+        self.bucket = bucket
+        self.started = time.time()
+
+    def start(self, units: list):
+        with _job_lock:
+            self.job["progress"]["units_total"] = len(units)
+            self._save()
+
+    def done(self, unit: str, **counters):
+        with _job_lock:
+            p = self.job["progress"]
+            if unit not in p["completed_units"]:
+                p["completed_units"].append(unit)
+            p["units_done"] = len(p["completed_units"])
+            for key, value in counters.items():
+                p["counters"][key] = p["counters"].get(key, 0) + value
+            self._save()
+
+    def _save(self):
+        self.job["progress"]["elapsed_seconds"] = round(
+            self.job["progress"].get("elapsed_before_resume", 0) + time.time() - self.started, 1
+        )
+        _save_job(self.bucket, self.job)
+
+def _job_blob(bucket, job_id: str):
+    return bucket.blob(f"{JOBS_GCS_PREFIX}/{job_id}.json")
+
+def _save_job(bucket, job: dict, if_generation_match: int = None) -> None:
+    job["updated_at"] = dt.datetime.utcnow().isoformat() + "Z"
+    _job_blob(bucket, job["job_id"]).upload_from_string(
+        json.dumps(job, ensure_ascii=False, default=str), content_type="application/json",
+        if_generation_match=if_generation_match
+    )
+
+def _load_job(bucket, job_id: str) -> dict | None:
+    if not re.match(r"^[0-9a-f]{32}$", job_id or ""):
+        return None
+    blob = _job_blob(bucket, job_id)
+    if not blob.exists():
+        return None
+    return json.loads(blob.download_as_text())
+
+def _load_job_for_update(bucket, job_id: str) -> tuple | None:
+    """(ジョブ, GCS上の generation)。再開時に generation 一致を条件に書き込むために使う"""
+    if not re.match(r"^[0-9a-f]{32}$", job_id or ""):
+        return None
+    blob = bucket.get_blob(f"{JOBS_GCS_PREFIX}/{job_id}.json")
+    if not blob:
+        return None
+    return json.loads(blob.download_as_text()), blob.generation
+
+def _new_job(params: dict) -> dict:
+    return {
+        "job_id": uuid.uuid4().hex,
+        "status": "queued",
+        "params": params,
+        "created_at": dt.datetime.utcnow().isoformat() + "Z",
+        "progress": {
+            "units_total": None,
+            "units_done": 0,
+            "completed_units": [],
+            "counters": {},
+            "elapsed_seconds": 0,
+        },
+        "http_status": None,
+        "result": None,
+        "error": None,
+    }
+
+def _is_resumable(job: dict) -> bool:
+    """失敗したジョブ、または更新が途絶えた（インスタンス停止等）running ジョブのみ再開可能"""
+    if job["status"] == "failed":
+        return True
+    if job["status"] in ("queued", "running") and job["job_id"] not in _running_jobs:
+        updated = dt.datetime.fromisoformat(job["updated_at"].rstrip("Z"))
+        return (dt.datetime.utcnow() - updated).total_seconds() > JOB_STALE_SECONDS
+    return False
+
+def _run_sync_job(bucket, job: dict) -> None:
+    params = job["params"]
+    progress = JobProgress(job, bucket)
+    try:
+        job["status"] = "running"
+        _save_job(bucket, job)
+        results = sync_drive_to_gcs(
+            mode=params.get("mode"),
+            target_month=params.get("target_month"),
+            max_workers=params.get("max_workers"),
+            progress=progress,
+            completed_months=job["progress"]["completed_units"],
+        )
+        job["result"] = results
+        job["http_status"] = _sync_status_code(results)
+        job["status"] = "succeeded" if job["http_status"] < 500 else "failed"
+    except Exception as e:
+        traceback.print_exc()
+        job["status"] = "failed"
+        job["http_status"] = 500
+        job["error"] = str(e)
+    finally:
+        with _job_lock:
+            progress._save()
+            _running_jobs.discard(job["job_id"])
+
+def _start_job(bucket, job: dict, if_generation_match: int = None) -> bool:
+    """
+    ジョブをバックグラウンドスレッドで開始
+
+    if_generation_match 指定時（再開）は、読み込んだ時点から GCS 上のジョブが更新されていない場合のみ開始する。
+    複数インスタンスで同じジョブを同時に再開しても、引き継げるのは1つだけになる。
+
+    Returns:
+        開始した場合True（他のリクエストが先にジョブを更新していた場合False）
+    """
+    with _job_lock:
+        try:
+            _save_job(bucket, job, if_generation_match=if_generation_match)
+        except PreconditionFailed:
+            return False
+        _running_jobs.add(job["job_id"])
+    threading.Thread(target=_run_sync_job, args=(bucket, job), daemon=True).start()
+    return True
+
+
 # ============== Cloud Run HTTP 受け口 ==============
 app = Flask(__name__)
 
+def _sync_status_code(results: dict) -> int:
+    """同期結果からHTTPステータスコードを決定"""
+    if results.get("errors"):
+        # エラーの種類に応じてステータスコードを決定
+        error_types = [e.get("type") for e in results["errors"]]
+        if "DRIVE_SERVICE_ERROR" in error_types or "DRIVE_CHANGES_ERROR" in error_types:
+            return 500
+        elif "INVALID_PARAMETER" in error_types or "INVALID_MODE" in error_types:
+            return 400
+        elif "FOLDER_NOT_FOUND" in error_types:
+            return 404
+        elif "EMPTY_DATA" in error_types:
+            # 0件は警告扱い（207 Multi-Status）
+            return 207
+        else:
+            return 500
+
+    # 失敗ファイルがあれば207
+    if results.get("total_failed"):
+        return 207
+
+    return 200
+
 @app.route("/sync", methods=["POST"])
 def sync_endpoint():
     """
     同期エンドポイント（Cloud Workflows から呼び出し）
 
     パラメータ（クエリパラメータまたはJSONボディ）:
-        mode: "replace"(デフォルト) / "append"
+        mode: "replace"(デフォルト) / "append" / "incremental" / "changes"
         target_month: appendモード時の対象月（YYYYMM形式）
+        max_workers: ファイル転送の並列数（省略時は環境変数 SYNC_MAX_WORKERS）
+        async: "true" の場合はジョブを登録して即座に 202 と job_id を返す
+               （進捗は GET /jobs/<job_id> で確認）
 
     例:
         POST /sync?mode=replace
         POST /sync?mode=append&target_month=202511
+        POST /sync?mode=incremental
+        POST /sync?mode=changes
+        POST /sync?mode=replace&async=true
         POST /sync -d '{"mode": "append", "target_month": "202511"}'
     """
     try:
         # パラメータ取得（クエリパラメータ優先、なければJSONボディ）
         mode = request.args.get("mode")
         target_month = request.args.get("target_month")
+        max_workers = request.args.get("max_workers")
+        run_async = request.args.get("async")
 
         if not mode:
             body = request.get_json(force=True, silent=True) or {}
             mode = body.get("mode", DEFAULT_MODE)
             target_month = target_month or body.get("target_month")
+            max_workers = max_workers or body.get("max_workers")
+            run_async = run_async or body.get("async")
+
+        max_workers = int(max_workers) if max_workers else None
+
+        if str(run_async).lower() == "true":
+            bucket = storage.Client().bucket(LANDING_BUCKET)
+            job = _new_job({"mode": mode, "target_month": target_month or None, "max_workers": max_workers})
+            accepted = {
+                "job_id": job["job_id"],
+                "status": job["status"],
+                "status_url": f"/jobs/{job['job_id']}"
+            }
+            _start_job(bucket, job)
+            return jsonify(accepted), 202
 
         # 同期実行
-        results = sync_drive_to_gcs(mode=mode, target_month=target_month)
-
-        # エラーがあれば適切なステータスコードを返す
-        if results.get("errors"):
-            # エラーの種類に応じてステータスコードを決定
-            error_types = [e.get("type") for e in results["errors"]]
-            if "DRIVE_SERVICE_ERROR" in error_types:
-                return jsonify(results), 500
-            elif "INVALID_PARAMETER" in error_types or "INVALID_MODE" in error_types:
-                return jsonify(results), 400
-            elif "FOLDER_NOT_FOUND" in error_types:
-                return jsonify(results), 404
-            elif "EMPTY_DATA" in error_types:
-                # 0件は警告扱い（207 Multi-Status）
-                return jsonify(results), 207
-            else:
-                return jsonify(results), 500
-
-        # 失敗ファイルがあれば207
-        if results.get("total_failed"):
-            return jsonify(results), 207
+        results = sync_drive_to_gcs(
+            mode=mode,
+            target_month=target_month,
+            max_workers=max_workers
+        )
 
-        return jsonify(results), 200
+        return jsonify(results), _sync_status_code(results)
 
     except Exception as e:
         traceback.print_exc()
@@ -484,6 +1080,41 @@ def sync_endpoint():
         }), 500
 
 
+@app.route("/jobs/<job_id>", methods=["GET"])
+def get_job(job_id):
+    """非同期ジョブの状態・進捗を返す（完了時は result に /sync と同じ結果を含む）"""
+    job = _load_job(storage.Client().bucket(LANDING_BUCKET), job_id)
+    if not job:
+        return jsonify({"error": f"job not found: {job_id}"}), 404
+    return jsonify(job), 200
+
+
+@app.route("/jobs/<job_id>/resume", methods=["POST"])
+def resume_job(job_id):
+    """失敗・中断したジョブを、完了済みの月フォルダを飛ばして再開する"""
+    bucket = storage.Client().bucket(LANDING_BUCKET)
+    loaded = _load_job_for_update(bucket, job_id)
+    if not loaded:
+        return jsonify({"error": f"job not found: {job_id}"}), 404
+    job, generation = loaded
+    if not _is_resumable(job):
+        return jsonify({"error": f"job is not resumable (status={job['status']})", "job": job}), 409
+
+    job["progress"]["elapsed_before_resume"] = job["progress"].get("elapsed_seconds", 0)
+    job["resumed_at"] = dt.datetime.utcnow().isoformat() + "Z"
+    job["status"] = "queued"
+    job["error"] = None
+    accepted = {
+        "job_id": job_id,
+        "status": job["status"],
+        "completed_units": len(job["progress"]["completed_units"]),
+        "status_url": f"/jobs/{job_id}"
+    }
+    if not _start_job(bucket, job, if_generation_match=generation):
+        return jsonify({"error": f"job was updated by another request; not resumed: {job_id}"}), 409
+    return jsonify(accepted), 202
+
+
 # --- かんたん診断ルート（追加分） ---
 @app.route("/debug/folder", methods=["GET"])
 def debug_folder():
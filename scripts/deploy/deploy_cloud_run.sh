@@ -51,8 +51,10 @@ gcloud run deploy "${SERVICE_NAME}" \
   --set-env-vars "MAPPING_GCS_PATH=google-drive/config/mapping_files.csv" \
   --set-env-vars "SERVICE_JSON_GCS_PATH=gs://data-platform-landing-prod/config/sa-data-platform-key.json" \
   --set-env-vars "IMPERSONATE_USER=fiby2@tanacho.com" \
+  --set-env-vars "SYNC_MAX_WORKERS=8" \
   --memory=1Gi \
   --timeout=900 \
+  --no-cpu-throttling \
   --allow-unauthenticated
 
 echo ""
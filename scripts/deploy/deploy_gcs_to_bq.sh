@@ -48,8 +48,10 @@ gcloud run deploy "${SERVICE_NAME}" \
   --service-account="${SERVICE_ACCOUNT}" \
   --set-env-vars "LANDING_BUCKET=data-platform-landing-prod" \
   --set-env-vars "VALIDATION_ENABLED=true" \
+  --set-env-vars "LOAD_CONCURRENCY=4" \
   --memory=2Gi \
   --timeout=900 \
+  --no-cpu-throttling \
   --allow-unauthenticated
 
 echo ""
@@ -31,16 +31,76 @@ fi
 
 echo ""
 echo "[Step 1] Deploying Cloud Run service..."
+# TRANSFORM_WORKERS はインスタンスあたりの変換ワーカープロセス数（同じインスタンスで並行する
+# 非同期ジョブ・シャード・GCS 完了通知の変換で共有）。2 × 768MB に本体を加えて --memory=2Gi に収める
 gcloud run deploy "${SERVICE_NAME}" \
   --project="${PROJECT_ID}" \
   --region="${REGION}" \
   --source="${SOURCE_DIR}" \
   --service-account="${SERVICE_ACCOUNT}" \
   --set-env-vars "LANDING_BUCKET=data-platform-landing-prod" \
+  --set-env-vars "TRANSFORM_WORKERS=2" \
+  --set-env-vars "TRANSFORM_WORKER_MEMORY_MB=768" \
+  --set-env-vars "STREAMING_TABLES=ledger_income,ledger_loss" \
+  --cpu=2 \
   --memory=2Gi \
   --timeout=1800 \
+  --no-cpu-throttling \
   --allow-unauthenticated
 
+# GCS 完了通知（google-drive/raw/YYYYMM/*.xlsx の finalize）で届いたブックのみ変換するトリガー
+# CREATE_GCS_TRIGGER=true ./deploy_raw_to_proceed.sh で作成
+# バケットの Pub/Sub 通知を google-drive/raw/ の OBJECT_FINALIZE に絞り、そのトピックを Eventarc でサービスに配信する
+# （バケット単位の Cloud Storage トリガーでは proceed/・manifests/・jobs/ 等の書き込みごとにサービスが呼ばれるため使わない）
+LANDING_BUCKET="data-platform-landing-prod"
+RAW_PREFIX="google-drive/raw/"
+TOPIC_NAME="raw-to-proceed-raw-finalize"
+TRIGGER_NAME="raw-to-proceed-raw-finalize"
+LEGACY_TRIGGER_NAME="raw-to-proceed-gcs-finalize"
+if [ "${CREATE_GCS_TRIGGER:-false}" = "true" ]; then
+  echo ""
+  echo "[Step 2] Creating GCS notification (${RAW_PREFIX}) and Eventarc trigger..."
+  if ! gcloud pubsub topics describe "${TOPIC_NAME}" --project="${PROJECT_ID}" >/dev/null 2>&1; then
+    gcloud pubsub topics create "${TOPIC_NAME}" --project="${PROJECT_ID}"
+  fi
+
+  # GCS のサービスエージェントにトピックへの発行権限を付与
+  GCS_SERVICE_AGENT="$(gcloud storage service-agent --project="${PROJECT_ID}")"
+  gcloud pubsub topics add-iam-policy-binding "${TOPIC_NAME}" \
+    --project="${PROJECT_ID}" \
+    --member="serviceAccount:${GCS_SERVICE_AGENT}" \
+    --role="roles/pubsub.publisher" >/dev/null
+
+  if gcloud storage buckets notifications list "gs://${LANDING_BUCKET}" --format="value(topic)" | grep -q "/topics/${TOPIC_NAME}$"; then
+    echo "Notification already exists: gs://${LANDING_BUCKET} -> ${TOPIC_NAME}"
+  else
+    gcloud storage buckets notifications create "gs://${LANDING_BUCKET}" \
+      --topic="projects/${PROJECT_ID}/topics/${TOPIC_NAME}" \
+      --event-types=OBJECT_FINALIZE \
+      --object-prefix="${RAW_PREFIX}" \
+      --payload-format=json
+  fi
+
+  if gcloud eventarc triggers describe "${TRIGGER_NAME}" --project="${PROJECT_ID}" --location="${REGION}" >/dev/null 2>&1; then
+    echo "Trigger already exists: ${TRIGGER_NAME}"
+  else
+    gcloud eventarc triggers create "${TRIGGER_NAME}" \
+      --project="${PROJECT_ID}" \
+      --location="${REGION}" \
+      --destination-run-service="${SERVICE_NAME}" \
+      --destination-run-region="${REGION}" \
+      --destination-run-path="/events/gcs-finalize" \
+      --event-filters="type=google.cloud.pubsub.topic.v1.messagePublished" \
+      --transport-topic="projects/${PROJECT_ID}/topics/${TOPIC_NAME}" \
+      --service-account="${SERVICE_ACCOUNT}"
+  fi
+
+  # 以前のバケット単位のトリガーが残っていれば削除
+  if gcloud eventarc triggers describe "${LEGACY_TRIGGER_NAME}" --project="${PROJECT_ID}" --location="${REGION}" >/dev/null 2>&1; then
+    gcloud eventarc triggers delete "${LEGACY_TRIGGER_NAME}" --project="${PROJECT_ID}" --location="${REGION}" --quiet
+  fi
+fi
+
 echo ""
 echo "============================================================"
 echo "Deploy completed"